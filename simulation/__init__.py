@@ -1,12 +1,45 @@
-"""Public package surface for Echoes of the Sankofa MVP sim."""
-
-from .models import Hero, RealmState, Sanctum
-from .sim import SimConfig, run_economy_sim
-
-__all__ = [
-    "Hero",
-    "RealmState",
-    "Sanctum",
-    "SimConfig",
-    "run_economy_sim",
-]
+"""Public package surface for Echoes of the Sankofa MVP sim.
+
+Names resolve lazily on first access, so ``import simulation.sim`` (the scalar loop a
+CLI launch actually needs) does not also import the batch engine, rosters, realms or
+the long-horizon mode.
+"""
+
+from importlib import import_module
+from typing import Any, List
+
+_EXPORTS = {
+    "Hero": ".models",
+    "HeroRoster": ".roster",
+    "RealmArrays": ".realms",
+    "RealmRules": ".realms",
+    "RealmState": ".models",
+    "Sanctum": ".models",
+    "SimConfig": ".sim",
+    "SimState": ".sim",
+    "initial_state": ".sim",
+    "iter_days": ".sim",
+    "iter_economy_sim": ".sim",
+    "resume": ".sim",
+    "run_economy_sim": ".sim",
+    "run_economy_sim_batch": ".batch",
+    "run_long_horizon": ".horizon",
+    "run_realms_sim": ".realms",
+    "run_roster_sim": ".roster",
+    "step_days": ".sim",
+}
+
+__all__ = sorted(_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,304 @@
+"""Batch entry point for sweeping the MVP loop across many campaign configs.
+
+The batch engine replays :func:`simulation.sim.run_economy_sim` so every day log stays
+bit-identical, but hoists everything that is invariant per campaign (tier upkeep,
+ritual schedules) out of the day loop and keeps the day's state in locals instead of a
+:class:`SimState`. Each campaign's PCG32 draws come from one bulk fill. The rules
+themselves are the per-day helpers the scalar loop calls, so only the state and log
+plumbing lives here.
+"""
+
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Sequence
+
+from .curves import ekwan_upkeep_table, morale_decay_step
+from .daylog import LOG_FIELDS, RunningSummary
+from .prng import PCG32
+from .sim import (
+    SimConfig,
+    _economy_tick,
+    _faith_guardrail,
+    _fear_gain_multiplier,
+    _log_row,
+    _retirement_rite,
+    _sanctum_drift,
+    config_payload,
+    run_economy_sim,
+)
+
+if TYPE_CHECKING:
+    from concurrent.futures import ProcessPoolExecutor
+
+    from .memo import SimCache
+
+BATCH_LOG_MODES = ("dicts", "summary")
+
+
+def _day_mask(days: int, schedule: Iterable[int]) -> bytearray:
+    mask = bytearray(days + 2)
+    for day in schedule:
+        if 0 < day <= days:
+            mask[day] = 1
+    return mask
+
+
+def _run_campaign(cfg: SimConfig, summary_only: bool = False) -> Dict[str, Any]:
+    """Single-campaign kernel mirroring ``run_economy_sim`` operation for operation."""
+
+    days = cfg.days
+    # One encounter-flux draw per day, pulled up front in a single bulk fill.
+    draws = PCG32(cfg.campaign_seed).fill_random(days)
+
+    faith = max(0.0, min(100.0, cfg.faith_initial))
+    harmony = max(10.0, min(100.0, cfg.harmony_initial))
+    favor = max(0.0, min(100.0, cfg.favor_initial))
+    ase = 200.0
+    ekwan = 100.0
+
+    morale = 80.0
+    fear = 25.0
+    legacy_fragments = 0
+    voluntary_retirements = 0
+
+    courage_mask = _day_mask(days, cfg.courage_ritual_days or cfg.courage_auto_days)
+    ward_schedule: tuple[int, ...] = tuple(cfg.ward_beads_days)
+    if not ward_schedule and cfg.ward_beads_charges > 0:
+        ward_schedule = tuple(cfg.ward_beads_auto_days)
+    ward_mask = _day_mask(days, ward_schedule)
+
+    ekwan_spend = ekwan_upkeep_table(cfg.base_ekwan_cost, cfg.realm_tier)[max(0, cfg.realm_tier)]
+
+    base_ase_tick = cfg.base_ase_tick
+    encounters_per_day = cfg.encounters_per_day
+    fear_per_encounter = cfg.fear_per_encounter
+    guardian_present = cfg.guardian_present
+    skip_courage = cfg.skip_courage_when_comfortable
+    spike_guard_enabled = cfg.spike_guard_enabled
+    spike_guard_threshold = cfg.spike_guard_threshold
+
+    ward_charges = max(0, cfg.ward_beads_charges)
+    courage_resistance = 0
+    spike_guard_streak = 0
+    guardrail_streak = 0
+
+    log: List[Dict[str, Any]] = []
+    append = log.append
+    # Summary-only aggregates live in locals; counts follow daylog.FLAG_FIELDS order.
+    ase_yield_first = ase_yield = 0.0
+    morale_min = float("inf")
+    fear_max = float("-inf")
+    counts = [0] * 6
+
+    for day in range(1, days + 1):
+        fear = max(0.0, min(100.0, fear - 5.0))
+        morale = max(0.0, min(100.0, morale + 5.0))
+
+        encounter_flux = 0.9 + 0.2 * draws[day - 1]
+        encounters_today = max(1, int(round(encounters_per_day * encounter_flux)))
+
+        planned_courage = courage_mask[day] == 1
+        courage_skipped = False
+        if planned_courage and skip_courage and fear < 60.0 and morale > 70.0:
+            courage_skipped = True
+            planned_courage = False
+
+        ward_today = False
+        if ward_mask[day] and ward_charges > 0:
+            ward_today = True
+            ward_charges -= 1
+
+        forecast_fear = max(0.0, min(100.0, fear + encounters_today * fear_per_encounter))
+        spike_today = False
+        if spike_guard_enabled and forecast_fear >= spike_guard_threshold:
+            spike_today = True
+            fear = max(0.0, min(100.0, fear - 18.0))
+            morale = max(0.0, min(100.0, morale + 12.0))
+            spike_guard_streak += 1
+
+        harmony_eff, ase_yield, ekwan, ase = _economy_tick(base_ase_tick, faith, harmony, ekwan, ase, ekwan_spend)
+
+        if planned_courage:
+            fear = max(0.0, min(100.0, fear - 20.0))
+            morale = max(0.0, min(100.0, morale + 25.0))
+            courage_resistance = max(courage_resistance, 8)
+
+        guardian_today = guardian_present or favor >= 65.0
+        multiplier = _fear_gain_multiplier(guardian_today, courage_resistance > 0, ward_today, spike_today)
+        fear = max(0.0, min(100.0, fear + encounters_today * fear_per_encounter * multiplier))
+        morale = max(0.0, min(100.0, morale_decay_step(morale, fear, guardian_today)))
+
+        if courage_resistance > 0:
+            fear = max(0.0, min(100.0, fear - 5.0))
+
+        if morale <= 0.0:
+            legacy_fragments += 1
+            morale = 45.0
+            fear = max(0.0, min(100.0, fear * 0.6))
+
+        prior_faith = faith
+        faith, harmony, favor = _sanctum_drift(faith, harmony, favor, fear, encounters_today)
+        faith_recovered = faith - prior_faith
+
+        faith, ase, guardrail_streak, reflection_today = _faith_guardrail(cfg, faith, ase, guardrail_streak)
+
+        favor, spike_guard_streak, retirement_today = _retirement_rite(cfg, spike_today, spike_guard_streak, favor)
+        if retirement_today:
+            legacy_fragments += 1
+            voluntary_retirements += 1
+
+        if summary_only:
+            if day == 1:
+                ase_yield_first = ase_yield
+            if morale < morale_min:
+                morale_min = morale
+            if fear > fear_max:
+                fear_max = fear
+            if planned_courage:
+                counts[0] += 1
+            if ward_today:
+                counts[1] += 1
+            if courage_skipped:
+                counts[2] += 1
+            if spike_today:
+                counts[3] += 1
+            if reflection_today:
+                counts[4] += 1
+            if retirement_today:
+                counts[5] += 1
+        else:
+            append(
+                dict(
+                    zip(
+                        LOG_FIELDS,
+                        _log_row(
+                            day,
+                            ase,
+                            faith,
+                            harmony,
+                            favor,
+                            morale,
+                            fear,
+                            ase_yield,
+                            ekwan_spend,
+                            harmony_eff,
+                            faith_recovered,
+                            legacy_fragments,
+                            planned_courage,
+                            ward_today,
+                            courage_skipped,
+                            spike_today,
+                            reflection_today,
+                            retirement_today,
+                        ),
+                    )
+                )
+            )
+
+        if courage_resistance > 0:
+            courage_resistance -= 1
+
+    result: Dict[str, Any] = {
+        "config": config_payload(cfg),
+        "final": {
+            "ase": round(ase, 2),
+            "faith": round(faith, 2),
+            "harmony": round(harmony, 2),
+            "favor": round(favor, 2),
+            "morale": round(morale, 2),
+            "fear": round(fear, 2),
+            "legacy_fragments": legacy_fragments,
+            "voluntary_retirements": voluntary_retirements,
+        },
+    }
+    if summary_only:
+        summary = RunningSummary()
+        summary.days = max(0, days)
+        summary.ase_yield_first = ase_yield_first
+        summary.ase_yield_last = ase_yield
+        summary.morale_min = morale_min
+        summary.fear_max = fear_max
+        summary.counts = counts
+        result["summary"] = summary.as_dict()
+    else:
+        result["log"] = log
+    return result
+
+
+def run_economy_sim_batch(
+    configs: Iterable[SimConfig], log_mode: str = "dicts", stop_when: Sequence[Any] = ()
+) -> List[Dict[str, Any]]:
+    """Run many campaigns and return one ``run_economy_sim`` payload per config, in order.
+
+    ``log_mode`` accepts ``"dicts"`` or ``"summary"`` with the same meaning as in
+    :func:`simulation.sim.run_economy_sim`. Runs with ``stop_when`` conditions go
+    through the scalar loop, which owns the early-termination checks.
+    """
+
+    if log_mode not in BATCH_LOG_MODES:
+        raise ValueError(f"log_mode must be one of {BATCH_LOG_MODES}, received '{log_mode}'")
+    if stop_when:
+        return [run_economy_sim(cfg, log_mode=log_mode, stop_when=stop_when) for cfg in configs]
+    summary_only = log_mode == "summary"
+    return [_run_campaign(cfg, summary_only) for cfg in configs]
+
+
+def _summary_chunk(configs: Sequence[SimConfig]) -> List[Dict[str, Any]]:
+    return run_economy_sim_batch(configs, log_mode="summary")
+
+
+class BatchRunner:
+    """Summary-mode batch runs for analysis loops that submit configs round by round.
+
+    Each :meth:`run` call splits its configs into ``chunk_size`` chunks. The chunks run
+    in-process with ``workers=1``; otherwise they go to one process pool that lives as
+    long as the ``with`` block. Results are read through and written to ``cache``
+    (a :class:`~simulation.memo.SimCache`) when one is given. ``runs`` counts the
+    simulations actually executed.
+    """
+
+    def __init__(self, workers: int = 1, chunk_size: int = 64, cache: Optional["SimCache"] = None) -> None:
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be positive")
+        self.workers = workers
+        self.chunk_size = chunk_size
+        self.cache = cache
+        self.runs = 0
+        self._pool: Optional["ProcessPoolExecutor"] = None
+
+    def __enter__(self) -> "BatchRunner":
+        if self.workers > 1:
+            # Imported here: concurrent.futures costs ~20 ms, which CLI launches shouldn't pay.
+            from concurrent.futures import ProcessPoolExecutor
+
+            self._pool = ProcessPoolExecutor(max_workers=self.workers)
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def run(self, configs: Sequence[SimConfig]) -> List[Dict[str, Any]]:
+        """One summary payload per config, in order."""
+
+        results: List[Optional[Dict[str, Any]]] = [None] * len(configs)
+        missing: List[int] = []
+        for index, cfg in enumerate(configs):
+            cached = self.cache.get(cfg, "summary") if self.cache is not None else None
+            if cached is None:
+                missing.append(index)
+            else:
+                results[index] = cached
+
+        chunks = [missing[offset : offset + self.chunk_size] for offset in range(0, len(missing), self.chunk_size)]
+        batches = [[configs[index] for index in chunk] for chunk in chunks]
+        if self._pool is None or len(batches) == 1:
+            outputs = map(_summary_chunk, batches)
+        else:
+            outputs = self._pool.map(_summary_chunk, batches)
+        for chunk, output in zip(chunks, outputs):
+            for index, result in zip(chunk, output):
+                if self.cache is not None:
+                    self.cache.put(configs[index], "summary", result)
+                results[index] = result
+        self.runs += len(missing)
+        return results  # type: ignore[return-value]
@@ -0,0 +1,359 @@
+"""Micro and macro benchmarks for the sim engine, PRNG, curves, result I/O and KPIs.
+
+Each benchmark is a ``setup(workdir)`` that returns a zero-argument callable; the
+runner times that callable with ``timeit`` (auto-scaling the loop count to a minimum
+measurement time) and reports the best and median seconds per call plus nanoseconds
+per logical operation. Results are plain JSON so they can be stored as a baseline and
+compared by :func:`compare` with a relative regression threshold.
+
+Benchmarks marked ``slow`` (multi-thousand-day campaigns, 10k-seed batches, 500-hero
+rosters, large aggregations) are skipped unless explicitly requested.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import platform
+import statistics
+import tempfile
+import timeit
+from dataclasses import dataclass
+from fnmatch import fnmatch
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from . import curves
+from .batch import run_economy_sim_batch
+from .horizon import run_long_horizon
+from .prng import PCG32
+from .realms import RealmArrays, run_realms_sim
+from .resultstore import open_results, write_results
+from .roster import HeroRoster, run_roster_sim
+from .sim import SimConfig, run_economy_sim
+from .sweep import expand_grid, run_sweep
+
+BENCH_FORMAT_VERSION = 1
+DEFAULT_THRESHOLD = 0.10
+
+
+@dataclass(frozen=True)
+class Benchmark:
+    name: str
+    setup: Callable[[Path], Callable[[], Any]]
+    ops: int = 1
+    slow: bool = False
+
+
+BENCHMARKS: Dict[str, Benchmark] = {}
+
+
+def _bench(name: str, ops: int = 1, slow: bool = False):
+    def register(setup: Callable[[Path], Callable[[], Any]]):
+        if name in BENCHMARKS:
+            raise ValueError(f"benchmark {name!r} is registered twice")
+        BENCHMARKS[name] = Benchmark(name, setup, ops, slow)
+        return setup
+
+    return register
+
+
+# -- PRNG ------------------------------------------------------------------------
+
+_PRNG_CALLS = 10_000
+
+
+@_bench("prng.next_u32", ops=_PRNG_CALLS)
+def _prng_next_u32(workdir: Path):
+    def run():
+        rng = PCG32(0xA2B94D10)
+        for _ in range(_PRNG_CALLS):
+            rng.next_u32()
+
+    return run
+
+
+@_bench("prng.random", ops=_PRNG_CALLS)
+def _prng_random(workdir: Path):
+    def run():
+        rng = PCG32(0xA2B94D10)
+        for _ in range(_PRNG_CALLS):
+            rng.random()
+
+    return run
+
+
+@_bench("prng.fill_random", ops=_PRNG_CALLS)
+def _prng_fill_random(workdir: Path):
+    return lambda: PCG32(0xA2B94D10).fill_random(_PRNG_CALLS)
+
+
+# -- Curves ----------------------------------------------------------------------
+
+_CURVE_INPUTS = [index * 0.1 for index in range(1000)]
+
+
+def _curve_bench(name: str, call: Callable[[float], Any]) -> None:
+    def setup(workdir: Path):
+        def run():
+            for value in _CURVE_INPUTS:
+                call(value)
+
+        return run
+
+    _bench(f"curves.{name}", ops=len(_CURVE_INPUTS))(setup)
+
+
+_curve_bench("ase_yield_per_tick", lambda value: curves.ase_yield_per_tick(50.0, value))
+_curve_bench("ekwan_cost_for_tier", lambda value: curves.ekwan_cost_for_tier(10.0, int(value) % 8))
+_curve_bench("morale_decay_step", lambda value: curves.morale_decay_step(80.0, value))
+_curve_bench("faith_recovery_step", lambda value: curves.faith_recovery_step(value, 55.0))
+_curve_bench("harmony_efficiency", curves.harmony_efficiency)
+_DECAY_TABLE = curves.MoraleDecayTable()
+_curve_bench("morale_decay_table", lambda value: _DECAY_TABLE.step(80.0, value))
+
+
+# -- Engines ---------------------------------------------------------------------
+
+
+def _sim_bench(days: int, log_mode: str = "dicts", slow: bool = False) -> None:
+    suffix = "" if log_mode == "dicts" else f".{log_mode}"
+
+    def setup(workdir: Path):
+        cfg = SimConfig(days=days, realm_tier=2, encounters_per_day=3, fear_per_encounter=6.0)
+        return lambda: run_economy_sim(cfg, log_mode=log_mode)
+
+    _bench(f"sim.run_economy_sim.{days}d{suffix}", ops=days, slow=slow)(setup)
+
+
+_sim_bench(20)
+_sim_bench(365)
+_sim_bench(365, "summary")
+_sim_bench(3650, slow=True)
+
+
+def _batch_bench(seeds: int, slow: bool = False) -> None:
+    def setup(workdir: Path):
+        configs = expand_grid({"days": 20}, None, range(seeds))
+        return lambda: run_economy_sim_batch(configs, log_mode="summary")
+
+    _bench(f"batch.summary.{seeds}x20d", ops=seeds, slow=slow)(setup)
+
+
+_batch_bench(1_000)
+_batch_bench(10_000, slow=True)
+
+
+def _roster_bench(heroes: int, slow: bool = False) -> None:
+    def setup(workdir: Path):
+        cfg = SimConfig(days=365, realm_tier=2, encounters_per_day=3, fear_per_encounter=6.0)
+        roster = HeroRoster.recruit(heroes, cfg.campaign_seed)
+        return lambda: run_roster_sim(cfg, roster, log_mode="summary")
+
+    _bench(f"roster.summary.{heroes}x365d", ops=heroes * 365, slow=slow)(setup)
+
+
+_roster_bench(50)
+_roster_bench(500, slow=True)
+
+
+def _realms_bench(realms: int) -> None:
+    def setup(workdir: Path):
+        cfg = SimConfig(days=365, encounters_per_day=3, fear_per_encounter=6.0)
+        return lambda: run_realms_sim(cfg, RealmArrays.uniform(realms), log_mode="summary")
+
+    _bench(f"realms.summary.{realms}x365d", ops=realms * 365)(setup)
+
+
+_realms_bench(1)
+_realms_bench(10)
+
+
+def _horizon_bench(days: int, slow: bool = False) -> None:
+    def setup(workdir: Path):
+        cfg = SimConfig(days=days, realm_tier=2, encounters_per_day=3, fear_per_encounter=6.0)
+        return lambda: run_long_horizon(cfg, checkpoint_every=3650)
+
+    _bench(f"horizon.events.{days}d", ops=days, slow=slow)(setup)
+
+
+_horizon_bench(3650)
+_horizon_bench(36500, slow=True)
+
+
+# -- Result I/O ------------------------------------------------------------------
+
+_IO_RUNS = 200
+
+
+def _io_payloads() -> List[Dict[str, Any]]:
+    return run_economy_sim_batch(expand_grid({"days": 20}, None, range(_IO_RUNS)))
+
+
+@_bench("io.jsonl.write", ops=_IO_RUNS)
+def _io_jsonl_write(workdir: Path):
+    payloads = _io_payloads()
+    path = workdir / "io.jsonl"
+
+    def run():
+        with path.open("w") as handle:
+            for payload in payloads:
+                handle.write(json.dumps(payload, separators=(",", ":")))
+                handle.write("\n")
+
+    return run
+
+
+@_bench("io.jsonl.read", ops=_IO_RUNS)
+def _io_jsonl_read(workdir: Path):
+    path = workdir / "io-read.jsonl"
+    path.write_text("".join(json.dumps(p, separators=(",", ":")) + "\n" for p in _io_payloads()))
+
+    def run():
+        with path.open() as handle:
+            for line in handle:
+                json.loads(line)
+
+    return run
+
+
+@_bench("io.simres.write", ops=_IO_RUNS)
+def _io_simres_write(workdir: Path):
+    payloads = _io_payloads()
+    return lambda: write_results(workdir / "io.simres", payloads)
+
+
+@_bench("io.simres.read_column", ops=_IO_RUNS)
+def _io_simres_read_column(workdir: Path):
+    path = workdir / "io-read.simres"
+    write_results(path, _io_payloads())
+
+    def run():
+        with open_results(path) as store:
+            column = store.day_column("morale")
+            min(column)
+            column.release()
+
+    return run
+
+
+@_bench("io.simres.read_payloads", ops=_IO_RUNS)
+def _io_simres_read_payloads(workdir: Path):
+    path = workdir / "io-payloads.simres"
+    write_results(path, _io_payloads())
+
+    def run():
+        with open_results(path) as store:
+            for _ in store:
+                pass
+
+    return run
+
+
+# -- KPI aggregation -------------------------------------------------------------
+
+
+def _aggregate_bench(runs: int, slow: bool = False) -> None:
+    def setup(workdir: Path):
+        from .scripts.aggregate_kpis import aggregate_stream
+
+        sweep_dir = workdir / f"agg-{runs}"
+        run_sweep(expand_grid({"days": 20}, None, range(runs)), sweep_dir, workers=1, chunk_size=500)
+        return lambda: aggregate_stream([str(sweep_dir)], workdir / f"agg-{runs}-out")
+
+    _bench(f"aggregate_kpis.stream.{runs}", ops=runs, slow=slow)(setup)
+
+
+_aggregate_bench(1_000)
+_aggregate_bench(20_000, slow=True)
+
+
+# -- Runner ----------------------------------------------------------------------
+
+
+def select(patterns: Optional[Iterable[str]] = None, include_slow: bool = False) -> List[Benchmark]:
+    """Benchmarks whose names match any glob in ``patterns`` (all when ``None``).
+
+    Slow benchmarks are included when ``include_slow`` is set or a pattern names them
+    exactly.
+    """
+
+    patterns = list(patterns or [])
+    chosen = []
+    for bench in BENCHMARKS.values():
+        if patterns and not any(fnmatch(bench.name, pattern) for pattern in patterns):
+            continue
+        if bench.slow and not include_slow and bench.name not in patterns:
+            continue
+        chosen.append(bench)
+    return chosen
+
+
+def _measure(bench: Benchmark, workdir: Path, repeat: int, min_time: float) -> Dict[str, Any]:
+    timer = timeit.Timer(bench.setup(workdir))
+    elapsed = timer.timeit(1)  # doubles as a warm-up call
+    number = max(1, math.ceil(min_time / max(elapsed, 1e-9))) if elapsed < min_time else 1
+    samples = [total / number for total in timer.repeat(repeat=repeat, number=number)]
+    best = min(samples)
+    return {
+        "ops": bench.ops,
+        "number": number,
+        "repeat": repeat,
+        "best_s": best,
+        "median_s": statistics.median(samples),
+        "per_op_ns": best / bench.ops * 1e9,
+    }
+
+
+def run_benchmarks(
+    benchmarks: Iterable[Benchmark],
+    repeat: int = 5,
+    min_time: float = 0.2,
+    progress: Optional[Callable[[str, Dict[str, Any]], None]] = None,
+) -> Dict[str, Any]:
+    """Time ``benchmarks`` and return a JSON-ready report keyed by benchmark name."""
+
+    if repeat <= 0:
+        raise ValueError("repeat must be positive")
+    results: Dict[str, Dict[str, Any]] = {}
+    with tempfile.TemporaryDirectory(prefix="sim-bench-") as tmp:
+        for bench in benchmarks:
+            workdir = Path(tmp) / bench.name
+            workdir.mkdir()
+            results[bench.name] = _measure(bench, workdir, repeat, min_time)
+            if progress is not None:
+                progress(bench.name, results[bench.name])
+    return {
+        "version": BENCH_FORMAT_VERSION,
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "machine": platform.machine(),
+        "results": results,
+    }
+
+
+def compare(
+    current: Dict[str, Any], baseline: Dict[str, Any], threshold: float = DEFAULT_THRESHOLD
+) -> List[Dict[str, Any]]:
+    """Compare best times per benchmark present in both reports.
+
+    ``ratio`` is current/baseline; a benchmark regresses when it is more than
+    ``threshold`` slower (``ratio > 1 + threshold``).
+    """
+
+    rows = []
+    for name, result in current["results"].items():
+        reference = baseline.get("results", {}).get(name)
+        if reference is None:
+            continue
+        ratio = result["best_s"] / reference["best_s"]
+        rows.append(
+            {
+                "name": name,
+                "baseline_s": reference["best_s"],
+                "current_s": result["best_s"],
+                "ratio": ratio,
+                "regressed": ratio > 1.0 + threshold,
+            }
+        )
+    return rows
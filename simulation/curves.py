@@ -1,5 +1,22 @@
+"""Canon §12 economy curves, as scalar functions plus array and table helpers.
 
-def _clamp(value: float, minimum: float, maximum: float) -> float:
+The scalar functions are the only definitions of the curve formulas. The ``*_array``
+variants map them element-wise over any iterables (scalars broadcast) into ``array('d')``
+results, so they cannot drift from the scalar curves.
+``ekwan_upkeep_table`` precomputes per-tier upkeep once per base cost, and
+``MoraleDecayTable`` is an interpolated lookup table for the morale decay curve with a
+guaranteed error bound.
+"""
+
+from array import array
+from functools import lru_cache
+from itertools import repeat, starmap
+from typing import Iterable, Tuple, Union
+
+Values = Union[float, Iterable[float]]
+
+
+def clamp(value: float, minimum: float, maximum: float) -> float:
     """Clamp helper so every curve honours canon guard rails."""
     return max(minimum, min(maximum, value))
 
@@ -9,7 +26,7 @@ def ase_yield_per_tick(base_ase: float, faith: float) -> float:
     # §12.1 Ase Resonance Ladder — each point of Faith above 50 adds +1.6% yield
     # but the resonance stabilises between half and double the base output.
     multiplier = 1.0 + 0.016 * (faith - 50.0)
-    multiplier = _clamp(multiplier, 0.5, 2.0)
+    multiplier = clamp(multiplier, 0.5, 2.0)
     return base_ase * multiplier
 
 
@@ -20,10 +37,15 @@ def ekwan_cost_for_tier(base: float, tier: int) -> float:
     return base * growth
 
 
+def morale_decay_exponent(guardian: bool) -> float:
+    """Fear-to-decay exponent of canon §12.3 (Guardians soften the curve)."""
+    return 1.15 if guardian else 1.25
+
+
 def morale_decay_step(morale: float, fear: float, guardian: bool = False) -> float:
     """Morale decay with guardian mitigation from canon §12.3."""
     # §12.3 Morale Decay — fear pressure scales super-linearly without Guardians.
-    exponent = 1.15 if guardian else 1.25
+    exponent = morale_decay_exponent(guardian)
     decay = (max(0.0, fear) / 12.0) ** exponent
     return morale - decay
 
@@ -31,7 +53,7 @@ def morale_decay_step(morale: float, fear: float, guardian: bool = False) -> flo
 def faith_recovery_step(faith: float, harmony: float) -> float:
     """Faith rebound paced by harmony as outlined in canon §12.4."""
     # §12.4 Faith Recovery — harmony converts the gap to peak Faith at 6% rate.
-    recovery_rate = 0.06 * _clamp(harmony / 100.0, 0.0, 1.2)
+    recovery_rate = 0.06 * clamp(harmony / 100.0, 0.0, 1.2)
     return faith + (100.0 - faith) * recovery_rate
 
 
@@ -39,4 +61,128 @@ def harmony_efficiency(harmony: float) -> float:
     """Harmony efficiency clamp per canon §12.5."""
     # §12.5 Harmony Efficiency — efficiency window spans 0.85x to 1.3x.
     efficiency = 1.0 + 0.004 * (harmony - 50.0)
-    return _clamp(efficiency, 0.85, 1.3)
+    return clamp(efficiency, 0.85, 1.3)
+
+
+@lru_cache(maxsize=256)
+def ekwan_upkeep_table(base: float, max_tier: int) -> Tuple[float, ...]:
+    """Upkeep for tiers ``0..max_tier``; entry ``t`` equals ``ekwan_cost_for_tier(base, t)``."""
+    return tuple(ekwan_cost_for_tier(base, tier) for tier in range(max(0, max_tier) + 1))
+
+
+# -- Array forms -------------------------------------------------------------------
+
+
+def _broadcast(*columns: Values):
+    """Zip iterables element-wise, repeating scalars; at least one column must iterate."""
+    if all(isinstance(column, (int, float)) for column in columns):
+        raise TypeError("array curves need at least one iterable argument")
+    return zip(*(repeat(column) if isinstance(column, (int, float)) else column for column in columns))
+
+
+def ase_yield_per_tick_array(base_ase: Values, faith: Values) -> array:
+    """Element-wise :func:`ase_yield_per_tick`."""
+    return array("d", starmap(ase_yield_per_tick, _broadcast(base_ase, faith)))
+
+
+def ekwan_cost_for_tiers(base: float, tiers: Iterable[int]) -> array:
+    """Element-wise :func:`ekwan_cost_for_tier` through the cached upkeep table."""
+    tiers = list(tiers)
+    table = ekwan_upkeep_table(base, max(tiers, default=0))
+    return array("d", (table[tier] if tier > 0 else table[0] for tier in tiers))
+
+
+def morale_decay_step_array(
+    morale: Values, fear: Values, guardian: Union[bool, Iterable[bool]] = False, table=None
+) -> array:
+    """Element-wise :func:`morale_decay_step`.
+
+    Pass a :class:`MoraleDecayTable` (one per guardian setting, keyed by ``True``/``False``
+    in a dict, or a single table when ``guardian`` is a plain bool) to use the lookup
+    table instead of the exact power.
+    """
+    guardians = repeat(guardian) if isinstance(guardian, bool) else guardian
+    if table is None:
+        return array(
+            "d",
+            (
+                morale_decay_step(value, pressure, shielded)
+                for (value, pressure), shielded in zip(_broadcast(morale, fear), guardians)
+            ),
+        )
+    tables = table if isinstance(table, dict) else {bool(guardian): table}
+    return array(
+        "d",
+        (
+            tables[bool(shielded)].step(value, pressure)
+            for (value, pressure), shielded in zip(_broadcast(morale, fear), guardians)
+        ),
+    )
+
+
+def faith_recovery_step_array(faith: Values, harmony: Values) -> array:
+    """Element-wise :func:`faith_recovery_step`."""
+    return array("d", starmap(faith_recovery_step, _broadcast(faith, harmony)))
+
+
+def harmony_efficiency_array(harmony: Iterable[float]) -> array:
+    """Element-wise :func:`harmony_efficiency`."""
+    return array("d", map(harmony_efficiency, harmony))
+
+
+# -- Lookup tables -----------------------------------------------------------------
+
+
+class MoraleDecayTable:
+    """Piecewise-linear table of the §12.3 decay term ``(fear / 12) ** exponent``.
+
+    Covers the sim's fear range ``[0, fear_max]`` with ``cells_per_point`` cells per fear
+    point; values outside it fall back to the exact power. ``error_bound`` is a proven
+    upper bound on ``|table - exact|``: the chord error of the first cell is computed in
+    closed form (the curvature is unbounded at 0), and every other cell uses the
+    interpolation bound ``h**2 / 8 * max|f''|`` with ``|f''|`` taken at the cell's left
+    edge, where it peaks because the exponent is below 2. The default grid keeps the
+    error under ``1e-3`` morale, well below the log's two-decimal rounding.
+    """
+
+    __slots__ = ("guardian", "exponent", "fear_max", "scale", "values", "error_bound")
+
+    def __init__(self, guardian: bool = False, cells_per_point: int = 4, fear_max: float = 100.0) -> None:
+        if cells_per_point <= 0 or fear_max <= 0:
+            raise ValueError("cells_per_point and fear_max must be positive")
+        self.guardian = guardian
+        self.exponent = morale_decay_exponent(guardian)
+        self.fear_max = float(fear_max)
+        self.scale = float(cells_per_point)
+        cells = int(self.fear_max * cells_per_point)
+        self.values = array("d", ((index / self.scale / 12.0) ** self.exponent for index in range(cells + 1)))
+        self.error_bound = self._error_bound(1.0 / self.scale, cells)
+
+    def _error_bound(self, width: float, cells: int) -> float:
+        p = self.exponent
+        # First cell: chord minus c*x**p peaks at x* = width * p ** (-1 / (p - 1)).
+        coeff = 12.0 ** -p
+        peak = width * p ** (-1.0 / (p - 1.0))
+        bound = coeff * (width ** (p - 1.0) * peak - peak**p)
+        curvature = coeff * p * (p - 1.0)
+        for index in range(1, cells):
+            bound = max(bound, width * width / 8.0 * curvature * (index * width) ** (p - 2.0))
+        return bound
+
+    def decay(self, fear: float) -> float:
+        """Interpolated ``(max(0, fear) / 12) ** exponent``."""
+        if fear <= 0.0:
+            return 0.0
+        position = fear * self.scale
+        index = int(position)
+        values = self.values
+        if index + 1 >= len(values):
+            if fear > self.fear_max:
+                return (fear / 12.0) ** self.exponent
+            return values[-1]
+        low = values[index]
+        return low + (values[index + 1] - low) * (position - index)
+
+    def step(self, morale: float, fear: float) -> float:
+        """Table-backed :func:`morale_decay_step` for this table's guardian setting."""
+        return morale - self.decay(fear)
@@ -0,0 +1,257 @@
+"""Compact columnar storage for per-day sim logs.
+
+``ColumnarDailyLog`` keeps one preallocated typed array per numeric ``DailyLog``
+field and one packed bitset per boolean ritual flag, instead of a dict per day with
+repeated string keys. Rows are rebuilt as plain dicts only when indexed, so the
+object still reads like the ``result["log"]`` list returned by the default mode.
+
+``EventLog`` goes further for long logs, where most days fire no flag: it keeps the
+floats as dense columns and the flags and fragment gains as a sparse event list.
+"""
+
+from array import array
+from collections.abc import Sequence
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+# Column layout, in DailyLog field order (day rows rebuild in this order).
+INT_FIELDS: Tuple[str, ...] = ("day", "legacy_fragments")
+FLOAT_FIELDS: Tuple[str, ...] = (
+    "ase",
+    "faith",
+    "harmony",
+    "favor",
+    "morale",
+    "fear",
+    "ase_yield",
+    "ekwan_spend",
+    "harmony_efficiency",
+    "faith_recovered",
+)
+FLAG_FIELDS: Tuple[str, ...] = (
+    "courage_ritual_used",
+    "ward_beads_used",
+    "courage_ritual_skipped",
+    "spike_guard_used",
+    "reflection_prayer_used",
+    "voluntary_retirement",
+)
+LOG_FIELDS: Tuple[str, ...] = (
+    "day",
+    *FLOAT_FIELDS,
+    "legacy_fragments",
+    *FLAG_FIELDS,
+)
+
+
+class ColumnarDailyLog(Sequence):
+    """Preallocated struct-of-arrays day log with on-demand dict rows."""
+
+    __slots__ = ("_capacity", "_length", "_ints", "_floats", "_flags")
+
+    def __init__(self, capacity: int) -> None:
+        self._capacity = max(0, capacity)
+        self._length = 0
+        self._ints = {name: array("q", bytes(8 * self._capacity)) for name in INT_FIELDS}
+        self._floats = {name: array("d", bytes(8 * self._capacity)) for name in FLOAT_FIELDS}
+        self._flags = {name: bytearray((self._capacity + 7) // 8) for name in FLAG_FIELDS}
+
+    def append(self, entry: Any) -> None:
+        """Store a ``DailyLog`` (or any object exposing its attributes) as the next row."""
+
+        index = self._length
+        if index >= self._capacity:
+            self._grow(max(1, self._capacity * 2))
+        for name, column in self._ints.items():
+            column[index] = getattr(entry, name)
+        for name, column in self._floats.items():
+            column[index] = getattr(entry, name)
+        byte, bit = divmod(index, 8)
+        for name, bits in self._flags.items():
+            if getattr(entry, name):
+                bits[byte] |= 1 << bit
+        self._length = index + 1
+
+    def _grow(self, capacity: int) -> None:
+        extra = capacity - self._capacity
+        for column in (*self._ints.values(), *self._floats.values()):
+            column.frombytes(bytes(8 * extra))
+        for bits in self._flags.values():
+            bits.extend(bytes((capacity + 7) // 8 - len(bits)))
+        self._capacity = capacity
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self.row(i) for i in range(*index.indices(self._length))]
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("day log index out of range")
+        return self.row(index)
+
+    def row(self, index: int) -> Dict[str, Any]:
+        """Rebuild one day as the dict ``asdict(DailyLog)`` would have produced."""
+
+        byte, bit = divmod(index, 8)
+        values: Dict[str, Any] = {}
+        for name in LOG_FIELDS:
+            if name in self._floats:
+                values[name] = self._floats[name][index]
+            elif name in self._ints:
+                values[name] = self._ints[name][index]
+            else:
+                values[name] = bool(self._flags[name][byte] >> bit & 1)
+        return values
+
+    def column(self, name: str) -> Iterable[Any]:
+        """Return a read-only view of one numeric column, or a bool list for a flag."""
+
+        if name in self._floats:
+            return memoryview(self._floats[name])[: self._length].toreadonly()
+        if name in self._ints:
+            return memoryview(self._ints[name])[: self._length].toreadonly()
+        if name in self._flags:
+            bits = self._flags[name]
+            return [bool(bits[i >> 3] >> (i & 7) & 1) for i in range(self._length)]
+        raise KeyError(name)
+
+    def flag_count(self, name: str) -> int:
+        """Count the days a ritual flag fired via popcount on the packed bitset."""
+
+        return int.from_bytes(self._flags[name], "little").bit_count()
+
+    def to_dicts(self) -> List[Dict[str, Any]]:
+        """Materialise every row (e.g. for JSON output)."""
+
+        return [self.row(i) for i in range(self._length)]
+
+    def nbytes(self) -> int:
+        """Bytes held by the column buffers (excluding fixed object overhead)."""
+
+        total = sum(column.itemsize * len(column) for column in self._ints.values())
+        total += sum(column.itemsize * len(column) for column in self._floats.values())
+        return total + sum(len(bits) for bits in self._flags.values())
+
+
+class RunningSummary:
+    """Inline day-log aggregates for ``log_mode="summary"`` runs.
+
+    Tracks exactly the log-derived fields ``aggregate_kpis.RunSummary`` needs (first and
+    last ase yield, morale minimum, fear maximum and per-flag counts) without keeping
+    any rows. Extremes are tracked unrounded; rounding is monotonic, so rounding once
+    at the end matches the min/max of the rounded log.
+    """
+
+    __slots__ = ("days", "ase_yield_first", "ase_yield_last", "morale_min", "fear_max", "counts")
+
+    def __init__(self) -> None:
+        self.days = 0
+        self.ase_yield_first = 0.0
+        self.ase_yield_last = 0.0
+        self.morale_min = float("inf")
+        self.fear_max = float("-inf")
+        self.counts = [0] * len(FLAG_FIELDS)
+
+    def update(self, ase_yield: float, morale: float, fear: float, *flags: bool) -> None:
+        """Fold one day in; ``flags`` follow ``FLAG_FIELDS`` order."""
+
+        if not self.days:
+            self.ase_yield_first = ase_yield
+        self.days += 1
+        self.ase_yield_last = ase_yield
+        if morale < self.morale_min:
+            self.morale_min = morale
+        if fear > self.fear_max:
+            self.fear_max = fear
+        counts = self.counts
+        for index, flag in enumerate(flags):
+            if flag:
+                counts[index] += 1
+
+    def as_dict(self) -> Dict[str, Any]:
+        empty = not self.days
+        payload: Dict[str, Any] = {
+            "days": self.days,
+            "ase_yield_first": None if empty else round(self.ase_yield_first, 2),
+            "ase_yield_last": None if empty else round(self.ase_yield_last, 2),
+            "morale_min": None if empty else round(self.morale_min, 2),
+            "fear_max": None if empty else round(self.fear_max, 2),
+        }
+        payload.update(zip(FLAG_FIELDS, self.counts))
+        return payload
+
+
+# Event name for a legacy-fragment gain in an EventLog (flags use their field names).
+FRAGMENT_EVENT = "legacy_fragment"
+# DailyLog rounding per dense column; EventLog keeps this unless asked for coarser output.
+COLUMN_PRECISION: Dict[str, int] = {name: 2 for name in FLOAT_FIELDS}
+COLUMN_PRECISION["harmony_efficiency"] = 3
+
+
+class EventLog:
+    """Event-sparse day log for ``log_mode="events"`` runs.
+
+    The float fields are dense typed columns, one value per day. The boolean flags and
+    legacy-fragment gains are a sparse list of ``[day, event, payload]`` triples. Flags
+    are named by their ``DailyLog`` field and have a ``None`` payload.
+    :data:`FRAGMENT_EVENT` carries ``{"gained": n, "total": m}``. Flag counts come
+    straight from the event list, so nobody has to scan every day.
+    """
+
+    __slots__ = ("first_day", "_columns", "events", "_fragments")
+
+    def __init__(self, first_day: int = 1, fragments: int = 0) -> None:
+        self.first_day = first_day
+        self._columns = {name: array("d") for name in FLOAT_FIELDS}
+        self.events: List[list] = []
+        self._fragments = fragments
+
+    def append(self, entry: Any) -> None:
+        """Store a ``DailyLog`` as the next day."""
+
+        for name, column in self._columns.items():
+            column.append(getattr(entry, name))
+        day = entry.day
+        for name in FLAG_FIELDS:
+            if getattr(entry, name):
+                self.events.append([day, name, None])
+        if entry.legacy_fragments != self._fragments:
+            self.events.append(
+                [day, FRAGMENT_EVENT, {"gained": entry.legacy_fragments - self._fragments, "total": entry.legacy_fragments}]
+            )
+            self._fragments = entry.legacy_fragments
+
+    def __len__(self) -> int:
+        return len(self._columns["ase"])
+
+    def column(self, name: str) -> memoryview:
+        return memoryview(self._columns[name]).toreadonly()
+
+    def flag_count(self, name: str) -> int:
+        return sum(1 for event in self.events if event[1] == name)
+
+    def as_dict(self, precision: Optional[int] = None) -> Dict[str, Any]:
+        """JSON-ready form; ``precision`` caps the decimals of every dense column."""
+
+        columns = {}
+        for name, column in self._columns.items():
+            digits = COLUMN_PRECISION[name] if precision is None else min(precision, COLUMN_PRECISION[name])
+            columns[name] = [round(value, digits) for value in column]
+        return {
+            "first_day": self.first_day,
+            "days": len(self),
+            "precision": precision,
+            "columns": columns,
+            "events": self.events,
+        }
+
+
+def event_counts(event_log: Dict[str, Any]) -> Dict[str, int]:
+    """Per-flag day counts (and fragment events) of a serialised :class:`EventLog`."""
+
+    counts = dict.fromkeys((*FLAG_FIELDS, FRAGMENT_EVENT), 0)
+    for _, name, _ in event_log["events"]:
+        counts[name] += 1
+    return counts
@@ -0,0 +1,201 @@
+"""Long-horizon campaigns (10-100 years) with bounded output.
+
+A full day log grows by one row per day, so a 100-year campaign in ``"dicts"`` mode
+builds 36,500 dicts. :func:`run_long_horizon` runs the same day loop but keeps only:
+
+- ``summary``: whole-campaign running aggregates, identical to ``log_mode="summary"``;
+- ``periods``: one rollup per ``period`` days (a year by default) with end-of-period
+  globals, mean ase yield, morale min, fear max, fragments gained and flag counts;
+- ``log``: the day rows worth reading, i.e. every ``every``-th day plus, with
+  ``events=True``, each day on which a ritual, guardrail, retirement or collapse fired
+  (see :data:`EVENT_FLAGS`). The last day is always kept;
+- ``checkpoints``: a :meth:`SimState.to_dict` snapshot every ``checkpoint_every`` days,
+  kept in the report or written to ``checkpoint_dir`` as ``day-NNNNNN.json``.
+
+Sampling, periods and checkpoints are keyed on absolute day numbers. A run resumed
+from a checkpoint (``state=SimState.from_dict(...)``) therefore reproduces the tail of
+the uninterrupted run exactly.
+"""
+
+from __future__ import annotations
+
+import json
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from .daylog import FLAG_FIELDS, RunningSummary
+from .sim import SimConfig, SimState, _day_loop, _final, config_payload, initial_state
+
+# Day-log flags that mark a day as an event day (alongside any legacy fragment gain).
+EVENT_FLAGS = ("courage_ritual_used", "ward_beads_used", "reflection_prayer_used", "voluntary_retirement")
+
+
+class _Period:
+    """Running aggregates for one rollup window.
+
+    Extremes and the yield total are kept unrounded and rounded once at :meth:`close`,
+    as :class:`RunningSummary` does.
+    """
+
+    __slots__ = ("start_day", "days", "ase_yield_total", "morale_min", "fear_max", "fragments_start", "counts")
+
+    def __init__(self, start_day: int, fragments: int) -> None:
+        self.start_day = start_day
+        self.days = 0
+        self.ase_yield_total = 0.0
+        self.morale_min = float("inf")
+        self.fear_max = float("-inf")
+        self.fragments_start = fragments
+        self.counts = [0] * len(FLAG_FIELDS)
+
+    def close(self, entry: Any) -> Dict[str, Any]:
+        row: Dict[str, Any] = {
+            "start_day": self.start_day,
+            "end_day": entry.day,
+            "ase": entry.ase,
+            "faith": entry.faith,
+            "harmony": entry.harmony,
+            "favor": entry.favor,
+            "ase_yield_mean": round(self.ase_yield_total / self.days, 2),
+            "morale_min": round(self.morale_min, 2),
+            "fear_max": round(self.fear_max, 2),
+            "legacy_fragments_gained": entry.legacy_fragments - self.fragments_start,
+        }
+        row.update(zip(FLAG_FIELDS, self.counts))
+        return row
+
+
+class _Recorder:
+    """The ``summary`` hook :func:`run_long_horizon` hands to the day loop.
+
+    Folds every day into the campaign summary and the open period, and asks the loop
+    for a :class:`DailyLog` only on the days that are logged or close a period. The
+    day loop syncs ``state`` before calling :meth:`update`.
+    """
+
+    __slots__ = ("state", "last_day", "every", "events", "period", "summary", "window", "fragments", "logged")
+
+    def __init__(self, state: SimState, last_day: int, every: int, events: bool, period: int) -> None:
+        self.state = state
+        self.last_day = last_day
+        self.every = every
+        self.events = events
+        self.period = period
+        self.summary = RunningSummary()
+        self.window = _Period(state.day + 1, state.legacy_fragments)
+        self.fragments = state.legacy_fragments
+        self.logged = False
+
+    def update(self, ase_yield: float, morale: float, fear: float, *flags: bool) -> bool:
+        self.summary.update(ase_yield, morale, fear, *flags)
+        window = self.window
+        window.days += 1
+        window.ase_yield_total += ase_yield
+        if morale < window.morale_min:
+            window.morale_min = morale
+        if fear > window.fear_max:
+            window.fear_max = fear
+        counts = window.counts
+        for index, flag in enumerate(flags):
+            if flag:
+                counts[index] += 1
+
+        day = self.state.day
+        fragments = self.state.legacy_fragments
+        keep = day == self.last_day or bool(self.every and day % self.every == 0)
+        if not keep and self.events:
+            courage, ward_beads, _, _, reflection, retirement = flags
+            keep = fragments != self.fragments or courage or ward_beads or reflection or retirement
+        self.fragments = fragments
+        self.logged = keep
+        return keep or day % self.period == 0 or day == self.last_day
+
+    def close_period(self, entry: Any) -> Optional[Dict[str, Any]]:
+        """Roll up the open period if ``entry`` ends it."""
+
+        day = entry.day
+        if day % self.period and day != self.last_day:
+            return None
+        row = self.window.close(entry)
+        self.window = _Period(day + 1, entry.legacy_fragments)
+        return row
+
+
+def run_long_horizon(
+    cfg: SimConfig,
+    every: int = 30,
+    events: bool = True,
+    period: int = 365,
+    checkpoint_every: Optional[int] = None,
+    checkpoint_dir: Optional[Path] = None,
+    state: Optional[SimState] = None,
+) -> Dict[str, Any]:
+    """Run ``cfg`` to ``cfg.days`` with downsampled logging, period rollups and checkpoints.
+
+    ``every=0`` keeps no periodic rows and ``events=False`` keeps no event rows. ``state``
+    continues from a checkpoint (copied, under ``cfg``) instead of day 0. The report
+    has ``config``, ``final``, ``summary``, ``periods``, ``log`` and ``checkpoints``.
+    ``summary`` and ``periods`` cover only the days this call simulated. Each
+    ``checkpoints`` entry holds the ``day`` and either the snapshot ``state`` or its
+    ``path``.
+    """
+
+    if every < 0:
+        raise ValueError("every must be non-negative")
+    if period <= 0:
+        raise ValueError("period must be positive")
+    if checkpoint_every is not None and checkpoint_every <= 0:
+        raise ValueError("checkpoint_every must be positive")
+    if checkpoint_dir is not None:
+        checkpoint_dir = Path(checkpoint_dir)
+        checkpoint_dir.mkdir(parents=True, exist_ok=True)
+
+    run_state = initial_state(cfg) if state is None else state.copy(cfg)
+    first_day = run_state.day
+    periods: List[Dict[str, Any]] = []
+    log: List[Dict[str, Any]] = []
+    checkpoints: List[Dict[str, Any]] = []
+    recorder = _Recorder(run_state, cfg.days, every, events, period)
+
+    # Rows are only built on the days the recorder asks for; every other day yields None.
+    for entry in _day_loop(run_state, cfg.days, summary=recorder):
+        if entry is not None:
+            if recorder.logged:
+                log.append(asdict(entry))
+            closed = recorder.close_period(entry)
+            if closed is not None:
+                periods.append(closed)
+
+        day = run_state.day
+        if checkpoint_every is not None and day % checkpoint_every == 0:
+            snapshot = run_state.to_dict()
+            if checkpoint_dir is None:
+                checkpoints.append({"day": day, "state": snapshot})
+            else:
+                path = checkpoint_dir / f"day-{day:06d}.json"
+                path.write_text(json.dumps(snapshot, separators=(",", ":")))
+                checkpoints.append({"day": day, "path": path.as_posix()})
+
+    return {
+        "config": config_payload(cfg),
+        "final": _final(run_state),
+        "horizon": {
+            "first_day": first_day + 1,
+            "last_day": run_state.day,
+            "every": every,
+            "events": events,
+            "period": period,
+            "checkpoint_every": checkpoint_every,
+        },
+        "summary": recorder.summary.as_dict(),
+        "periods": periods,
+        "log": log,
+        "checkpoints": checkpoints,
+    }
+
+
+def load_checkpoint(path: Path) -> SimState:
+    """Read a checkpoint file written by :func:`run_long_horizon`."""
+
+    return SimState.from_dict(json.loads(Path(path).read_text()))
@@ -0,0 +1,212 @@
+"""JSON-lines run requests: a lockstep server and a parallel batch runner.
+
+A request is one JSON object of ``SimConfig`` overrides, applied on top of a base
+config, plus two optional keys: ``"id"`` (echoed back) and ``"log_mode"`` (one of
+:data:`REQUEST_LOG_MODES`). Each request gets exactly one minified JSON reply. A request
+that cannot run answers ``{"id": ..., "error": ...}`` instead, so one bad line never
+ends a stream.
+
+:func:`serve` answers requests one at a time, flushing each reply. :func:`run_lines`
+fans requests out over a process pool in chunks and tags every reply with its 1-based
+input ``"line"``, so a reply file is enough to resume an interrupted batch (see
+:func:`completed_lines` and :func:`drop_torn_tail`).
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sys
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
+
+from .batch import BATCH_LOG_MODES, run_economy_sim_batch
+from .sim import SimConfig, config_payload, run_economy_sim
+
+if TYPE_CHECKING:
+    from concurrent.futures import Future
+
+REQUEST_LOG_MODES = ("dicts", "summary", "events")
+
+_TAIL_BLOCK = 64 * 1024
+
+_encode = json.JSONEncoder(separators=(",", ":")).encode
+
+
+def answer(text: str, cfg: SimConfig, log_mode: str = "dicts", line: Optional[int] = None) -> str:
+    """Run the request ``text`` on top of ``cfg`` and return its reply line (no newline).
+
+    ``log_mode`` applies when the request names none. ``line`` adds a leading
+    ``"line"`` key to the reply.
+    """
+
+    head: Dict[str, Any] = {} if line is None else {"line": line}
+    try:
+        request = json.loads(text)
+        if not isinstance(request, dict):
+            raise ValueError("each request must be a JSON object")
+        if "id" in request:
+            head["id"] = request.pop("id")
+        mode = request.pop("log_mode", log_mode)
+        if mode not in REQUEST_LOG_MODES:
+            raise ValueError(f"log_mode must be one of {REQUEST_LOG_MODES}, received '{mode}'")
+        run_cfg = SimConfig.from_overrides({**config_payload(cfg), **request}) if request else cfg
+        if mode in BATCH_LOG_MODES:
+            (result,) = run_economy_sim_batch([run_cfg], log_mode=mode)
+        else:
+            result = run_economy_sim(run_cfg, log_mode=mode)
+    except Exception as exc:  # any failure becomes that request's reply, not the stream's end
+        return _encode({**head, "id": head.get("id"), "error": str(exc)})
+    head.update(result)
+    return _encode(head)
+
+
+def serve(cfg: SimConfig, log_mode: str = "dicts", stdin: Any = None, stdout: Any = None) -> int:
+    """Answer request lines from ``stdin`` until EOF and return how many were served.
+
+    Replies go to ``stdout`` in request order, each flushed straight away so a caller
+    can read them in lockstep. Blank lines are skipped.
+    """
+
+    stdin = sys.stdin if stdin is None else stdin
+    stdout = sys.stdout if stdout is None else stdout
+    served = 0
+    for text in stdin:
+        if not text.strip():
+            continue
+        stdout.write(answer(text, cfg, log_mode) + "\n")
+        stdout.flush()
+        served += 1
+    return served
+
+
+def _answer_chunk(chunk: Sequence[Tuple[int, str]], cfg: SimConfig, log_mode: str) -> List[str]:
+    return [answer(text, cfg, log_mode, line) for line, text in chunk]
+
+
+def _request_chunks(lines: Iterable[str], chunk_size: int, skip: Set[int]) -> Iterator[List[Tuple[int, str]]]:
+    chunk: List[Tuple[int, str]] = []
+    for line, text in enumerate(lines, start=1):
+        if line in skip or not text.strip():
+            continue
+        chunk.append((line, text))
+        if len(chunk) == chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def run_lines(
+    lines: Iterable[str],
+    cfg: SimConfig,
+    log_mode: str = "dicts",
+    workers: Optional[int] = None,
+    chunk_size: int = 16,
+    ordered: bool = False,
+    max_pending: Optional[int] = None,
+    skip: Iterable[int] = (),
+) -> Iterator[str]:
+    """Answer every request in ``lines`` and yield the reply lines as chunks finish.
+
+    Input is read lazily and cut into ``chunk_size`` work units. At most ``max_pending``
+    chunks (default ``2 * workers``) are submitted but not yet yielded, so neither a huge
+    input nor a slow consumer makes the parent buffer more than that: reading stops
+    until replies are taken. ``ordered=True`` yields replies in input order; otherwise
+    each chunk comes out as soon as it finishes. ``workers=1`` runs in-process, in
+    order. Line numbers in ``skip`` (typically :func:`completed_lines` of an earlier
+    attempt) are left out. Blank lines are skipped but still counted.
+    """
+
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be positive")
+    if max_pending is not None and max_pending <= 0:
+        raise ValueError("max_pending must be positive")
+    if log_mode not in REQUEST_LOG_MODES:
+        raise ValueError(f"log_mode must be one of {REQUEST_LOG_MODES}, received '{log_mode}'")
+    workers = workers or os.cpu_count() or 1
+    work = _request_chunks(lines, chunk_size, set(skip))
+    if workers == 1:
+        for chunk in work:
+            yield from _answer_chunk(chunk, cfg, log_mode)
+        return
+
+    # Imported here so --serve and one-shot launches never load the pool machinery.
+    from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+    limit = max_pending or 2 * workers
+    pending: Dict["Future", int] = {}
+    ready: Dict[int, List[str]] = {}
+    next_index = 0
+
+    def _drain() -> Iterator[str]:
+        nonlocal next_index
+        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            ready[pending.pop(future)] = future.result()
+        if ordered:
+            while next_index in ready:
+                yield from ready.pop(next_index)
+                next_index += 1
+        else:
+            for index in sorted(ready):
+                yield from ready.pop(index)
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for index, chunk in enumerate(work):
+            while len(pending) + len(ready) >= limit:
+                yield from _drain()
+            pending[pool.submit(_answer_chunk, chunk, cfg, log_mode)] = index
+        while pending:
+            yield from _drain()
+
+
+def completed_lines(path: Path) -> Set[int]:
+    """Input line numbers already answered in the :func:`run_lines` reply file ``path``.
+
+    Read-only. A torn last reply (no trailing newline) and any line that is not a reply
+    with an integer ``"line"`` are skipped, so those requests simply run again. A
+    missing file means nothing was answered yet.
+    """
+
+    path = Path(path)
+    if not path.exists():
+        return set()
+    done: Set[int] = set()
+    with path.open("rb") as handle:
+        for text in handle:
+            if not text.endswith(b"\n"):
+                break
+            try:
+                line = json.loads(text).get("line")
+            except (AttributeError, ValueError):
+                continue
+            if isinstance(line, int) and not isinstance(line, bool):
+                done.add(line)
+    return done
+
+
+def drop_torn_tail(path: Path) -> int:
+    """Cut a partial last line (the writer died mid-reply) off ``path``; return the bytes removed.
+
+    Call before appending to a reply file so the next reply starts on its own line.
+    """
+
+    path = Path(path)
+    if not path.exists():
+        return 0
+    with path.open("r+b") as handle:
+        size = handle.seek(0, os.SEEK_END)
+        end = size
+        # Walk back a block at a time; only the torn tail is ever read.
+        while end > 0:
+            start = max(0, end - _TAIL_BLOCK)
+            handle.seek(start)
+            newline = handle.read(end - start).rfind(b"\n")
+            if newline >= 0:
+                end = start + newline + 1
+                break
+            end = start
+        if end < size:
+            handle.truncate(end)
+    return size - end
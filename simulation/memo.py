@@ -0,0 +1,206 @@
+"""Content-addressed memoization for ``run_economy_sim`` results.
+
+The sim is a pure function of its ``SimConfig`` and its own source, so a result can be
+keyed by a canonical hash of the config plus a fingerprint of the modules that drive
+the day loop. Editing a curve changes the fingerprint and every older entry simply
+stops matching; nothing has to be flushed by hand.
+
+:class:`SimCache` keeps a bounded in-memory LRU of encoded results in front of an
+optional on-disk store (one ``<key>.json`` per result) that is trimmed to a byte
+budget, least recently used first. Results are stored as compact JSON and decoded on
+every hit, so callers can mutate what they get back without poisoning the cache.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from collections import OrderedDict
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from .sim import SimConfig, config_payload, run_economy_sim
+
+# Every module whose code can change a cached result, including batch.py: BatchRunner
+# stores payloads from its own day-loop kernel under the same keys.
+FINGERPRINT_MODULES = ("sim.py", "batch.py", "curves.py", "models.py", "prng.py", "daylog.py")
+CACHE_LOG_MODES = ("dicts", "summary")
+_PACKAGE_DIR = Path(__file__).resolve().parent
+
+
+@lru_cache(maxsize=None)
+def sim_fingerprint() -> str:
+    """Hash of the sim sources in :data:`FINGERPRINT_MODULES` (computed once per process)."""
+
+    digest = hashlib.blake2b(digest_size=16)
+    for name in FINGERPRINT_MODULES:
+        digest.update(name.encode("utf-8"))
+        digest.update(b"\0")
+        digest.update((_PACKAGE_DIR / name).read_bytes())
+    return digest.hexdigest()
+
+
+def config_key(cfg: SimConfig, log_mode: str = "dicts", fingerprint: Optional[str] = None) -> str:
+    """Canonical cache key for ``run_economy_sim(cfg, log_mode)`` under the current sources."""
+
+    canonical = json.dumps(
+        {
+            "config": config_payload(cfg),
+            "log_mode": log_mode,
+            "sim": fingerprint or sim_fingerprint(),
+        },
+        sort_keys=True,
+        separators=(",", ":"),
+    )
+    return hashlib.blake2b(canonical.encode("utf-8"), digest_size=20).hexdigest()
+
+
+def _decode(encoded: str) -> Dict[str, Any]:
+    result = json.loads(encoded)
+    config = result["config"]
+    for name, value in config.items():
+        if isinstance(value, list):
+            config[name] = tuple(value)
+    return result
+
+
+class SimCache:
+    """Two-level (memory LRU + optional disk) cache for deterministic sim results.
+
+    ``max_entries`` bounds the in-memory LRU; ``max_bytes`` bounds the disk directory.
+    Its size is scanned once and then tracked per write; only a write that takes it
+    over budget rescans it and trims entries by access time. ``cache_dir=None`` keeps the cache
+    in memory only.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[Path] = None,
+        max_entries: int = 256,
+        max_bytes: int = 256 * 1024 * 1024,
+    ) -> None:
+        if max_entries < 0 or max_bytes < 0:
+            raise ValueError("cache bounds must be non-negative")
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._memory: "OrderedDict[str, str]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self._disk_bytes: Optional[int] = None
+        if self.cache_dir is not None:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, key: str) -> Path:
+        assert self.cache_dir is not None
+        return self.cache_dir / f"{key}.json"
+
+    def _remember(self, key: str, encoded: str) -> None:
+        if not self.max_entries:
+            return
+        self._memory[key] = encoded
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def _lookup(self, key: str) -> Optional[str]:
+        encoded = self._memory.get(key)
+        if encoded is not None:
+            self._memory.move_to_end(key)
+            return encoded
+        if self.cache_dir is None:
+            return None
+        path = self._path(key)
+        try:
+            encoded = path.read_text()
+        except FileNotFoundError:
+            return None
+        os.utime(path)  # mark as recently used for eviction
+        self._remember(key, encoded)
+        return encoded
+
+    def _store(self, key: str, encoded: str) -> None:
+        self._remember(key, encoded)
+        if self.cache_dir is None:
+            return
+        if self._disk_bytes is None:
+            self._disk_bytes = sum(size for _, size, _ in self._scan())
+        path = self._path(key)
+        try:
+            self._disk_bytes -= path.stat().st_size
+        except FileNotFoundError:
+            pass
+        data = encoded.encode("utf-8")
+        tmp_path = path.with_name(path.name + f".{os.getpid()}.tmp")
+        tmp_path.write_bytes(data)
+        tmp_path.replace(path)
+        self._disk_bytes += len(data)
+        if self._disk_bytes > self.max_bytes:
+            self._evict()
+
+    def _scan(self) -> List[Tuple[int, int, Path]]:
+        entries = []
+        for path in self.cache_dir.glob("*.json"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, path))
+        return entries
+
+    def _evict(self) -> None:
+        # Rescan rather than trust the running total: other processes may share the directory.
+        entries = sorted(self._scan())
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            self._memory.pop(path.stem, None)
+            total -= size
+        self._disk_bytes = total
+
+    def get(self, cfg: SimConfig, log_mode: str = "dicts") -> Optional[Dict[str, Any]]:
+        """Cached result for ``cfg`` or ``None``; counts a hit or a miss."""
+
+        if log_mode not in CACHE_LOG_MODES:
+            raise ValueError(f"log_mode must be one of {CACHE_LOG_MODES}, received '{log_mode}'")
+        encoded = self._lookup(config_key(cfg, log_mode))
+        if encoded is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return _decode(encoded)
+
+    def put(self, cfg: SimConfig, log_mode: str, result: Dict[str, Any]) -> None:
+        """Store a result computed elsewhere (e.g. by the batch engine, which matches)."""
+
+        if log_mode not in CACHE_LOG_MODES:
+            raise ValueError(f"log_mode must be one of {CACHE_LOG_MODES}, received '{log_mode}'")
+        self._store(config_key(cfg, log_mode), json.dumps(result, separators=(",", ":")))
+
+    def run(self, cfg: SimConfig, log_mode: str = "dicts") -> Dict[str, Any]:
+        """``run_economy_sim(cfg, log_mode)``, served from the cache when possible.
+
+        Only the JSON-shaped ``"dicts"`` and ``"summary"`` modes are cacheable.
+        """
+
+        result = self.get(cfg, log_mode)
+        if result is None:
+            result = run_economy_sim(cfg, log_mode=log_mode)
+            self.put(cfg, log_mode, result)
+        return result
+
+    def clear(self) -> None:
+        """Drop every entry from memory and disk."""
+
+        self._memory.clear()
+        if self.cache_dir is not None:
+            for path in self.cache_dir.glob("*.json"):
+                path.unlink(missing_ok=True)
+            self._disk_bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._memory)
@@ -0,0 +1,194 @@
+"""Monte Carlo KPI estimates over campaign seeds, with adaptive seed counts.
+
+A scenario is a set of ``SimConfig`` overrides; :func:`monte_carlo` runs it over
+consecutive campaign seeds and reports, for every per-run metric, the mean with a
+Student-t confidence interval, the std, and percentiles with distribution-free
+(order-statistic) intervals.
+
+Seeds are added in rounds. After each round the scenario's interval widths are compared
+with ``widths`` (full width of the mean's interval per metric). A scenario stops once
+every listed metric is narrow enough or ``max_seeds`` is reached. Otherwise its next
+seed count is projected from the ``1/sqrt(n)`` shrinkage of the widest miss, capped at
+``growth`` times the current count. Low-variance scenarios therefore stop after
+``min_seeds`` while noisy ones keep going. All scenarios pending in a round share
+one batch, which is split into summary-mode chunks across ``workers`` processes.
+"""
+
+from __future__ import annotations
+
+import math
+import os
+from statistics import NormalDist
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence
+
+from .batch import BatchRunner
+from .memo import SimCache
+from .sim import SimConfig
+from .tuning import METRICS
+
+Overrides = Dict[str, Any]
+Extractor = Callable[[Dict[str, Any]], Mapping[str, float]]
+
+DEFAULT_SEED_START = 0xA2B94D10
+DEFAULT_PERCENTILES = (0.1, 0.5, 0.9)
+# Full confidence-interval widths the Pass-02 KPI sheet is read at.
+DEFAULT_WIDTHS: Dict[str, float] = {
+    "final_ase": 50.0,
+    "final_harmony": 1.0,
+    "morale_min": 2.0,
+    "fear_max": 2.0,
+}
+
+
+def metric_values(payload: Dict[str, Any]) -> Dict[str, float]:
+    """Every :data:`simulation.tuning.METRICS` value of one summary-mode payload."""
+
+    return {name: metric(payload) for name, metric in METRICS.items()}
+
+
+def t_quantile(p: float, dof: int) -> float:
+    """Student-t quantile via the Cornish-Fisher expansion around the normal quantile.
+
+    Within about 1e-3 of the exact value for ``dof >= 4``, which is plenty for
+    interval widths; it tends to the normal quantile as ``dof`` grows.
+    """
+
+    z = NormalDist().inv_cdf(p)
+    if dof <= 0:
+        return math.inf
+    z3, z5, z7 = z**3, z**5, z**7
+    return (
+        z
+        + (z3 + z) / (4 * dof)
+        + (5 * z5 + 16 * z3 + 3 * z) / (96 * dof**2)
+        + (3 * z7 + 19 * z5 + 17 * z3 - 15 * z) / (384 * dof**3)
+    )
+
+
+def _percentile(ordered: Sequence[float], p: float) -> float:
+    rank = p * (len(ordered) - 1)
+    low = int(math.floor(rank))
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+def summarize(
+    values: Sequence[float], confidence: float = 0.95, percentiles: Sequence[float] = DEFAULT_PERCENTILES
+) -> Dict[str, Any]:
+    """Mean, std, min/max and percentiles of ``values``, each with its ``confidence`` interval.
+
+    The mean's interval is ``mean ± t * std / sqrt(n)``. A percentile's interval spans
+    the order statistics at ranks ``n*p ∓ z*sqrt(n*p*(1-p))``, which needs no
+    distributional assumption (flag counts and fragments are far from normal).
+    """
+
+    if not values:
+        raise ValueError("need at least one value")
+    n = len(values)
+    ordered = sorted(values)
+    mean = math.fsum(ordered) / n
+    std = math.sqrt(math.fsum((value - mean) ** 2 for value in ordered) / (n - 1)) if n > 1 else 0.0
+    tail = (1 + confidence) / 2
+    half = t_quantile(tail, n - 1) * std / math.sqrt(n) if n > 1 else math.inf
+    if std == 0.0:
+        half = 0.0
+
+    z = NormalDist().inv_cdf(tail)
+    quantiles = {}
+    for p in percentiles:
+        spread = z * math.sqrt(n * p * (1 - p))
+        low_rank = max(0, min(n - 1, int(math.floor(n * p - spread))))
+        high_rank = max(0, min(n - 1, int(math.ceil(n * p + spread))))
+        quantiles[f"p{round(p * 100):g}"] = {
+            "value": _percentile(ordered, p),
+            "ci": [ordered[low_rank], ordered[high_rank]],
+        }
+    return {
+        "n": n,
+        "mean": mean,
+        "std": std,
+        "ci": [mean - half, mean + half],
+        "ci_width": 2 * half,
+        "min": ordered[0],
+        "max": ordered[-1],
+        "percentiles": quantiles,
+    }
+
+
+def monte_carlo(
+    scenarios: Mapping[str, Overrides],
+    widths: Optional[Mapping[str, float]] = None,
+    confidence: float = 0.95,
+    seed_start: int = DEFAULT_SEED_START,
+    min_seeds: int = 16,
+    max_seeds: int = 1024,
+    growth: float = 2.0,
+    percentiles: Sequence[float] = DEFAULT_PERCENTILES,
+    extract: Extractor = metric_values,
+    workers: Optional[int] = 1,
+    chunk_size: int = 64,
+    cache: Optional[SimCache] = None,
+) -> Dict[str, Dict[str, Any]]:
+    """Run each scenario over seeds ``seed_start, seed_start + 1, ...`` until the mean's
+    interval of every metric in ``widths`` (default :data:`DEFAULT_WIDTHS`) is at most
+    that wide, or ``max_seeds`` seeds have run.
+
+    ``extract`` maps a summary-mode payload to named per-run values; every one of them is
+    reported. Returns ``{name: report}`` in scenario order, where a report holds the
+    ``overrides``, the ``seeds`` used, the seed count after each ``round``, whether it
+    ``converged``, the ``widths`` still ``unmet`` and per-metric ``stats`` (see
+    :func:`summarize`).
+    """
+
+    if not scenarios:
+        raise ValueError("need at least one scenario")
+    if not 0 < confidence < 1:
+        raise ValueError("confidence must be between 0 and 1")
+    if not 2 <= min_seeds <= max_seeds:
+        raise ValueError("need 2 <= min_seeds <= max_seeds")
+    if growth <= 1:
+        raise ValueError("growth must be greater than 1")
+    widths = dict(DEFAULT_WIDTHS if widths is None else widths)
+    if any(width <= 0 for width in widths.values()):
+        raise ValueError("widths must be positive")
+
+    for overrides in scenarios.values():
+        SimConfig.from_overrides(dict(overrides))
+    values: Dict[str, Dict[str, List[float]]] = {name: {} for name in scenarios}
+    reports: Dict[str, Dict[str, Any]] = {
+        name: {"overrides": dict(overrides), "seeds": None, "rounds": [], "converged": False}
+        for name, overrides in scenarios.items()
+    }
+    target = {name: min_seeds for name in scenarios}
+
+    with BatchRunner(workers or os.cpu_count() or 1, chunk_size, cache) as runner:
+        while target:
+            batch = [
+                (name, SimConfig.from_overrides({**scenarios[name], "campaign_seed": seed_start + index}))
+                for name, count in target.items()
+                for index in range(reports[name]["rounds"][-1] if reports[name]["rounds"] else 0, count)
+            ]
+            for (name, _), payload in zip(batch, runner.run([cfg for _, cfg in batch])):
+                for metric, value in extract(payload).items():
+                    values[name].setdefault(metric, []).append(value)
+
+            for name, count in list(target.items()):
+                report = reports[name]
+                report["rounds"].append(count)
+                unknown = sorted(set(widths) - set(values[name]))
+                if unknown:
+                    raise ValueError(f"Unknown metrics in widths: {unknown}")
+                stats = {metric: summarize(column, confidence, percentiles) for metric, column in values[name].items()}
+                unmet = {
+                    metric: stats[metric]["ci_width"]
+                    for metric, width in widths.items()
+                    if stats[metric]["ci_width"] > width
+                }
+                report.update(seeds=[seed_start, seed_start + count - 1], unmet=unmet, stats=stats)
+                if not unmet or count >= max_seeds:
+                    report["converged"] = not unmet
+                    del target[name]
+                    continue
+                needed = max(math.ceil(count * (wide / widths[metric]) ** 2) for metric, wide in unmet.items())
+                target[name] = min(max_seeds, max(count + 1, min(needed, math.ceil(count * growth))))
+    return reports
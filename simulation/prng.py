@@ -1,8 +1,11 @@
-
 # Minimal PCG32 PRNG for deterministic sims (no external deps)
 # Source: public domain style reference implementation, simplified
+from array import array
 from dataclasses import dataclass
 
+_MASK64 = (1 << 64) - 1
+_MULT = 6364136223846793005
+
 @dataclass
 class PCG32:
     state: int
@@ -22,3 +25,47 @@ class PCG32:
         # inclusive a..b
         span = b - a + 1
         return a + int(self.random() * span)
+
+    def fill_u32(self, count: int) -> array:
+        # Bulk next_u32(): same draws, one tight loop on locals instead of `count` method calls
+        out = array("I", bytes(4 * max(0, count)))
+        state = self.state & _MASK64
+        inc = (self.inc | 1) & _MASK64
+        for i in range(len(out)):
+            old = state
+            state = (old * _MULT + inc) & _MASK64
+            xorshifted = (((old >> 18) ^ old) >> 27) & 0xFFFFFFFF
+            rot = old >> 59
+            out[i] = (xorshifted >> rot) | ((xorshifted << ((-rot) & 31)) & 0xFFFFFFFF)
+        self.state = state
+        return out
+
+    def fill_random(self, count: int) -> array:
+        # Bulk random(): float64 array matching `count` successive random() calls
+        return array("d", [value / 2**32 for value in self.fill_u32(count)])
+
+    def advance(self, delta: int) -> "PCG32":
+        # O(log n) jump-ahead (Brown, "Random Number Generation with Arbitrary Stride").
+        # Negative deltas wrap modulo 2**64, so the stream can also be rewound.
+        delta &= _MASK64
+        cur_mult = _MULT
+        cur_plus = (self.inc | 1) & _MASK64
+        acc_mult = 1
+        acc_plus = 0
+        while delta:
+            if delta & 1:
+                acc_mult = (acc_mult * cur_mult) & _MASK64
+                acc_plus = (acc_plus * cur_mult + cur_plus) & _MASK64
+            cur_plus = ((cur_mult + 1) * cur_plus) & _MASK64
+            cur_mult = (cur_mult * cur_mult) & _MASK64
+            delta >>= 1
+        self.state = (acc_mult * (self.state & _MASK64) + acc_plus) & _MASK64
+        return self
+
+
+def fill_u32_across(rngs: "list[PCG32]") -> array:
+    # One draw from each generator (e.g. one per campaign in a sweep), advancing each in place
+    out = array("I", bytes(4 * len(rngs)))
+    for i, rng in enumerate(rngs):
+        out[i] = rng.next_u32()
+    return out
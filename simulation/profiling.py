@@ -0,0 +1,95 @@
+"""Opt-in instrumentation for the scalar day loop.
+
+Pass a :class:`PhaseProfiler` as ``run_economy_sim(cfg, profiler=...)`` to time each
+phase of the loop, count how often each rule branch fires and call hooks at the end of
+every day. Without a profiler the loop only pays one ``is not None`` test per phase
+boundary. The batch engine is not instrumented; profile a suspicious config through
+the scalar engine, which produces the same numbers.
+"""
+
+from __future__ import annotations
+
+import time
+from typing import Any, Callable, Dict, Iterable, Tuple
+
+# Loop phases in execution order; "record" covers the log entry and state sync.
+PHASES: Tuple[str, ...] = (
+    "encounter_flux",
+    "ritual_planning",
+    "spike_guard",
+    "economy",
+    "fear_morale",
+    "faith_recovery",
+    "guardrail",
+    "retirement_rite",
+    "record",
+)
+BRANCHES: Tuple[str, ...] = (
+    "courage_ritual_skipped",
+    "ward_beads_used",
+    "spike_guard_used",
+    "courage_ritual_used",
+    "guardian_active",
+    "courage_resistance_active",
+    "morale_collapse",
+    "reflection_prayer_used",
+    "voluntary_retirement",
+)
+
+DayHook = Callable[[Any], None]
+
+
+class PhaseProfiler:
+    """Per-phase wall-clock timers, branch counters and end-of-day hooks.
+
+    Each hook is called as ``hook(state)`` with the :class:`~simulation.sim.SimState`
+    already synced for the finished day. ``timers=False`` keeps only the counters and
+    hooks, which avoids the clock reads when only branch frequencies matter.
+    """
+
+    __slots__ = ("timers", "hooks", "days", "phase_ns", "branches", "_last")
+
+    def __init__(self, timers: bool = True, hooks: Iterable[DayHook] = ()) -> None:
+        self.timers = timers
+        self.hooks = list(hooks)
+        self.days = 0
+        self.phase_ns: Dict[str, int] = dict.fromkeys(PHASES, 0)
+        self.branches: Dict[str, int] = dict.fromkeys(BRANCHES, 0)
+        self._last = 0
+
+    def start_day(self) -> None:
+        if self.timers:
+            self._last = time.perf_counter_ns()
+
+    def mark(self, phase: str) -> None:
+        """Close ``phase``: charge it the time since the previous mark."""
+
+        if self.timers:
+            now = time.perf_counter_ns()
+            self.phase_ns[phase] += now - self._last
+            self._last = now
+
+    def branch(self, name: str) -> None:
+        self.branches[name] += 1
+
+    def end_day(self, state: Any) -> None:
+        self.mark("record")
+        self.days += 1
+        for hook in self.hooks:
+            hook(state)
+
+    def as_dict(self) -> Dict[str, Any]:
+        """JSON-ready profile: per-phase totals, means and shares, plus branch counts."""
+
+        payload: Dict[str, Any] = {"days": self.days, "branches": dict(self.branches)}
+        if self.timers:
+            total = sum(self.phase_ns.values()) or 1
+            payload["phases"] = {
+                phase: {
+                    "total_ms": round(elapsed / 1e6, 4),
+                    "mean_us": round(elapsed / 1e3 / self.days, 4) if self.days else 0.0,
+                    "share": round(elapsed / total, 4),
+                }
+                for phase, elapsed in self.phase_ns.items()
+            }
+        return payload
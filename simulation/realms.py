@@ -0,0 +1,388 @@
+"""Multi-realm campaigns: several realms progressing concurrently on one Sanctum.
+
+:class:`RealmArrays` holds per-realm state (tier, corruption, stage progress) as
+parallel typed arrays, so each extra realm adds one element per column and one pass of
+the inner loop per day, and the cost grows linearly with the realm count.
+:func:`run_realms_sim` mirrors :func:`simulation.sim.run_economy_sim` for the shared
+party and Sanctum, and adds per-realm dynamics tuned by :class:`RealmRules`:
+
+- Every realm rolls its own encounter flux. Realm 0 keeps the campaign's PCG32 stream;
+  realm ``i > 0`` draws from the SeedBook ``realm|i`` stream, so adding realms never
+  shifts the draws of existing ones.
+- Corruption grows each day, faster on higher tiers, and Faith (scaled by harmony
+  efficiency) purifies it. Corruption raises the fear each encounter causes and
+  inflates the realm's ekwan upkeep.
+- Cleared encounters, discounted by corruption, fill stages. Every
+  ``stages_per_tier`` stages the realm is restored one tier, and the restoration
+  spills corruption into the next realm (GDD: "each restored Realm increases
+  corruption in the next").
+- The party faces the mean encounter pressure across realms; the Sanctum pays the
+  summed upkeep.
+
+With one realm and every :class:`RealmRules` coefficient at zero, the run replays
+``run_economy_sim`` bit for bit.
+"""
+
+from __future__ import annotations
+
+from array import array
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, Iterable, List, Optional
+
+from .curves import clamp, ekwan_upkeep_table, morale_decay_step
+from .daylog import ColumnarDailyLog, RunningSummary
+from .models import RealmState
+from .seedbook import SeedService, derive_for_realm
+from .sim import (
+    DailyLog,
+    SimConfig,
+    _economy_tick,
+    _faith_guardrail,
+    _fear_gain_multiplier,
+    _log_row,
+    _retirement_rite,
+    _sanctum_drift,
+    config_payload,
+    initial_state,
+)
+
+# The scalar loop's modes minus "events": these engines don't build an EventLog.
+REALM_LOG_MODES = ("dicts", "columnar", "summary")
+
+MAX_TIER = 10
+
+
+@dataclass(frozen=True)
+class RealmRules:
+    """Per-realm dynamics; zero every coefficient to freeze realms at their start."""
+
+    corruption_growth: float = 0.3  # corruption per day on a tier-1 realm
+    corruption_growth_per_tier: float = 0.1  # extra growth share per tier above 1
+    purification: float = 0.5  # corruption cleansed per day at Faith 100, efficiency 1.0
+    corruption_fear: float = 0.5  # fear per encounter grows by this share at corruption 100
+    corruption_upkeep: float = 0.25  # ekwan upkeep grows by this share at corruption 100
+    encounters_per_stage: float = 20.0
+    stages_per_tier: int = 5  # 0 keeps tiers fixed
+    restoration_spill: float = 5.0  # corruption pushed into the next realm on restoration
+
+    @classmethod
+    def frozen(cls) -> "RealmRules":
+        """Rules under which realms never change (one realm then matches the scalar loop)."""
+        return cls(
+            corruption_growth=0.0,
+            corruption_growth_per_tier=0.0,
+            purification=0.0,
+            corruption_fear=0.0,
+            corruption_upkeep=0.0,
+            stages_per_tier=0,
+            restoration_spill=0.0,
+        )
+
+
+class RealmArrays:
+    """Struct-of-arrays realm state: element ``i`` of each column belongs to realm ``i``."""
+
+    __slots__ = ("realm_ids", "tier", "corruption", "stage_index", "stage_progress", "encounter_cursor")
+
+    def __init__(self) -> None:
+        self.realm_ids: List[str] = []
+        self.tier = array("i")
+        self.corruption = array("d")
+        self.stage_index = array("i")
+        self.stage_progress = array("d")
+        self.encounter_cursor = array("q")
+
+    def __len__(self) -> int:
+        return len(self.realm_ids)
+
+    def add(
+        self,
+        tier: int = 1,
+        corruption: float = 25.0,
+        realm_id: Optional[str] = None,
+        stage_index: int = 0,
+        encounter_cursor: int = 0,
+    ) -> int:
+        self.realm_ids.append(realm_id or f"realm_{len(self.realm_ids)}")
+        self.tier.append(int(clamp(tier, 1, MAX_TIER)))
+        self.corruption.append(clamp(float(corruption), 0.0, 100.0))
+        self.stage_index.append(stage_index)
+        self.stage_progress.append(0.0)
+        self.encounter_cursor.append(encounter_cursor)
+        return len(self.realm_ids) - 1
+
+    @classmethod
+    def uniform(cls, count: int, tier: int = 1, corruption: float = 25.0) -> "RealmArrays":
+        realms = cls()
+        for _ in range(count):
+            realms.add(tier, corruption)
+        return realms
+
+    @classmethod
+    def from_states(cls, states: Iterable[RealmState]) -> "RealmArrays":
+        realms = cls()
+        for state in states:
+            realms.add(state.tier, state.corruption)
+        return realms
+
+    def to_states(self) -> List[RealmState]:
+        return [RealmState(tier=tier, corruption=corruption) for tier, corruption in zip(self.tier, self.corruption)]
+
+    @classmethod
+    def from_save(cls, payload: Iterable[Dict[str, Any]]) -> "RealmArrays":
+        """Load a ``realm_states`` save block; corruption lives in ``modifiers``."""
+
+        realms = cls()
+        for realm in payload:
+            realms.add(
+                tier=realm["tier"],
+                corruption=realm.get("modifiers", {}).get("corruption", 25.0),
+                realm_id=realm["realm_id"],
+                stage_index=realm.get("stage_index", 0),
+                encounter_cursor=realm.get("encounter_cursor", 0),
+            )
+        return realms
+
+    def to_save(self, campaign_seed: int) -> List[Dict[str, Any]]:
+        """``realm_states`` save block; ``realm_seed`` is the SeedBook realm seed."""
+
+        return [
+            {
+                "realm_id": self.realm_ids[index],
+                "tier": self.tier[index],
+                "realm_seed": str(derive_for_realm(campaign_seed, index)),
+                "stage_index": self.stage_index[index],
+                "encounter_cursor": self.encounter_cursor[index],
+                "modifiers": {"corruption": round(self.corruption[index], 2)},
+            }
+            for index in range(len(self))
+        ]
+
+    def copy(self) -> "RealmArrays":
+        clone = RealmArrays()
+        clone.realm_ids = list(self.realm_ids)
+        for name in ("tier", "corruption", "stage_index", "stage_progress", "encounter_cursor"):
+            column = getattr(self, name)
+            setattr(clone, name, array(column.typecode, column))
+        return clone
+
+
+def run_realms_sim(
+    cfg: SimConfig,
+    realms: RealmArrays,
+    rules: RealmRules = RealmRules(),
+    log_mode: str = "dicts",
+) -> Dict[str, Any]:
+    """Run ``cfg``'s campaign across every realm in ``realms`` (which is not modified).
+
+    ``cfg.realm_tier`` is ignored; each realm starts from its own tier. The report has
+    the ``run_economy_sim`` shape for ``log_mode`` (``ekwan_spend`` is the summed upkeep)
+    plus ``"realms"``, the final ``realm_states`` save block.
+    """
+
+    if log_mode not in REALM_LOG_MODES:
+        raise ValueError(f"log_mode must be one of {REALM_LOG_MODES}, received '{log_mode}'")
+    count = len(realms)
+    if not count:
+        raise ValueError("need at least one realm")
+
+    realms = realms.copy()
+    state = initial_state(cfg)
+    sanctum = state.sanctum
+    seeds = SeedService(cfg.campaign_seed)
+    draws = [state.rng.random] + [seeds.rng_for_realm(index).next_float for index in range(1, count)]
+
+    # Hot columns live in lists for the loop (cheaper element access than arrays).
+    tiers = realms.tier.tolist()
+    corruption = realms.corruption.tolist()
+    stage_index = realms.stage_index.tolist()
+    stage_progress = realms.stage_progress.tolist()
+    cursor = realms.encounter_cursor.tolist()
+    upkeep_table = ekwan_upkeep_table(cfg.base_ekwan_cost, MAX_TIER)
+    growth = [rules.corruption_growth * (1.0 + rules.corruption_growth_per_tier * (tier - 1)) for tier in tiers]
+    stage_target = rules.encounters_per_stage
+    stages_per_tier = rules.stages_per_tier
+    indices = range(count)
+
+    morale = state.morale
+    fear = state.fear
+    legacy_fragments = 0
+    voluntary_retirements = 0
+    courage_days = set(cfg.courage_ritual_days) or set(cfg.courage_auto_days)
+    ward_beads_days = set(cfg.ward_beads_days)
+    auto_ward_schedule: set[int] = set()
+    if not ward_beads_days and cfg.ward_beads_charges > 0:
+        auto_ward_schedule = set(cfg.ward_beads_auto_days)
+    ward_bead_charges_remaining = state.ward_bead_charges_remaining
+    courage_resistance_remaining = 0
+    spike_guard_prevented_days = 0
+    faith_guardrail_streak = 0
+    restorations = 0
+
+    log: List[DailyLog] = []
+    columns = ColumnarDailyLog(cfg.days) if log_mode == "columnar" else None
+    summary = RunningSummary() if log_mode == "summary" else None
+
+    for day in range(1, cfg.days + 1):
+        fear = clamp(fear - 5.0, 0.0, 100.0)
+        morale = clamp(morale + 5.0, 0.0, 100.0)
+
+        encounters = [max(1, int(round(cfg.encounters_per_day * (0.9 + 0.2 * draw())))) for draw in draws]
+        pressure = 0.0
+        ekwan_spend = 0.0
+        for r in indices:
+            share = corruption[r] / 100.0
+            pressure += encounters[r] * cfg.fear_per_encounter * (1.0 + rules.corruption_fear * share)
+            ekwan_spend += upkeep_table[tiers[r]] * (1.0 + rules.corruption_upkeep * share)
+        pressure /= count
+        encounters_today = sum(encounters) / count
+
+        planned_courage = day in courage_days
+        courage_ritual_skipped = False
+        if planned_courage and cfg.skip_courage_when_comfortable and fear < 60.0 and morale > 70.0:
+            courage_ritual_skipped = True
+            planned_courage = False
+
+        ward_beads_today = False
+        if (day in ward_beads_days or day in auto_ward_schedule) and ward_bead_charges_remaining > 0:
+            ward_beads_today = True
+            ward_bead_charges_remaining -= 1
+
+        forecast_fear = clamp(fear + pressure, 0.0, 100.0)
+        spike_guard_today = False
+        if cfg.spike_guard_enabled and forecast_fear >= cfg.spike_guard_threshold:
+            spike_guard_today = True
+            fear = clamp(fear - 18.0, 0.0, 100.0)
+            morale = clamp(morale + 12.0, 0.0, 100.0)
+            spike_guard_prevented_days += 1
+
+        harmony_eff, ase_yield, sanctum.ekwan, sanctum.ase = _economy_tick(
+            cfg.base_ase_tick, sanctum.faith, sanctum.harmony, sanctum.ekwan, sanctum.ase, ekwan_spend
+        )
+
+        courage_ritual_today = planned_courage
+        if courage_ritual_today:
+            fear = clamp(fear - 20.0, 0.0, 100.0)
+            morale = clamp(morale + 25.0, 0.0, 100.0)
+            courage_resistance_remaining = max(courage_resistance_remaining, 8)
+
+        guardian_today = cfg.guardian_present or sanctum.favor >= 65.0
+        resisting = courage_resistance_remaining > 0
+        fear_gain_multiplier = _fear_gain_multiplier(guardian_today, resisting, ward_beads_today, spike_guard_today)
+        fear = clamp(fear + pressure * fear_gain_multiplier, 0.0, 100.0)
+        morale = clamp(morale_decay_step(morale, fear, guardian=guardian_today), 0.0, 100.0)
+        if courage_resistance_remaining > 0:
+            fear = clamp(fear - 5.0, 0.0, 100.0)
+        if morale <= 0.0:
+            legacy_fragments += 1
+            morale = 45.0
+            fear = clamp(fear * 0.6, 0.0, 100.0)
+
+        prior_faith = sanctum.faith
+        sanctum.faith, sanctum.harmony, sanctum.favor = _sanctum_drift(
+            sanctum.faith, sanctum.harmony, sanctum.favor, fear, encounters_today
+        )
+        faith_recovered = sanctum.faith - prior_faith
+
+        # Purification reads the day's recovered Faith, scaled by the harmony efficiency
+        # the ase yield used (the opening harmony), before the guardrail can lift Faith.
+        cleanse = rules.purification * harmony_eff * sanctum.faith / 100.0
+        for r in indices:
+            share = corruption[r]
+            corruption[r] = max(0.0, min(100.0, share + growth[r] - cleanse))
+            cursor[r] += encounters[r]
+            if stages_per_tier <= 0:
+                continue
+            stage_progress[r] += encounters[r] * (1.0 - share / 100.0)
+            while stage_progress[r] >= stage_target:
+                stage_progress[r] -= stage_target
+                stage_index[r] += 1
+                if stage_index[r] % stages_per_tier == 0 and tiers[r] < MAX_TIER:
+                    tiers[r] += 1
+                    growth[r] = rules.corruption_growth * (1.0 + rules.corruption_growth_per_tier * (tiers[r] - 1))
+                    restorations += 1
+                    if r + 1 < count:
+                        corruption[r + 1] = min(100.0, corruption[r + 1] + rules.restoration_spill)
+
+        sanctum.faith, sanctum.ase, faith_guardrail_streak, reflection_prayer_used = _faith_guardrail(
+            cfg, sanctum.faith, sanctum.ase, faith_guardrail_streak
+        )
+
+        sanctum.favor, spike_guard_prevented_days, voluntary_retirement_today = _retirement_rite(
+            cfg, spike_guard_today, spike_guard_prevented_days, sanctum.favor
+        )
+        if voluntary_retirement_today:
+            legacy_fragments += 1
+            voluntary_retirements += 1
+
+        if summary is not None:
+            summary.update(
+                ase_yield,
+                morale,
+                fear,
+                courage_ritual_today,
+                ward_beads_today,
+                courage_ritual_skipped,
+                spike_guard_today,
+                reflection_prayer_used,
+                voluntary_retirement_today,
+            )
+        else:
+            entry = DailyLog(
+                *_log_row(
+                    day,
+                    sanctum.ase,
+                    sanctum.faith,
+                    sanctum.harmony,
+                    sanctum.favor,
+                    morale,
+                    fear,
+                    ase_yield,
+                    ekwan_spend,
+                    harmony_eff,
+                    faith_recovered,
+                    legacy_fragments,
+                    courage_ritual_today,
+                    ward_beads_today,
+                    courage_ritual_skipped,
+                    spike_guard_today,
+                    reflection_prayer_used,
+                    voluntary_retirement_today,
+                )
+            )
+            if columns is not None:
+                columns.append(entry)
+            else:
+                log.append(entry)
+
+        if courage_resistance_remaining > 0:
+            courage_resistance_remaining -= 1
+
+    realms.tier = array("i", tiers)
+    realms.corruption = array("d", corruption)
+    realms.stage_index = array("i", stage_index)
+    realms.stage_progress = array("d", stage_progress)
+    realms.encounter_cursor = array("q", cursor)
+
+    result: Dict[str, Any] = {
+        "config": config_payload(cfg),
+        "final": {
+            "ase": round(sanctum.ase, 2),
+            "faith": round(sanctum.faith, 2),
+            "harmony": round(sanctum.harmony, 2),
+            "favor": round(sanctum.favor, 2),
+            "morale": round(morale, 2),
+            "fear": round(fear, 2),
+            "legacy_fragments": legacy_fragments,
+            "voluntary_retirements": voluntary_retirements,
+            "realm_count": count,
+            "realm_restorations": restorations,
+            "corruption_mean": round(sum(corruption) / count, 2),
+        },
+    }
+    if summary is not None:
+        result["summary"] = summary.as_dict()
+    else:
+        result["log"] = columns if columns is not None else [asdict(entry) for entry in log]
+    result["realms"] = realms.to_save(cfg.campaign_seed)
+    return result
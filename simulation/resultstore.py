@@ -0,0 +1,298 @@
+"""Columnar binary container for sim run results (``.simres``).
+
+JSON reports are convenient for single runs but dominate wall time and disk at sweep
+scale. A ``.simres`` file stores the same payloads as two column tables:
+
+- a **run table**, one row per run: ``run_id``, every ``config.*``, ``final.*`` and
+  (when present) ``summary.*`` and ``stop.*`` field, plus ``log_start``/``log_rows``
+  pointing into the day table;
+- a **day table**, one row per logged day: ``run_id`` and every ``DailyLog`` field.
+
+Layout: 8-byte magic, little-endian uint64 header length, a JSON header describing
+each column's type, offset and length, then the column buffers, each 8-byte aligned.
+Numeric columns are raw ``array`` buffers, so :class:`ResultStore` can ``mmap`` the
+file and hand out zero-copy ``memoryview`` columns; dict payloads are only rebuilt
+when a caller asks for one.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import mmap
+import struct
+import sys
+from array import array
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from .daylog import FLAG_FIELDS, FLOAT_FIELDS, INT_FIELDS, LOG_FIELDS
+
+MAGIC = b"SNKFRES1"
+RESULT_SUFFIX = ".simres"
+_ALIGN = 8
+_RUN_SECTIONS = ("config", "final", "summary", "stop")
+_PAYLOAD_KEYS = frozenset(("run_id", "log") + _RUN_SECTIONS)
+_LITTLE_ENDIAN = sys.byteorder == "little"
+
+
+def _infer_type(values: List[Any]) -> str:
+    """Pick the narrowest column encoding for one run-table column."""
+
+    present = [value for value in values if value is not None]
+    if not present:
+        return "d"
+    if all(isinstance(value, bool) for value in present):
+        return "B" if len(present) == len(values) else "json"
+    if all(isinstance(value, int) and not isinstance(value, bool) for value in present):
+        if len(present) != len(values):
+            return "json"
+        low, high = min(present), max(present)
+        if low >= 0 and high < 1 << 64:
+            return "Q"
+        if -(1 << 63) <= low and high < 1 << 63:
+            return "q"
+        return "json"
+    if all(isinstance(value, (int, float)) and not isinstance(value, bool) for value in present):
+        return "d"
+    return "json"
+
+
+def _encode_column(kind: str, values: Iterable[Any]) -> bytes:
+    if kind == "json":
+        return json.dumps(list(values), separators=(",", ":")).encode("utf-8")
+    if kind == "d":
+        column = array("d", (math.nan if value is None else float(value) for value in values))
+    else:
+        column = array(kind, (int(value) for value in values))
+    if not _LITTLE_ENDIAN:  # pragma: no cover - stored little-endian everywhere
+        column.byteswap()
+    return column.tobytes()
+
+
+class _DayTableBuilder:
+    """Accumulates day rows straight into typed arrays while results stream in."""
+
+    def __init__(self) -> None:
+        self.columns: Dict[str, array] = {"run_id": array("q")}
+        for name in INT_FIELDS:
+            self.columns[name] = array("q")
+        for name in FLOAT_FIELDS:
+            self.columns[name] = array("d")
+        for name in FLAG_FIELDS:
+            self.columns[name] = array("B")
+
+    @property
+    def rows(self) -> int:
+        return len(self.columns["run_id"])
+
+    def extend(self, run_id: int, log: Iterable[Dict[str, Any]]) -> int:
+        added = 0
+        columns = self.columns
+        for entry in log:
+            columns["run_id"].append(run_id)
+            for name in LOG_FIELDS:
+                columns[name].append(entry[name])
+            added += 1
+        return added
+
+
+def write_results(path: Path, results: Iterable[Dict[str, Any]]) -> int:
+    """Write run payloads (``run_economy_sim`` shape) to ``path``; returns the run count.
+
+    Payloads without a ``run_id`` are numbered by position. Day logs may be dict lists
+    or :class:`~simulation.daylog.ColumnarDailyLog` instances. A payload with any other
+    top-level key (roster, realm, profile, long-horizon or event-log blocks) raises
+    ``ValueError`` rather than being stored without it.
+    """
+
+    run_values: Dict[str, List[Any]] = {"run_id": [], "log_start": [], "log_rows": []}
+    days = _DayTableBuilder()
+    count = 0
+    for position, payload in enumerate(results):
+        run_id = payload.get("run_id", position)
+        unknown = sorted(set(payload) - _PAYLOAD_KEYS)
+        if unknown:
+            raise ValueError(f"run {run_id} has blocks a {RESULT_SUFFIX} file cannot store: {', '.join(unknown)}")
+        row: Dict[str, Any] = {"run_id": run_id, "log_start": days.rows}
+        for section in _RUN_SECTIONS:
+            for key, value in (payload.get(section) or {}).items():
+                row[f"{section}.{key}"] = list(value) if isinstance(value, tuple) else value
+        row["log_rows"] = days.extend(run_id, payload.get("log") or ())
+
+        for name in row:
+            if name not in run_values:
+                run_values[name] = [None] * count
+        for name, column in run_values.items():
+            column.append(row.get(name))
+        count += 1
+
+    header: Dict[str, Any] = {"version": 1, "runs": count, "day_rows": days.rows}
+    blobs: List[bytes] = []
+    offset = 0
+
+    def _add(kind: str, data: bytes) -> Dict[str, Any]:
+        nonlocal offset
+        spec = {"type": kind, "offset": offset, "nbytes": len(data)}
+        padding = -len(data) % _ALIGN
+        blobs.append(data + b"\0" * padding)
+        offset += len(data) + padding
+        return spec
+
+    header["run_columns"] = {}
+    for name, values in run_values.items():
+        kind = _infer_type(values)
+        header["run_columns"][name] = _add(kind, _encode_column(kind, values))
+    header["day_columns"] = {}
+    for name, column in days.columns.items():
+        if not _LITTLE_ENDIAN:  # pragma: no cover
+            column.byteswap()
+        header["day_columns"][name] = _add(column.typecode, column.tobytes())
+
+    header_bytes = json.dumps(header, separators=(",", ":")).encode("utf-8")
+    header_bytes += b" " * (-(len(MAGIC) + 8 + len(header_bytes)) % _ALIGN)
+
+    path = Path(path)
+    tmp_path = path.with_name(path.name + ".tmp")
+    with tmp_path.open("wb") as handle:
+        handle.write(MAGIC)
+        handle.write(struct.pack("<Q", len(header_bytes)))
+        handle.write(header_bytes)
+        for blob in blobs:
+            handle.write(blob)
+    tmp_path.replace(path)
+    return count
+
+
+class ResultStore:
+    """Memory-mapped reader for ``.simres`` files.
+
+    ``run_column``/``day_column`` return zero-copy ``memoryview`` columns (``json`` run
+    columns are decoded to lists). Iterating yields full payload dicts for callers that
+    still want the JSON report shape.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = Path(path)
+        with self.path.open("rb") as handle:
+            try:
+                self._map: Optional[mmap.mmap] = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError as exc:  # zero-length file
+                raise ValueError(f"{self.path} is not a sim result file") from exc
+        if self._map[: len(MAGIC)] != MAGIC:
+            self._map.close()
+            raise ValueError(f"{self.path} is not a sim result file")
+        (header_len,) = struct.unpack_from("<Q", self._map, len(MAGIC))
+        data_start = len(MAGIC) + 8
+        self.header: Dict[str, Any] = json.loads(bytes(self._map[data_start : data_start + header_len]))
+        self._data_start = data_start + header_len
+        self._view = memoryview(self._map)
+        self._json_cache: Dict[str, List[Any]] = {}
+
+    def __enter__(self) -> "ResultStore":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Unmap the file. Column views still held by callers keep the mapping alive
+        until they are released; the store itself is unusable afterwards."""
+
+        if self._map is not None:
+            self._json_cache.clear()
+            self._view.release()
+            try:
+                self._map.close()
+            except BufferError:
+                pass  # outstanding column views; the mapping is freed with them
+            self._map = None
+
+    @property
+    def runs(self) -> int:
+        return self.header["runs"]
+
+    @property
+    def day_rows(self) -> int:
+        return self.header["day_rows"]
+
+    @property
+    def run_column_names(self) -> List[str]:
+        return list(self.header["run_columns"])
+
+    def _column(self, spec: Dict[str, Any]):
+        start = self._data_start + spec["offset"]
+        raw = self._view[start : start + spec["nbytes"]]
+        if spec["type"] == "json":
+            return json.loads(bytes(raw))
+        if not _LITTLE_ENDIAN:  # pragma: no cover
+            column = array(spec["type"], bytes(raw))
+            column.byteswap()
+            return memoryview(column)
+        return raw.cast(spec["type"])
+
+    def run_column(self, name: str):
+        spec = self.header["run_columns"][name]
+        if spec["type"] == "json":
+            if name not in self._json_cache:
+                self._json_cache[name] = self._column(spec)
+            return self._json_cache[name]
+        return self._column(spec)
+
+    def day_column(self, name: str, run_index: Optional[int] = None):
+        """Whole day-table column, or just one run's slice when ``run_index`` is given."""
+
+        column = self._column(self.header["day_columns"][name])
+        if run_index is None:
+            return column
+        start = self.run_column("log_start")[run_index]
+        return column[start : start + self.run_column("log_rows")[run_index]]
+
+    def _run_value(self, name: str, index: int) -> Any:
+        kind = self.header["run_columns"][name]["type"]
+        value = self.run_column(name)[index]
+        if kind == "B":
+            return bool(value)
+        if kind == "d" and math.isnan(value):
+            return None
+        if kind == "json" and isinstance(value, list) and name.startswith("config."):
+            return tuple(value)
+        return value
+
+    def payload(self, index: int) -> Dict[str, Any]:
+        """Rebuild run ``index`` in the ``run_economy_sim`` report shape (plus ``run_id``)."""
+
+        payload: Dict[str, Any] = {}
+        for name in self.header["run_columns"]:
+            section, _, key = name.partition(".")
+            if key:
+                payload.setdefault(section, {})[key] = self._run_value(name, index)
+        # Sections are per-file columns; drop the ones this run never had (all None).
+        for section in [s for s, values in payload.items() if all(v is None for v in values.values())]:
+            del payload[section]
+        rows = self.run_column("log_rows")[index]
+        if rows or "summary" not in payload:
+            start = self.run_column("log_start")[index]
+            columns = {name: self.day_column(name) for name in LOG_FIELDS}
+            log = []
+            for row in range(start, start + rows):
+                entry = {name: columns[name][row] for name in LOG_FIELDS}
+                for flag in FLAG_FIELDS:
+                    entry[flag] = bool(entry[flag])
+                log.append(entry)
+            payload["log"] = log
+        payload["run_id"] = self.run_column("run_id")[index]
+        return payload
+
+    def __len__(self) -> int:
+        return self.runs
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        for index in range(self.runs):
+            yield self.payload(index)
+
+
+def open_results(path: Path) -> ResultStore:
+    """Open a ``.simres`` file for memory-mapped reading."""
+
+    return ResultStore(path)
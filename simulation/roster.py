@@ -0,0 +1,466 @@
+"""Multi-hero roster mode for the MVP loop.
+
+:class:`HeroRoster` keeps each hero attribute in its own parallel column (typed
+arrays for the numbers, plain lists for strings), so a 500-hero party costs a few
+kilobytes instead of 500 dataclass instances. :func:`run_roster_sim` drives the same
+Sanctum economy as :func:`simulation.sim.run_economy_sim` while every hero carries
+their own morale, fear and legacy fragments:
+
+- Rituals, Spike Guard and Guardian mitigation apply party-wide; the Spike Guard
+  forecast and the comfortable-skip check look at the most fearful hero and the
+  lowest morale.
+- Fear gain is scaled per hero by courage (``1 - (courage - 50) / 200``) and the daily
+  morale rebound by resolve (``5 * (1 + (resolve - 50) / 200)``); neutral traits (50)
+  leave both at the scalar loop's values.
+- A morale collapse earns that hero a legacy fragment and resets them (canon §12.6).
+- The retirement rite retires the most fearful hero into ``retired``; a successor
+  with the same name, traits and lineage takes the slot at starting morale and fear.
+- Harmony reads the party's mean fear; the day log reports party means.
+
+The Sanctum, guardrail and retirement rules are the scalar loop's own per-day helpers.
+A neutral-trait roster of 1, 2, 4, ... heroes replays ``run_economy_sim`` bit for bit
+until the first retirement (each hero books their own collapse fragments). The roster maps onto the ``hero_roster`` save schema through
+:meth:`HeroRoster.from_save` and :meth:`HeroRoster.to_save`; ``recovering`` and
+``fallen`` heroes are carried through untouched because the sim does not model them.
+"""
+
+from __future__ import annotations
+
+from array import array
+from dataclasses import asdict
+from math import fsum
+from typing import Any, Dict, Iterable, List, Optional
+
+from .curves import clamp, ekwan_upkeep_table, morale_decay_step
+from .daylog import ColumnarDailyLog, RunningSummary
+from .models import Hero
+from .seedbook import SeedService
+from .sim import (
+    DailyLog,
+    SimConfig,
+    _economy_tick,
+    _faith_guardrail,
+    _fear_gain_multiplier,
+    _log_row,
+    _retirement_rite,
+    _sanctum_drift,
+    config_payload,
+    initial_state,
+)
+
+# The scalar loop's modes minus "events": these engines don't build an EventLog.
+ROSTER_LOG_MODES = ("dicts", "columnar", "summary")
+
+TRAITS = ("courage", "ambition", "empathy", "wisdom", "discipline", "resolve")
+ROSTER_SECTIONS = ("active", "recovering", "retired", "fallen")
+NEUTRAL_TRAIT = 50
+STARTING_MORALE = 80.0
+STARTING_FEAR = 25.0
+# Optional per-hero schema fields kept for round-trips; the sim never reads them.
+_EXTRA_FIELDS = ("conditions", "bonds", "history")
+
+
+class HeroRoster:
+    """Struct-of-arrays hero roster: column ``name[i]`` belongs to active hero ``i``."""
+
+    __slots__ = (
+        "ids",
+        "names",
+        "lineage",
+        "morale",
+        "fear",
+        "hp",
+        "legacy_fragments",
+        "traits",
+        "extras",
+        "recovering",
+        "retired",
+        "fallen",
+        "_next_id",
+    )
+
+    def __init__(self) -> None:
+        self.ids: List[str] = []
+        self.names: List[str] = []
+        self.lineage: List[Optional[str]] = []
+        self.morale = array("d")
+        self.fear = array("d")
+        self.hp = array("i")
+        self.legacy_fragments = array("i")
+        self.traits: Dict[str, array] = {trait: array("B") for trait in TRAITS}
+        self.extras: List[Dict[str, Any]] = []
+        self.recovering: List[Dict[str, Any]] = []
+        self.retired: List[Dict[str, Any]] = []
+        self.fallen: List[Dict[str, Any]] = []
+        self._next_id = 1
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def add(
+        self,
+        name: str,
+        morale: float = STARTING_MORALE,
+        fear: float = STARTING_FEAR,
+        traits: Optional[Dict[str, int]] = None,
+        hp: int = 100,
+        hero_id: Optional[str] = None,
+        lineage_id: Optional[str] = None,
+        **extras: Any,
+    ) -> int:
+        """Append an active hero and return their index; missing traits are neutral."""
+
+        if hero_id is None:
+            hero_id = f"h{self._next_id:04d}"
+            self._next_id += 1
+        traits = traits or {}
+        self.ids.append(str(hero_id))
+        self.names.append(name)
+        self.lineage.append(lineage_id)
+        self.morale.append(clamp(float(morale), 0.0, 100.0))
+        self.fear.append(clamp(float(fear), 0.0, 100.0))
+        self.hp.append(int(hp))
+        self.legacy_fragments.append(0)
+        for trait in TRAITS:
+            self.traits[trait].append(int(clamp(int(traits.get(trait, NEUTRAL_TRAIT)), 0, 100)))
+        self.extras.append({key: list(value) for key, value in extras.items() if key in _EXTRA_FIELDS})
+        return len(self.ids) - 1
+
+    @classmethod
+    def uniform(cls, size: int) -> "HeroRoster":
+        """``size`` neutral-trait heroes at starting morale and fear."""
+
+        roster = cls()
+        for index in range(size):
+            roster.add(f"Hero {index + 1}")
+        return roster
+
+    @classmethod
+    def recruit(cls, size: int, campaign_seed: int, spread: int = 25) -> "HeroRoster":
+        """``size`` heroes with traits rolled within ``50 ± spread`` from the ``roster`` stream."""
+
+        rng = SeedService(campaign_seed).rng_for_system("roster")
+        roster = cls()
+        for index in range(size):
+            traits = {
+                trait: int(round(NEUTRAL_TRAIT + (2.0 * rng.next_float() - 1.0) * spread)) for trait in TRAITS
+            }
+            roster.add(f"Hero {index + 1}", traits=traits)
+        return roster
+
+    @classmethod
+    def from_heroes(cls, heroes: Iterable[Hero]) -> "HeroRoster":
+        """Roster from :class:`~simulation.models.Hero` records.
+
+        ``Hero`` rates courage, wisdom and faith on a 0-10 scale; courage and wisdom are
+        scaled x10 onto the schema's 0-100 traits. ``Hero.faith`` has no schema trait
+        and is dropped.
+        """
+
+        roster = cls()
+        for hero in heroes:
+            traits = {"courage": hero.courage * 10, "wisdom": hero.wisdom * 10}
+            roster.add(hero.name, morale=hero.morale, fear=hero.fear, traits=traits)
+        return roster
+
+    @classmethod
+    def from_save(cls, payload: Dict[str, Any]) -> "HeroRoster":
+        """Load a ``hero_roster`` save block; ``active`` heroes join the simulation."""
+
+        roster = cls()
+        for hero in payload.get("active", []):
+            stats = hero.get("stats", {})
+            extras = {key: hero[key] for key in _EXTRA_FIELDS if key in hero}
+            roster.add(
+                hero["name"],
+                morale=stats.get("morale", STARTING_MORALE),
+                fear=stats.get("fear", STARTING_FEAR),
+                traits=hero.get("traits"),
+                hp=stats.get("hp", 100),
+                hero_id=hero["id"],
+                lineage_id=hero.get("lineage_id"),
+                **extras,
+            )
+        roster.recovering = [dict(hero) for hero in payload.get("recovering", [])]
+        roster.retired = [dict(hero) for hero in payload.get("retired", [])]
+        roster.fallen = [dict(hero) for hero in payload.get("fallen", [])]
+        known = roster.ids + [str(hero.get("id", "")) for hero in roster.recovering + roster.retired + roster.fallen]
+        numeric = [int(hero_id[1:]) for hero_id in known if hero_id[:1] == "h" and hero_id[1:].isdigit()]
+        roster._next_id = max(numeric, default=0) + 1
+        return roster
+
+    def hero_payload(self, index: int) -> Dict[str, Any]:
+        """Schema ``Hero`` object for active hero ``index`` (stats rounded to integers)."""
+
+        payload: Dict[str, Any] = {
+            "id": self.ids[index],
+            "name": self.names[index],
+            "traits": {trait: self.traits[trait][index] for trait in TRAITS},
+            "stats": {
+                "hp": self.hp[index],
+                "morale": int(round(self.morale[index])),
+                "fear": int(round(self.fear[index])),
+            },
+        }
+        if self.lineage[index] is not None:
+            payload["lineage_id"] = self.lineage[index]
+        payload.update(self.extras[index])
+        return payload
+
+    def to_save(self) -> Dict[str, Any]:
+        """``hero_roster`` save block (see ``docs/schemas/json/hero_roster.schema.json``)."""
+
+        return {
+            "active": [self.hero_payload(index) for index in range(len(self))],
+            "recovering": [dict(hero) for hero in self.recovering],
+            "retired": [dict(hero) for hero in self.retired],
+            "fallen": [dict(hero) for hero in self.fallen],
+        }
+
+    def copy(self) -> "HeroRoster":
+        clone = HeroRoster()
+        clone.ids = list(self.ids)
+        clone.names = list(self.names)
+        clone.lineage = list(self.lineage)
+        clone.morale = array("d", self.morale)
+        clone.fear = array("d", self.fear)
+        clone.hp = array("i", self.hp)
+        clone.legacy_fragments = array("i", self.legacy_fragments)
+        clone.traits = {trait: array("B", column) for trait, column in self.traits.items()}
+        clone.extras = [{key: list(value) for key, value in extra.items()} for extra in self.extras]
+        clone.recovering = [dict(hero) for hero in self.recovering]
+        clone.retired = [dict(hero) for hero in self.retired]
+        clone.fallen = [dict(hero) for hero in self.fallen]
+        clone._next_id = self._next_id
+        return clone
+
+    def _retire(self, index: int, day: int) -> None:
+        """Move hero ``index`` to ``retired`` and seat a fresh successor in the slot."""
+
+        record = self.hero_payload(index)
+        record["history"] = list(record.get("history", [])) + [
+            f"retired:day={day}",
+            f"legacy_fragments={self.legacy_fragments[index]}",
+        ]
+        self.retired.append(record)
+        lineage_id = self.lineage[index] or self.ids[index]
+        self.ids[index] = f"h{self._next_id:04d}"
+        self._next_id += 1
+        self.lineage[index] = lineage_id
+        self.morale[index] = STARTING_MORALE
+        self.fear[index] = STARTING_FEAR
+        self.legacy_fragments[index] = 0
+        self.extras[index] = {}
+
+
+def run_roster_sim(cfg: SimConfig, roster: HeroRoster, log_mode: str = "dicts") -> Dict[str, Any]:
+    """Run ``cfg``'s campaign with every hero in ``roster`` tracked individually.
+
+    ``roster`` is not modified. The report has the ``run_economy_sim`` shape for the
+    given ``log_mode``, with party-mean morale and fear, plus ``"roster"`` (the final
+    ``hero_roster`` save block) and ``"hero_legacy_fragments"`` (fragments per active
+    hero id, non-zero only). ``"final"`` also carries ``party_size``.
+    """
+
+    if log_mode not in ROSTER_LOG_MODES:
+        raise ValueError(f"log_mode must be one of {ROSTER_LOG_MODES}, received '{log_mode}'")
+    if not len(roster):
+        raise ValueError("roster needs at least one active hero")
+
+    roster = roster.copy()
+    state = initial_state(cfg)
+    rng = state.rng
+    sanctum = state.sanctum
+    tier = cfg.realm_tier
+    ekwan_spend = ekwan_upkeep_table(cfg.base_ekwan_cost, tier)[max(0, tier)]
+
+    size = len(roster)
+    heroes = range(size)
+    # Hot columns live in lists for the loop (cheaper element access than arrays).
+    morale = roster.morale.tolist()
+    fear = roster.fear.tolist()
+    fragments = roster.legacy_fragments.tolist()
+    fear_scale = [1.0 - (courage - NEUTRAL_TRAIT) / 200.0 for courage in roster.traits["courage"]]
+    rebound = [5.0 * (1.0 + (resolve - NEUTRAL_TRAIT) / 200.0) for resolve in roster.traits["resolve"]]
+
+    courage_days = set(cfg.courage_ritual_days) or set(cfg.courage_auto_days)
+    ward_beads_days = set(cfg.ward_beads_days)
+    auto_ward_schedule: set[int] = set()
+    if not ward_beads_days and cfg.ward_beads_charges > 0:
+        auto_ward_schedule = set(cfg.ward_beads_auto_days)
+
+    legacy_fragments = 0
+    voluntary_retirements = 0
+    ward_bead_charges_remaining = state.ward_bead_charges_remaining
+    courage_resistance_remaining = 0
+    spike_guard_prevented_days = 0
+    faith_guardrail_streak = 0
+
+    log: List[DailyLog] = []
+    columns = ColumnarDailyLog(cfg.days) if log_mode == "columnar" else None
+    summary = RunningSummary() if log_mode == "summary" else None
+
+    for day in range(1, cfg.days + 1):
+        fear_peak = 0.0
+        morale_low = 100.0
+        for i in heroes:
+            value = max(0.0, min(100.0, fear[i] - 5.0))
+            fear[i] = value
+            if value > fear_peak:
+                fear_peak = value
+            value = max(0.0, min(100.0, morale[i] + rebound[i]))
+            morale[i] = value
+            if value < morale_low:
+                morale_low = value
+
+        encounter_flux = 0.9 + 0.2 * rng.random()
+        encounters_today = max(1, int(round(cfg.encounters_per_day * encounter_flux)))
+
+        planned_courage = day in courage_days
+        courage_ritual_skipped = False
+        if planned_courage and cfg.skip_courage_when_comfortable and fear_peak < 60.0 and morale_low > 70.0:
+            courage_ritual_skipped = True
+            planned_courage = False
+
+        ward_beads_today = False
+        if (day in ward_beads_days or day in auto_ward_schedule) and ward_bead_charges_remaining > 0:
+            ward_beads_today = True
+            ward_bead_charges_remaining -= 1
+
+        forecast_fear = clamp(fear_peak + encounters_today * cfg.fear_per_encounter, 0.0, 100.0)
+        spike_guard_today = cfg.spike_guard_enabled and forecast_fear >= cfg.spike_guard_threshold
+        if spike_guard_today:
+            for i in heroes:
+                fear[i] = max(0.0, min(100.0, fear[i] - 18.0))
+                morale[i] = max(0.0, min(100.0, morale[i] + 12.0))
+            spike_guard_prevented_days += 1
+
+        harmony_eff, ase_yield, sanctum.ekwan, sanctum.ase = _economy_tick(
+            cfg.base_ase_tick, sanctum.faith, sanctum.harmony, sanctum.ekwan, sanctum.ase, ekwan_spend
+        )
+
+        courage_ritual_today = planned_courage
+        if courage_ritual_today:
+            for i in heroes:
+                fear[i] = max(0.0, min(100.0, fear[i] - 20.0))
+                morale[i] = max(0.0, min(100.0, morale[i] + 25.0))
+            courage_resistance_remaining = max(courage_resistance_remaining, 8)
+
+        guardian_today = cfg.guardian_present or sanctum.favor >= 65.0
+        resisting = courage_resistance_remaining > 0
+        fear_gain_multiplier = _fear_gain_multiplier(guardian_today, resisting, ward_beads_today, spike_guard_today)
+        fear_gain = encounters_today * cfg.fear_per_encounter * fear_gain_multiplier
+
+        for i in heroes:
+            hero_fear = max(0.0, min(100.0, fear[i] + fear_gain * fear_scale[i]))
+            hero_morale = max(0.0, min(100.0, morale_decay_step(morale[i], hero_fear, guardian_today)))
+            if resisting:
+                hero_fear = max(0.0, min(100.0, hero_fear - 5.0))
+            if hero_morale <= 0.0:
+                fragments[i] += 1
+                legacy_fragments += 1
+                hero_morale = 45.0
+                hero_fear = max(0.0, min(100.0, hero_fear * 0.6))
+            fear[i] = hero_fear
+            morale[i] = hero_morale
+        # fsum keeps the mean of identical heroes exact for power-of-two party sizes.
+        party_fear = fsum(fear) / size
+
+        prior_faith = sanctum.faith
+        sanctum.faith, sanctum.harmony, sanctum.favor = _sanctum_drift(
+            sanctum.faith, sanctum.harmony, sanctum.favor, party_fear, encounters_today
+        )
+        faith_recovered = sanctum.faith - prior_faith
+
+        sanctum.faith, sanctum.ase, faith_guardrail_streak, reflection_prayer_used = _faith_guardrail(
+            cfg, sanctum.faith, sanctum.ase, faith_guardrail_streak
+        )
+
+        sanctum.favor, spike_guard_prevented_days, voluntary_retirement_today = _retirement_rite(
+            cfg, spike_guard_today, spike_guard_prevented_days, sanctum.favor
+        )
+        if voluntary_retirement_today:
+            weary = max(heroes, key=fear.__getitem__)
+            fragments[weary] += 1
+            legacy_fragments += 1
+            voluntary_retirements += 1
+            roster.morale[weary] = morale[weary]
+            roster.fear[weary] = fear[weary]
+            roster.legacy_fragments[weary] = fragments[weary]
+            roster._retire(weary, day)
+            morale[weary] = STARTING_MORALE
+            fear[weary] = STARTING_FEAR
+            fragments[weary] = 0
+            party_fear = fsum(fear) / size
+
+        party_morale = fsum(morale) / size
+        if summary is not None:
+            summary.update(
+                ase_yield,
+                party_morale,
+                party_fear,
+                courage_ritual_today,
+                ward_beads_today,
+                courage_ritual_skipped,
+                spike_guard_today,
+                reflection_prayer_used,
+                voluntary_retirement_today,
+            )
+        else:
+            entry = DailyLog(
+                *_log_row(
+                    day,
+                    sanctum.ase,
+                    sanctum.faith,
+                    sanctum.harmony,
+                    sanctum.favor,
+                    party_morale,
+                    party_fear,
+                    ase_yield,
+                    ekwan_spend,
+                    harmony_eff,
+                    faith_recovered,
+                    legacy_fragments,
+                    courage_ritual_today,
+                    ward_beads_today,
+                    courage_ritual_skipped,
+                    spike_guard_today,
+                    reflection_prayer_used,
+                    voluntary_retirement_today,
+                )
+            )
+            if columns is not None:
+                columns.append(entry)
+            else:
+                log.append(entry)
+
+        if courage_resistance_remaining > 0:
+            courage_resistance_remaining -= 1
+
+    roster.morale = array("d", morale)
+    roster.fear = array("d", fear)
+    roster.legacy_fragments = array("i", fragments)
+
+    result: Dict[str, Any] = {
+        "config": config_payload(cfg),
+        "final": {
+            "ase": round(sanctum.ase, 2),
+            "faith": round(sanctum.faith, 2),
+            "harmony": round(sanctum.harmony, 2),
+            "favor": round(sanctum.favor, 2),
+            "morale": round(fsum(morale) / size, 2),
+            "fear": round(fsum(fear) / size, 2),
+            "legacy_fragments": legacy_fragments,
+            "voluntary_retirements": voluntary_retirements,
+            "party_size": size,
+        },
+    }
+    if summary is not None:
+        result["summary"] = summary.as_dict()
+    else:
+        result["log"] = columns if columns is not None else [asdict(entry) for entry in log]
+    result["roster"] = roster.to_save()
+    result["hero_legacy_fragments"] = {
+        roster.ids[i]: count for i, count in enumerate(fragments) if count
+    }
+    return result
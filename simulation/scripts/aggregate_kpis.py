@@ -2,17 +2,36 @@
 
 from __future__ import annotations
 
+import argparse
+import bisect
 import csv
+import glob
+import hashlib
 import json
-from dataclasses import dataclass
+import math
+import sys
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import asdict, dataclass, fields, replace
 from pathlib import Path
-from typing import Iterable, List
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence
 
 SIMULATION_ROOT = Path(__file__).resolve().parents[1]
 PROJECT_ROOT = SIMULATION_ROOT.parent
 LOG_DIR = SIMULATION_ROOT / "logs"
 DOCS_DIR = PROJECT_ROOT / "docs" / "simulation"
 
+if PROJECT_ROOT.as_posix() not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT.as_posix())
+
+from simulation.daylog import event_counts
+from simulation.resultstore import RESULT_SUFFIX, ResultStore, open_results
+from simulation.sweep import MANIFEST_NAME
+
+DEFAULT_STREAM_OUT_DIR = LOG_DIR / "kpis"
+DEFAULT_CACHE_DIR = LOG_DIR / ".kpi_cache"
+STREAM_QUANTILES = (0.1, 0.5, 0.9, 0.99)
+
 RUN_FILES = {
     "ritual_preload": "_reg_preload.json",
     "faith_floor": "_reg_faithfloor.json",
@@ -63,6 +82,11 @@ class RunSummary:
 
     @classmethod
     def from_payload(cls, name: str, payload: dict) -> "RunSummary":
+        if "summary" in payload:
+            return cls.from_summary(name, payload)
+        if "event_log" in payload:
+            return cls.from_event_log(name, payload)
+
         final = payload["final"]
         log = payload["log"]
 
@@ -94,6 +118,101 @@ class RunSummary:
             voluntary_retirement_flags=_count("voluntary_retirement"),
         )
 
+    @classmethod
+    def from_summary(cls, name: str, payload: dict) -> "RunSummary":
+        """Build from a ``log_mode="summary"`` payload (running aggregates, no day log)."""
+
+        final = payload["final"]
+        summary = payload["summary"]
+        return cls(
+            name=name,
+            final_ase=final["ase"],
+            final_faith=final["faith"],
+            final_harmony=final["harmony"],
+            final_favor=final["favor"],
+            final_morale=final["morale"],
+            final_fear=final["fear"],
+            legacy_fragments=final["legacy_fragments"],
+            voluntary_retirements=final["voluntary_retirements"],
+            ase_yield_day1=summary["ase_yield_first"],
+            ase_yield_day20=summary["ase_yield_last"],
+            morale_min=summary["morale_min"],
+            fear_max=summary["fear_max"],
+            spike_guard_used=summary["spike_guard_used"],
+            courage_ritual_used=summary["courage_ritual_used"],
+            courage_ritual_skipped=summary["courage_ritual_skipped"],
+            ward_beads_used=summary["ward_beads_used"],
+            reflection_prayer_used=summary["reflection_prayer_used"],
+            voluntary_retirement_flags=summary["voluntary_retirement"],
+        )
+
+    @classmethod
+    def from_event_log(cls, name: str, payload: dict) -> "RunSummary":
+        """Build from a ``log_mode="events"`` payload: counters come from the sparse event
+        list and extremes from the dense columns."""
+
+        final = payload["final"]
+        event_log = payload["event_log"]
+        columns = event_log["columns"]
+        counts = event_counts(event_log)
+        return cls(
+            name=name,
+            final_ase=final["ase"],
+            final_faith=final["faith"],
+            final_harmony=final["harmony"],
+            final_favor=final["favor"],
+            final_morale=final["morale"],
+            final_fear=final["fear"],
+            legacy_fragments=final["legacy_fragments"],
+            voluntary_retirements=final["voluntary_retirements"],
+            ase_yield_day1=columns["ase_yield"][0],
+            ase_yield_day20=columns["ase_yield"][-1],
+            morale_min=min(columns["morale"]),
+            fear_max=max(columns["fear"]),
+            spike_guard_used=counts["spike_guard_used"],
+            courage_ritual_used=counts["courage_ritual_used"],
+            courage_ritual_skipped=counts["courage_ritual_skipped"],
+            ward_beads_used=counts["ward_beads_used"],
+            reflection_prayer_used=counts["reflection_prayer_used"],
+            voluntary_retirement_flags=counts["voluntary_retirement"],
+        )
+
+    @classmethod
+    def from_store(cls, name: str, store: ResultStore, index: int) -> "RunSummary":
+        """Build from run ``index`` of a ``.simres`` store by scanning its mapped columns."""
+
+        def _final(key: str):
+            return store.run_column(f"final.{key}")[index]
+
+        if store.run_column("log_rows")[index] == 0 and "summary.days" in store.run_column_names:
+            return cls.from_summary(name, store.payload(index))
+
+        def _count(flag: str) -> int:
+            return sum(store.day_column(flag, index))
+
+        ase_yield = store.day_column("ase_yield", index)
+        return cls(
+            name=name,
+            final_ase=_final("ase"),
+            final_faith=_final("faith"),
+            final_harmony=_final("harmony"),
+            final_favor=_final("favor"),
+            final_morale=_final("morale"),
+            final_fear=_final("fear"),
+            legacy_fragments=_final("legacy_fragments"),
+            voluntary_retirements=_final("voluntary_retirements"),
+            ase_yield_day1=ase_yield[0],
+            ase_yield_day20=ase_yield[-1],
+            morale_min=min(store.day_column("morale", index)),
+            fear_max=max(store.day_column("fear", index)),
+            spike_guard_used=_count("spike_guard_used"),
+            courage_ritual_used=_count("courage_ritual_used"),
+            courage_ritual_skipped=_count("courage_ritual_skipped"),
+            ward_beads_used=_count("ward_beads_used"),
+            reflection_prayer_used=_count("reflection_prayer_used"),
+            voluntary_retirement_flags=_count("voluntary_retirement"),
+        )
+
     def as_csv_row(self) -> List[str]:
         return [
             self.name,
@@ -118,47 +237,259 @@ class RunSummary:
         ]
 
 
+class _P2Quantile:
+    """Streaming quantile estimate in O(1) memory (Jain & Chlamtac P² algorithm)."""
+
+    __slots__ = ("p", "count", "heights", "positions", "_desired_start", "_desired_step")
+
+    def __init__(self, p: float) -> None:
+        self.p = p
+        self.count = 0
+        self.heights: List[float] = []
+        self.positions = [0, 1, 2, 3, 4]
+        # Desired positions of the three inner markers grow linearly with the count,
+        # so they are computed on demand instead of being accumulated every sample.
+        self._desired_start = (2 * p, 4 * p, 2 + 2 * p)
+        self._desired_step = (p / 2, p, (1 + p) / 2)
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        q = self.heights
+        if self.count <= 5:
+            bisect.insort(q, value)
+            return
+
+        n = self.positions
+        if value < q[0]:
+            q[0] = value
+            first = 1
+        elif value >= q[4]:
+            q[4] = value
+            first = 4
+        else:
+            first = bisect.bisect_right(q, value)
+        for i in range(first, 5):
+            n[i] += 1
+
+        extra = self.count - 5
+        for i in (1, 2, 3):
+            d = self._desired_start[i - 1] + extra * self._desired_step[i - 1] - n[i]
+            if (d >= 1 and n[i + 1] - n[i] > 1) or (d <= -1 and n[i - 1] - n[i] < -1):
+                step = 1 if d > 0 else -1
+                parabolic = q[i] + step / (n[i + 1] - n[i - 1]) * (
+                    (n[i] - n[i - 1] + step) * (q[i + 1] - q[i]) / (n[i + 1] - n[i])
+                    + (n[i + 1] - n[i] - step) * (q[i] - q[i - 1]) / (n[i] - n[i - 1])
+                )
+                if q[i - 1] < parabolic < q[i + 1]:
+                    q[i] = parabolic
+                else:
+                    q[i] = q[i] + step * (q[i + step] - q[i]) / (n[i + step] - n[i])
+                n[i] += step
+
+    def value(self) -> Optional[float]:
+        if not self.count:
+            return None
+        if self.count <= 5:
+            # Exact linear-interpolated quantile over the few samples seen so far.
+            rank = self.p * (self.count - 1)
+            low = int(math.floor(rank))
+            high = min(low + 1, self.count - 1)
+            return self.heights[low] + (self.heights[high] - self.heights[low]) * (rank - low)
+        return self.heights[2]
+
+
+class StreamingStats:
+    """Count, mean/std (Welford), min/max and quantiles for one KPI column.
+
+    Continuous KPIs use P² estimators. ``discrete=True`` (flag counts, fragments) keeps
+    exact value counts instead, which is both cheaper and exact for the handful of
+    distinct integers those columns take.
+    """
+
+    __slots__ = ("count", "mean", "_m2", "minimum", "maximum", "quantiles", "_counts")
+
+    def __init__(self, quantiles: Sequence[float] = STREAM_QUANTILES, discrete: bool = False) -> None:
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+        self.minimum = math.inf
+        self.maximum = -math.inf
+        self._counts: Optional[Dict[float, int]] = {} if discrete else None
+        self.quantiles = {p: _P2Quantile(p) for p in quantiles} if not discrete else {p: None for p in quantiles}
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+        if value < self.minimum:
+            self.minimum = value
+        if value > self.maximum:
+            self.maximum = value
+        if self._counts is not None:
+            self._counts[value] = self._counts.get(value, 0) + 1
+            return
+        for estimator in self.quantiles.values():
+            estimator.add(value)
+
+    @property
+    def std(self) -> float:
+        return math.sqrt(self._m2 / (self.count - 1)) if self.count > 1 else 0.0
+
+    def quantile(self, p: float) -> Optional[float]:
+        if self._counts is None:
+            return self.quantiles[p].value()
+        if not self.count:
+            return None
+        # Linear interpolation between the order statistics around rank p * (n - 1).
+        rank = p * (self.count - 1)
+        low_rank = int(math.floor(rank))
+        low = high = None
+        seen = 0
+        for value in sorted(self._counts):
+            seen += self._counts[value]
+            if low is None and seen > low_rank:
+                low = value
+            if seen > low_rank + 1 or (seen == self.count):
+                high = value
+                break
+        return low + (high - low) * (rank - low_rank)
+
+
+class Histogram:
+    """Fixed-width bins keyed by bin index; memory grows with the value range only."""
+
+    __slots__ = ("bin_width", "bins")
+
+    def __init__(self, bin_width: float) -> None:
+        if bin_width <= 0:
+            raise ValueError("bin_width must be positive")
+        self.bin_width = bin_width
+        self.bins: Dict[int, int] = {}
+
+    def add(self, value: float) -> None:
+        index = int(math.floor(value / self.bin_width))
+        self.bins[index] = self.bins.get(index, 0) + 1
+
+    def rows(self) -> List[tuple]:
+        return [
+            (index * self.bin_width, (index + 1) * self.bin_width, self.bins[index])
+            for index in sorted(self.bins)
+        ]
+
+
+_KPI_FIELDS = tuple(item.name for item in fields(RunSummary) if item.name != "name")
+_DISCRETE_KPI_FIELDS = frozenset(item.name for item in fields(RunSummary) if item.type == "int")
+
+
+class KpiAccumulator:
+    """Folds RunSummary rows into per-KPI distribution stats without keeping the rows."""
+
+    def __init__(self, ase_bin_width: float = 250.0) -> None:
+        self.runs = 0
+        self.stats = {
+            name: StreamingStats(discrete=name in _DISCRETE_KPI_FIELDS) for name in _KPI_FIELDS
+        }
+        self.final_ase_histogram = Histogram(ase_bin_width)
+        self.fragment_histogram = Histogram(1)
+
+    def add(self, run: RunSummary) -> None:
+        self.runs += 1
+        for name, stats in self.stats.items():
+            value = getattr(run, name)
+            if value is not None:
+                stats.add(value)
+        self.final_ase_histogram.add(run.final_ase)
+        self.fragment_histogram.add(run.legacy_fragments)
+
+    def as_md_lines(self, shown_runs: int) -> List[str]:
+        def _fmt(value: Optional[float]) -> str:
+            return "—" if value is None else f"{value:.2f}"
+
+        lines = [f"**Distribution over {self.runs} runs**"]
+        if shown_runs < self.runs:
+            lines.append(f"(per-run tables above list the first {shown_runs} runs)")
+        quantile_headers = " | ".join(f"p{int(p * 100)}" for p in STREAM_QUANTILES)
+        lines.extend(
+            [
+                "",
+                f"| KPI | Mean | Std | Min | {quantile_headers} | Max |",
+                "| --- " * (5 + len(STREAM_QUANTILES)) + "|",
+            ]
+        )
+        for name, stats in self.stats.items():
+            if not stats.count:
+                continue
+            quantiles = " | ".join(_fmt(stats.quantile(p)) for p in STREAM_QUANTILES)
+            lines.append(
+                f"| {name} | {stats.mean:.2f} | {stats.std:.2f} | {stats.minimum:.2f} | "
+                f"{quantiles} | {stats.maximum:.2f} |"
+            )
+
+        lines.extend(["", "**Final Ase histogram**", "", "| Bin | Runs |", "| --- | --- |"])
+        for low, high, count in self.final_ase_histogram.rows():
+            lines.append(f"| {low:.0f}–{high:.0f} | {count} |")
+        lines.extend(["", "**Legacy fragments histogram**", "", "| Fragments | Runs |", "| --- | --- |"])
+        for low, _, count in self.fragment_histogram.rows():
+            lines.append(f"| {low:.0f} | {count} |")
+        return lines
+
+
 def _ensure_dirs() -> None:
     DOCS_DIR.mkdir(parents=True, exist_ok=True)
 
 
-def _load_runs() -> List[RunSummary]:
-    runs: List[RunSummary] = []
+def _load_runs(cache: Optional["SummaryCache"] = None, workers: int = 1) -> List[RunSummary]:
+    """The first run of each :data:`RUN_FILES` log, named by its scenario.
+
+    Parsing goes through :func:`iter_run_summaries`, so ``cache`` and ``workers`` apply
+    exactly as they do when streaming inputs.
+    """
+
+    names: Dict[str, str] = {}
     for name, filename in RUN_FILES.items():
         payload_path = LOG_DIR / filename
         if not payload_path.exists():
             raise FileNotFoundError(f"Missing required log: {payload_path}")
-        payload = json.loads(payload_path.read_text())
-        runs.append(RunSummary.from_payload(name, payload))
-    return runs
-
-
-def _write_csv(runs: Iterable[RunSummary]) -> None:
-    csv_path = DOCS_DIR / "mvp_ready_numbers.csv"
-    header = [
-        "run_name",
-        "final_ase",
-        "final_faith",
-        "final_harmony",
-        "final_favor",
-        "final_morale",
-        "final_fear",
-        "legacy_fragments",
-        "voluntary_retirements",
-        "ase_yield_day1",
-        "ase_yield_day20",
-        "morale_min",
-        "fear_max",
-        "spike_guard_used",
-        "courage_ritual_used",
-        "courage_ritual_skipped",
-        "ward_beads_used",
-        "reflection_prayer_used",
-        "voluntary_retirement_flags",
-    ]
+        names[payload_path.stem] = name
+
+    runs: Dict[str, RunSummary] = {}
+    sources = [str(LOG_DIR / filename) for filename in RUN_FILES.values()]
+    for run in iter_run_summaries(sources, cache=cache, workers=workers):
+        name = names[run.name.partition(":")[0]]
+        if name not in runs:
+            runs[name] = replace(run, name=name)
+    return [runs[name] for name in RUN_FILES]
+
+
+CSV_HEADER = [
+    "run_name",
+    "final_ase",
+    "final_faith",
+    "final_harmony",
+    "final_favor",
+    "final_morale",
+    "final_fear",
+    "legacy_fragments",
+    "voluntary_retirements",
+    "ase_yield_day1",
+    "ase_yield_day20",
+    "morale_min",
+    "fear_max",
+    "spike_guard_used",
+    "courage_ritual_used",
+    "courage_ritual_skipped",
+    "ward_beads_used",
+    "reflection_prayer_used",
+    "voluntary_retirement_flags",
+]
+
+
+def _write_csv(runs: Iterable[RunSummary], out_dir: Path = DOCS_DIR) -> None:
+    csv_path = out_dir / "mvp_ready_numbers.csv"
     with csv_path.open("w", newline="") as handle:
         writer = csv.writer(handle)
-        writer.writerow(header)
+        writer.writerow(CSV_HEADER)
         for run in runs:
             writer.writerow(run.as_csv_row())
 
@@ -176,8 +507,12 @@ def _format_defaults_md() -> str:
     return "\n".join(lines)
 
 
-def _write_md(runs: Iterable[RunSummary]) -> None:
-    md_path = DOCS_DIR / "mvp_ready_numbers.md"
+def _write_md(
+    runs: Iterable[RunSummary],
+    out_dir: Path = DOCS_DIR,
+    distribution: Optional["KpiAccumulator"] = None,
+) -> None:
+    md_path = out_dir / "mvp_ready_numbers.md"
     runs_list = list(runs)
     table_header = (
         "| Run | Final Ase | Morale Min | Fear Max | Fragments | Voluntary Retirements |\n"
@@ -217,12 +552,280 @@ def _write_md(runs: Iterable[RunSummary]) -> None:
         _format_defaults_md(),
         *detail_lines,
     ]
+    if distribution is not None:
+        content.extend(["", *distribution.as_md_lines(shown_runs=len(runs_list))])
     md_path.write_text("\n".join(content) + "\n")
 
 
-def main() -> None:
+def _expand_sources(sources: Iterable[str]) -> Iterator[Path]:
+    """Resolve globs, sweep directories/manifests and plain paths to result files."""
+
+    for source in sources:
+        path = Path(source)
+        if any(char in source for char in "*?["):
+            for match in sorted(glob.glob(source, recursive=True)):
+                yield from _expand_sources([match])
+        elif path.is_dir() and (path / MANIFEST_NAME).exists():
+            yield from _expand_sources([str(path / MANIFEST_NAME)])
+        elif path.is_dir():
+            yield from sorted(
+                child for child in path.iterdir() if child.suffix in {".json", ".jsonl", RESULT_SUFFIX}
+            )
+        elif path.name == MANIFEST_NAME:
+            manifest = json.loads(path.read_text())
+            for shard in manifest["shards"]:
+                yield path.parent / shard["file"]
+        else:
+            yield path
+
+
+def _run_name(path: Path, payload_run_id: Optional[int]) -> str:
+    return path.stem if payload_run_id is None else f"{path.stem}:{payload_run_id}"
+
+
+def _summaries_for_file(path: Path) -> List[RunSummary]:
+    """Every RunSummary in one result file (.json, .jsonl or .simres)."""
+
+    if path.suffix == RESULT_SUFFIX:
+        with open_results(path) as store:
+            run_ids = store.run_column("run_id")
+            runs = [
+                RunSummary.from_store(_run_name(path, run_ids[index]), store, index)
+                for index in range(store.runs)
+            ]
+            del run_ids
+        return runs
+    if path.suffix == ".jsonl":
+        runs = []
+        with path.open() as handle:
+            for line in handle:
+                if line.strip():
+                    payload = json.loads(line)
+                    runs.append(RunSummary.from_payload(_run_name(path, payload.get("run_id")), payload))
+        return runs
+    payload = json.loads(path.read_text())
+    return [RunSummary.from_payload(_run_name(path, payload.get("run_id")), payload)]
+
+
+def _summarize_file_rows(path: str) -> List[dict]:
+    # Process-pool entry point: plain dicts pickle cheaply and go straight into the cache.
+    return [asdict(run) for run in _summaries_for_file(Path(path))]
+
+
+class SummaryCache:
+    """Per-file RunSummary cache keyed by path, size, mtime and content hash.
+
+    A matching size + mtime is trusted without reading the file. When either changed,
+    the file is hashed and a matching digest still counts as a hit (e.g. a re-copied
+    shard), so only files whose bytes actually changed are re-parsed.
+    """
+
+    VERSION = 1
+    _FIELDS = [item.name for item in fields(RunSummary)]
+
+    def __init__(self, cache_dir: Path) -> None:
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.hits = 0
+        self.misses = 0
+
+    def _entry_path(self, path: Path) -> Path:
+        key = hashlib.sha1(path.resolve().as_posix().encode("utf-8")).hexdigest()
+        return self.cache_dir / f"{key}.json"
+
+    @staticmethod
+    def content_hash(path: Path) -> str:
+        digest = hashlib.blake2b(digest_size=20)
+        with path.open("rb") as handle:
+            for block in iter(lambda: handle.read(1 << 20), b""):
+                digest.update(block)
+        return digest.hexdigest()
+
+    def get(self, path: Path) -> Optional[List[dict]]:
+        entry_path = self._entry_path(path)
+        if not entry_path.exists():
+            return None
+        try:
+            entry = json.loads(entry_path.read_text())
+        except json.JSONDecodeError:
+            return None
+        if entry.get("version") != self.VERSION or entry.get("fields") != self._FIELDS:
+            return None
+
+        stat = path.stat()
+        if entry["size"] == stat.st_size and entry["mtime_ns"] == stat.st_mtime_ns:
+            return entry["runs"]
+        if entry["size"] == stat.st_size and entry["content_hash"] == self.content_hash(path):
+            entry["mtime_ns"] = stat.st_mtime_ns
+            entry_path.write_text(json.dumps(entry, separators=(",", ":")))
+            return entry["runs"]
+        return None
+
+    def put(self, path: Path, rows: List[dict]) -> None:
+        stat = path.stat()
+        entry = {
+            "version": self.VERSION,
+            "fields": self._FIELDS,
+            "path": path.resolve().as_posix(),
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "content_hash": self.content_hash(path),
+            "runs": rows,
+        }
+        entry_path = self._entry_path(path)
+        tmp_path = entry_path.with_name(entry_path.name + ".tmp")
+        tmp_path.write_text(json.dumps(entry, separators=(",", ":")))
+        tmp_path.replace(entry_path)
+
+
+def iter_run_summaries(
+    sources: Iterable[str],
+    cache: Optional[SummaryCache] = None,
+    workers: int = 1,
+) -> Iterator[RunSummary]:
+    """Stream one RunSummary per run across JSON, JSON-lines and ``.simres`` inputs.
+
+    Files are summarised one at a time (or ``2 * workers`` at a time across a process
+    pool) and yielded in input order, so memory stays bounded regardless of how many
+    runs the sources contain. With a ``cache`` only new or changed files are parsed.
+    """
+
+    def _rows(rows: List[dict]) -> Iterator[RunSummary]:
+        for row in rows:
+            yield RunSummary(**row)
+
+    def _resolve(path: Path, rows: List[dict], fresh: bool) -> Iterator[RunSummary]:
+        if cache is not None:
+            if fresh:
+                cache.misses += 1
+                cache.put(path, rows)
+            else:
+                cache.hits += 1
+        return _rows(rows)
+
+    paths = _expand_sources(sources)
+    if workers <= 1:
+        for path in paths:
+            cached = cache.get(path) if cache is not None else None
+            if cached is not None:
+                yield from _resolve(path, cached, fresh=False)
+            else:
+                yield from _resolve(path, _summarize_file_rows(str(path)), fresh=True)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        window: deque = deque()
+
+        def _drain_one() -> Iterator[RunSummary]:
+            path, pending = window.popleft()
+            if isinstance(pending, Future):
+                return _resolve(path, pending.result(), fresh=True)
+            return _resolve(path, pending, fresh=False)
+
+        for path in paths:
+            cached = cache.get(path) if cache is not None else None
+            window.append((path, cached if cached is not None else pool.submit(_summarize_file_rows, str(path))))
+            while len(window) > 2 * workers:
+                yield from _drain_one()
+        while window:
+            yield from _drain_one()
+
+
+def aggregate_stream(
+    sources: Iterable[str],
+    out_dir: Path,
+    md_run_limit: int = 50,
+    ase_bin_width: float = 250.0,
+    cache: Optional[SummaryCache] = None,
+    workers: int = 1,
+) -> KpiAccumulator:
+    """Stream ``sources`` into ``mvp_ready_numbers.csv/.md`` under ``out_dir``.
+
+    Every run becomes a CSV row as it is read; the markdown keeps the usual per-run
+    tables for the first ``md_run_limit`` runs plus the distribution section.
+    ``cache`` and ``workers`` are passed through to :func:`iter_run_summaries`.
+    """
+
+    out_dir.mkdir(parents=True, exist_ok=True)
+    accumulator = KpiAccumulator(ase_bin_width=ase_bin_width)
+    shown: List[RunSummary] = []
+
+    def _tap(runs: Iterable[RunSummary]) -> Iterator[RunSummary]:
+        for run in runs:
+            accumulator.add(run)
+            if len(shown) < md_run_limit:
+                shown.append(run)
+            yield run
+
+    _write_csv(_tap(iter_run_summaries(sources, cache=cache, workers=workers)), out_dir)
+    _write_md(shown, out_dir, distribution=accumulator)
+    return accumulator
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Aggregate sim KPIs into MVP-ready number sheets")
+    parser.add_argument(
+        "inputs",
+        nargs="*",
+        help=(
+            "Result files, globs, sweep directories or manifest.json files to stream. "
+            "Without inputs the Pass-02 regression logs in RUN_FILES are summarised into docs/."
+        ),
+    )
+    parser.add_argument(
+        "--out_dir",
+        type=Path,
+        default=DEFAULT_STREAM_OUT_DIR,
+        help="Output directory when streaming inputs (default: simulation/logs/kpis)",
+    )
+    parser.add_argument(
+        "--md_run_limit",
+        type=int,
+        default=50,
+        help="Per-run rows kept in the markdown report when streaming",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Worker processes for parsing uncached result files",
+    )
+    parser.add_argument(
+        "--cache_dir",
+        type=Path,
+        default=DEFAULT_CACHE_DIR,
+        help="Per-file RunSummary cache (default: simulation/logs/.kpi_cache)",
+    )
+    parser.add_argument(
+        "--no_cache",
+        action="store_true",
+        help="Re-parse every input instead of reusing cached per-file summaries",
+    )
+    parser.add_argument(
+        "--ase_bin_width",
+        type=float,
+        default=250.0,
+        help="Bin width for the final Ase histogram",
+    )
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    args = build_parser().parse_args(argv)
+    if args.inputs:
+        cache = None if args.no_cache else SummaryCache(args.cache_dir)
+        aggregate_stream(
+            args.inputs,
+            args.out_dir,
+            args.md_run_limit,
+            args.ase_bin_width,
+            cache=cache,
+            workers=args.workers,
+        )
+        return
+
     _ensure_dirs()
-    runs = _load_runs()
+    runs = _load_runs(None if args.no_cache else SummaryCache(args.cache_dir), args.workers)
     _write_csv(runs)
     _write_md(runs)
 
@@ -0,0 +1,77 @@
+"""Benchmark harness for the Echoes of the Sankofa MVP sim."""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+SIMULATION_ROOT = Path(__file__).resolve().parents[1]
+PROJECT_ROOT = SIMULATION_ROOT.parent
+
+if PROJECT_ROOT.as_posix() not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT.as_posix())
+
+from simulation.bench import DEFAULT_THRESHOLD, compare, run_benchmarks, select
+
+
+def _resolve(path: Path) -> Path:
+    return path if path.is_absolute() else (PROJECT_ROOT / path).resolve()
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Time the sim engine, PRNG, curves, result I/O and KPI aggregation")
+    parser.add_argument(
+        "patterns",
+        nargs="*",
+        help="Glob(s) over benchmark names, e.g. 'sim.*' 'curves.*' (default: every fast benchmark)",
+    )
+    parser.add_argument("--list", action="store_true", help="List benchmark names and exit")
+    parser.add_argument("--slow", action="store_true", help="Include slow benchmarks (3650-day runs, 10k seeds, 20k-run KPIs)")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed repeats per benchmark (best is reported)")
+    parser.add_argument("--min_time", type=float, default=0.2, help="Minimum seconds per timed repeat")
+    parser.add_argument("--out", type=Path, help="Write the JSON report here (e.g. a new baseline)")
+    parser.add_argument("--baseline", type=Path, help="Compare against a stored JSON report")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="Relative slowdown that counts as a regression (default: 0.10 = 10%%)",
+    )
+    return parser
+
+
+def main(argv=None) -> int:
+    args = build_parser().parse_args(argv)
+    benchmarks = select(args.patterns, include_slow=args.slow)
+    if args.list:
+        for bench in benchmarks:
+            print(f"{bench.name}{'  (slow)' if bench.slow else ''}")
+        return 0
+    if not benchmarks:
+        print("No benchmarks match.", file=sys.stderr)
+        return 2
+
+    def _progress(name, result):
+        print(
+            f"{name:<36} {result['best_s'] * 1e3:>10.3f} ms  {result['per_op_ns']:>12.1f} ns/op",
+            file=sys.stderr,
+        )
+
+    report = run_benchmarks(benchmarks, repeat=args.repeat, min_time=args.min_time, progress=_progress)
+    if args.out is not None:
+        out_path = _resolve(args.out)
+        out_path.parent.mkdir(parents=True, exist_ok=True)
+        out_path.write_text(json.dumps(report, indent=2))
+
+    status = 0
+    if args.baseline is not None:
+        rows = compare(report, json.loads(_resolve(args.baseline).read_text()), args.threshold)
+        report["comparison"] = {"threshold": args.threshold, "rows": rows}
+        if any(row["regressed"] for row in rows):
+            status = 1
+    print(json.dumps(report, indent=2))
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,212 @@
+"""Monte Carlo KPI sheet: every RunSummary field with confidence intervals over seeds."""
+
+import argparse
+import csv
+import json
+import sys
+import time
+from dataclasses import asdict
+from pathlib import Path
+
+SIMULATION_ROOT = Path(__file__).resolve().parents[1]
+PROJECT_ROOT = SIMULATION_ROOT.parent
+DEFAULT_OUT_DIR = SIMULATION_ROOT / "logs" / "montecarlo"
+DEFAULT_CACHE_DIR = SIMULATION_ROOT / "logs" / ".sim_cache"
+
+if PROJECT_ROOT.as_posix() not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT.as_posix())
+
+from simulation.memo import SimCache
+from simulation.montecarlo import DEFAULT_PERCENTILES, DEFAULT_SEED_START, DEFAULT_WIDTHS, monte_carlo
+from simulation.scripts.aggregate_kpis import LOG_DIR, RUN_FILES, RunSummary
+from simulation.scripts.run_sweep import _parse_assignment
+
+CSV_HEADER = ["scenario", "metric", "seeds", "mean", "std", "ci_low", "ci_high", "ci_width", "min", "max"]
+
+
+def run_summary_values(payload: dict) -> dict:
+    """Every numeric RunSummary field of a summary-mode payload."""
+
+    values = asdict(RunSummary.from_summary("", payload))
+    del values["name"]
+    return values
+
+
+def _parse_width(value: str) -> tuple:
+    key, payload = _parse_assignment(value)
+    if not isinstance(payload, (int, float)) or payload <= 0:
+        raise argparse.ArgumentTypeError(f"Width for '{key}' must be a positive number.")
+    return key, float(payload)
+
+
+def _pass02_scenarios() -> dict:
+    """The Pass-02 regression runs, keyed as in the KPI sheet, without their fixed seed."""
+
+    scenarios = {}
+    for name, filename in RUN_FILES.items():
+        config = dict(json.loads((LOG_DIR / filename).read_text())["config"])
+        config.pop("campaign_seed", None)
+        scenarios[name] = config
+    return scenarios
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Estimate KPI confidence intervals over campaign seeds")
+    parser.add_argument(
+        "--scenario",
+        dest="scenarios",
+        metavar="name=json",
+        type=_parse_assignment,
+        action="append",
+        default=[],
+        help="Named scenario as a JSON object of SimConfig overrides (default: the Pass-02 regression runs)",
+    )
+    parser.add_argument(
+        "--set",
+        dest="overrides",
+        metavar="field=json",
+        type=_parse_assignment,
+        action="append",
+        default=[],
+        help="SimConfig override applied on top of every scenario (e.g. days=60)",
+    )
+    parser.add_argument(
+        "--width",
+        dest="widths",
+        metavar="metric=W",
+        type=_parse_width,
+        action="append",
+        default=[],
+        help=f"Target full width of the mean's interval (default: {DEFAULT_WIDTHS})",
+    )
+    parser.add_argument("--confidence", type=float, default=0.95, help="Interval confidence level")
+    parser.add_argument(
+        "--seed_start",
+        type=lambda text: int(text, 0),
+        default=DEFAULT_SEED_START,
+        help="First campaign seed; later seeds count up from it",
+    )
+    parser.add_argument("--min_seeds", type=int, default=16, help="Seeds in every scenario's first round")
+    parser.add_argument("--max_seeds", type=int, default=1024, help="Seed cap per scenario")
+    parser.add_argument("--growth", type=float, default=2.0, help="Max seed-count growth per round")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: all cores)")
+    parser.add_argument("--chunk_size", type=int, default=64, help="Runs per work unit")
+    parser.add_argument(
+        "--cache",
+        nargs="?",
+        type=Path,
+        const=DEFAULT_CACHE_DIR,
+        help="Reuse memoized summary runs (directory, or the flag alone for simulation/logs/.sim_cache)",
+    )
+    parser.add_argument(
+        "--out_dir",
+        type=Path,
+        default=DEFAULT_OUT_DIR,
+        help="Where mvp_confidence.{json,csv,md} go (relative paths resolve against the repo root)",
+    )
+    return parser
+
+
+def _write_csv(reports: dict, path: Path) -> None:
+    quantiles = [f"p{round(p * 100):g}" for p in DEFAULT_PERCENTILES]
+    with path.open("w", newline="") as handle:
+        writer = csv.writer(handle)
+        writer.writerow(CSV_HEADER + quantiles)
+        for name, report in reports.items():
+            for metric, stats in report["stats"].items():
+                writer.writerow(
+                    [name, metric, stats["n"]]
+                    + [f"{value:.4f}" for value in (stats["mean"], stats["std"], *stats["ci"], stats["ci_width"])]
+                    + [f"{stats['min']:.4f}", f"{stats['max']:.4f}"]
+                    + [f"{stats['percentiles'][key]['value']:.4f}" for key in quantiles]
+                )
+
+
+def _write_md(reports: dict, confidence: float, path: Path) -> None:
+    level = f"{confidence * 100:g}%"
+    lines = ["# MVP KPI confidence (Monte Carlo)", ""]
+    for name, report in reports.items():
+        first, last = report["seeds"]
+        status = "converged" if report["converged"] else f"unmet: {', '.join(sorted(report['unmet']))}"
+        lines.extend(
+            [
+                f"## {name}",
+                "",
+                f"Seeds {first:#x}–{last:#x} ({last - first + 1} runs, rounds {report['rounds']}); {status}.",
+                "",
+                f"| KPI | Mean | {level} CI | Std | p10 | p50 | p90 |",
+                "| --- | --- | --- | --- | --- | --- | --- |",
+            ]
+        )
+        for metric, stats in report["stats"].items():
+            low, high = stats["ci"]
+            percentiles = " | ".join(
+                f"{stats['percentiles'][key]['value']:.2f}" for key in ("p10", "p50", "p90")
+            )
+            lines.append(
+                f"| {metric} | {stats['mean']:.2f} | {low:.2f}–{high:.2f} | {stats['std']:.2f} | {percentiles} |"
+            )
+        lines.append("")
+    path.write_text("\n".join(lines))
+
+
+def main() -> None:
+    parser = build_parser()
+    args = parser.parse_args()
+
+    scenarios = dict(args.scenarios) if args.scenarios else _pass02_scenarios()
+    for name, overrides in scenarios.items():
+        if not isinstance(overrides, dict):
+            parser.error(f"--scenario {name} needs a JSON object")
+        overrides.update(args.overrides)
+
+    cache = None
+    if args.cache is not None:
+        cache_dir: Path = args.cache
+        if not cache_dir.is_absolute():
+            cache_dir = (PROJECT_ROOT / cache_dir).resolve()
+        cache = SimCache(cache_dir)
+
+    started = time.perf_counter()
+    try:
+        reports = monte_carlo(
+            scenarios,
+            widths=dict(args.widths) if args.widths else None,
+            confidence=args.confidence,
+            seed_start=args.seed_start,
+            min_seeds=args.min_seeds,
+            max_seeds=args.max_seeds,
+            growth=args.growth,
+            extract=run_summary_values,
+            workers=args.workers,
+            chunk_size=args.chunk_size,
+            cache=cache,
+        )
+    except (TypeError, ValueError) as exc:
+        parser.error(str(exc))
+    elapsed = time.perf_counter() - started
+
+    out_dir: Path = args.out_dir
+    if not out_dir.is_absolute():
+        out_dir = (PROJECT_ROOT / out_dir).resolve()
+    out_dir.mkdir(parents=True, exist_ok=True)
+    (out_dir / "mvp_confidence.json").write_text(json.dumps(reports, indent=2))
+    _write_csv(reports, out_dir / "mvp_confidence.csv")
+    _write_md(reports, args.confidence, out_dir / "mvp_confidence.md")
+
+    print(
+        json.dumps(
+            {
+                "out_dir": out_dir.as_posix(),
+                "scenarios": {
+                    name: {"runs": report["rounds"][-1], "converged": report["converged"]}
+                    for name, report in reports.items()
+                },
+                "seconds": round(elapsed, 3),
+            }
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
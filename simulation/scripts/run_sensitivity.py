@@ -0,0 +1,114 @@
+"""Rank SimConfig knobs by how much they move each KPI (Sobol indices or Morris screening)."""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+SIMULATION_ROOT = Path(__file__).resolve().parents[1]
+PROJECT_ROOT = SIMULATION_ROOT.parent
+DEFAULT_CACHE_DIR = SIMULATION_ROOT / "logs" / ".sim_cache"
+
+if PROJECT_ROOT.as_posix() not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT.as_posix())
+
+from simulation.memo import SimCache
+from simulation.scripts.run_sweep import _parse_assignment, _parse_seed_range
+from simulation.scripts.run_tuning import _parse_param
+from simulation.sensitivity import DEFAULT_SEEDS, KPI_METRICS, KPI_SPACE, morris_effects, sobol_indices
+from simulation.tuning import METRICS
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Global sensitivity of KPIs to SimConfig parameters")
+    parser.add_argument("--method", choices=("sobol", "morris"), default="sobol", help="Analysis method")
+    parser.add_argument(
+        "--param",
+        dest="space",
+        metavar="field=LOW:HIGH[:int]",
+        type=_parse_param,
+        action="append",
+        default=[],
+        help="Parameter range to analyse (default: the KPI_SPACE knobs)",
+    )
+    parser.add_argument(
+        "--metric",
+        dest="metrics",
+        choices=sorted(METRICS),
+        action="append",
+        default=[],
+        help=f"KPI to attribute (default: {', '.join(KPI_METRICS)})",
+    )
+    parser.add_argument(
+        "--set",
+        dest="overrides",
+        metavar="field=json",
+        type=_parse_assignment,
+        action="append",
+        default=[],
+        help="Fixed SimConfig override shared by every run (e.g. days=60)",
+    )
+    parser.add_argument(
+        "--seeds",
+        metavar="START:COUNT",
+        type=_parse_seed_range,
+        default=DEFAULT_SEEDS,
+        help="Campaign seeds every design point is averaged over (default: 0xA2B94D10 only)",
+    )
+    parser.add_argument("--samples", type=int, default=256, help="Sobol base samples; runs = samples * (params + 2)")
+    parser.add_argument("--trajectories", type=int, default=32, help="Morris trajectories; runs = trajectories * (params + 1)")
+    parser.add_argument("--levels", type=int, default=4, help="Morris grid levels (must be even)")
+    parser.add_argument("--seed", type=lambda text: int(text, 0), default=0, help="Design sampler seed")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: all cores)")
+    parser.add_argument("--chunk_size", type=int, default=256, help="Runs per work unit")
+    parser.add_argument(
+        "--cache",
+        nargs="?",
+        type=Path,
+        const=DEFAULT_CACHE_DIR,
+        help="Reuse memoized summary runs (directory, or the flag alone for simulation/logs/.sim_cache)",
+    )
+    parser.add_argument("--out", type=Path, help="Write the JSON report here as well")
+    return parser
+
+
+def main() -> None:
+    parser = build_parser()
+    args = parser.parse_args()
+
+    cache = None
+    if args.cache is not None:
+        cache_dir: Path = args.cache
+        if not cache_dir.is_absolute():
+            cache_dir = (PROJECT_ROOT / cache_dir).resolve()
+        cache = SimCache(cache_dir)
+
+    options = dict(
+        space=args.space or KPI_SPACE,
+        metrics=args.metrics or KPI_METRICS,
+        base=dict(args.overrides),
+        seeds=args.seeds,
+        sample_seed=args.seed,
+        workers=args.workers,
+        chunk_size=args.chunk_size,
+        cache=cache,
+    )
+    started = time.perf_counter()
+    try:
+        if args.method == "sobol":
+            report = sobol_indices(samples=args.samples, **options)
+        else:
+            report = morris_effects(trajectories=args.trajectories, levels=args.levels, **options)
+    except (TypeError, ValueError) as exc:
+        parser.error(str(exc))
+    report["seconds"] = round(time.perf_counter() - started, 3)
+
+    if args.out is not None:
+        args.out.parent.mkdir(parents=True, exist_ok=True)
+        args.out.write_text(json.dumps(report, indent=2), encoding="utf-8")
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -3,16 +3,23 @@
 import argparse
 import json
 import sys
+from dataclasses import replace
 from pathlib import Path
 
 SIMULATION_ROOT = Path(__file__).resolve().parents[1]
 PROJECT_ROOT = SIMULATION_ROOT.parent
 DEFAULT_LOG_PATH = SIMULATION_ROOT / "logs" / "latest_run.json"
+DEFAULT_CACHE_DIR = SIMULATION_ROOT / "logs" / ".sim_cache"
+DEFAULT_CHECKPOINT_DIR = SIMULATION_ROOT / "logs" / "checkpoints"
 
 if PROJECT_ROOT.as_posix() not in sys.path:
     sys.path.insert(0, PROJECT_ROOT.as_posix())
 
-from simulation import SimConfig, run_economy_sim
+# Only the scalar loop is imported up front; batch, cache, profiler, roster, realm,
+# long-horizon and result-store modules load inside the branches that use them.
+from simulation.sim import SimConfig, run_economy_sim
+
+COMPACT_SEPARATORS = (",", ":")
 
 
 def _parse_day_list(value: str) -> tuple[int, ...]:
@@ -60,6 +67,57 @@ def _parse_bool(value: str) -> bool:
     )
 
 
+def _positive_int(value: str) -> int:
+    number = int(value)
+    if number <= 0:
+        raise argparse.ArgumentTypeError(f"must be a positive integer, received {value}")
+    return number
+
+
+def _non_negative_int(value: str) -> int:
+    number = int(value)
+    if number < 0:
+        raise argparse.ArgumentTypeError(f"must be a non-negative integer, received {value}")
+    return number
+
+
+# Which run modes each mode-specific flag applies to; every other flag is a SimConfig
+# flag that all modes take. A flag given outside its modes is an error, not a no-op.
+MODE_FLAGS = {
+    "summary_only": ("run", "serve", "batch"),
+    "profile": ("run",),
+    "cache": ("run",),
+    "event_log": ("run",),
+    "precision": ("run",),
+    "log": ("run", "roster", "realms", "long_horizon"),
+    "compact": ("run", "roster", "realms", "long_horizon"),
+    "batch_out": ("batch",),
+    "resume_batch": ("batch",),
+    "ordered": ("batch",),
+    "workers": ("batch",),
+    "chunk_size": ("batch",),
+    "max_pending": ("batch",),
+    "sample_every": ("long_horizon",),
+    "event_days": ("long_horizon",),
+    "period": ("long_horizon",),
+    "checkpoint_every": ("long_horizon",),
+    "checkpoint_dir": ("long_horizon",),
+    "resume": ("long_horizon",),
+}
+_MODE_NAMES = {
+    "run": "a plain run",
+    "serve": "--serve",
+    "batch": "--batch",
+    "roster": "--roster",
+    "realms": "--realms",
+    "long_horizon": "--long_horizon",
+}
+# Flags that only make sense alongside another flag of the same mode.
+FLAG_NEEDS = {"precision": "event_log", "resume_batch": "batch_out"}
+# Flag pairs within one mode that describe conflicting outputs.
+FLAG_CONFLICTS = {"event_log": ("summary_only", "cache"), "cache": ("profile",)}
+
+
 def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(description="Run the Echoes of the Sankofa deterministic sim")
     parser.add_argument("--days", type=int, default=20, help="Number of in-sim days to process")
@@ -249,19 +307,244 @@ def build_parser() -> argparse.ArgumentParser:
         default=3.0,
         help="Favor spent when the retirement rite is performed",
     )
-    parser.add_argument(
+    modes = parser.add_argument_group(
+        "run modes", "At most one; without any, the CLI runs one campaign and prints its report."
+    ).add_mutually_exclusive_group()
+    modes.add_argument(
+        "--serve",
+        action="store_true",
+        help=(
+            "Long-lived mode: read one JSON object of SimConfig overrides per stdin line "
+            "(on top of the CLI config) and write one minified JSON result per stdout line"
+        ),
+    )
+    modes.add_argument(
+        "--batch",
+        metavar="FILE",
+        help=(
+            "Answer every JSON-lines request in FILE ('-' for stdin) across a worker pool, "
+            "one reply line per request tagged with its input 'line' number"
+        ),
+    )
+    modes.add_argument(
+        "--roster",
+        type=_positive_int,
+        metavar="N",
+        help="Track N heroes individually (traits rolled from the campaign seed) instead of one party pair",
+    )
+    modes.add_argument(
+        "--realms",
+        type=_positive_int,
+        metavar="N",
+        help="Run N realms concurrently (all starting at --tier) with corruption dynamics on one Sanctum",
+    )
+    modes.add_argument(
+        "--long_horizon",
+        action="store_true",
+        help="Multi-year mode: downsampled day log, per-period rollups and optional checkpoints",
+    )
+
+    output = parser.add_argument_group("output")
+    output.add_argument(
         "--log",
         nargs="?",
         type=Path,
         const=DEFAULT_LOG_PATH,
         help=(
             "Persist the JSON report to disk. Provide a path or pass the flag alone to use "
-            "simulation/logs/latest_run.json inside the repository."
+            "simulation/logs/latest_run.json inside the repository. A .simres suffix writes "
+            "the columnar binary format instead."
+        ),
+    )
+    output.add_argument(
+        "--compact",
+        action="store_true",
+        help="Print (and --log) minified JSON instead of the indented report",
+    )
+    output.add_argument(
+        "--summary_only",
+        action="store_true",
+        help="Skip the day log and report running aggregates under 'summary' (log_mode=summary)",
+    )
+    output.add_argument(
+        "--profile",
+        action="store_true",
+        help="Time each day-loop phase and count rule branches; adds a 'profile' block to the report",
+    )
+    output.add_argument(
+        "--cache",
+        nargs="?",
+        type=Path,
+        const=DEFAULT_CACHE_DIR,
+        help=(
+            "Reuse memoized results for identical configs. Pass a directory or the flag alone "
+            "to use simulation/logs/.sim_cache; entries invalidate when the sim sources change."
         ),
     )
+    output.add_argument(
+        "--event_log",
+        action="store_true",
+        help="Replace the day log with dense float columns plus a sparse list of ritual/fragment events",
+    )
+    output.add_argument(
+        "--precision",
+        type=_non_negative_int,
+        metavar="DIGITS",
+        help="With --event_log: round the dense columns to at most DIGITS decimals",
+    )
+
+    batch = parser.add_argument_group("batch mode")
+    batch.add_argument(
+        "--batch_out",
+        type=Path,
+        metavar="FILE",
+        help="Write reply lines here instead of stdout",
+    )
+    batch.add_argument(
+        "--resume_batch",
+        action="store_true",
+        help="With --batch_out: skip input lines already answered in the reply file and append the rest",
+    )
+    batch.add_argument(
+        "--ordered",
+        action="store_true",
+        help="Emit replies in input order instead of as chunks finish",
+    )
+    batch.add_argument("--workers", type=_positive_int, help="Worker processes (default: all cores)")
+    batch.add_argument("--chunk_size", type=_positive_int, default=16, help="Requests per work unit")
+    batch.add_argument(
+        "--max_pending",
+        type=_positive_int,
+        metavar="CHUNKS",
+        help="Chunks in flight or awaiting output before input reading pauses (default: 2 * workers)",
+    )
+
+    horizon = parser.add_argument_group("long-horizon mode")
+    horizon.add_argument(
+        "--sample_every",
+        type=_non_negative_int,
+        default=30,
+        metavar="N",
+        help="Keep every Nth day in the log (0 keeps only event days)",
+    )
+    horizon.add_argument(
+        "--event_days",
+        type=_parse_bool,
+        default=True,
+        help="Also keep ritual, guardrail, retirement and collapse days",
+    )
+    horizon.add_argument(
+        "--period",
+        type=_positive_int,
+        default=365,
+        metavar="DAYS",
+        help="Rollup window for the 'periods' block",
+    )
+    horizon.add_argument(
+        "--checkpoint_every",
+        type=_positive_int,
+        metavar="DAYS",
+        help="Snapshot the sim state every DAYS days",
+    )
+    horizon.add_argument(
+        "--checkpoint_dir",
+        nargs="?",
+        type=Path,
+        const=DEFAULT_CHECKPOINT_DIR,
+        help="Write checkpoints as day-NNNNNN.json files (default dir: simulation/logs/checkpoints)",
+    )
+    horizon.add_argument(
+        "--resume",
+        type=Path,
+        metavar="CHECKPOINT",
+        help="Continue a checkpoint file to --days under its saved config (implies --long_horizon)",
+    )
     return parser
 
 
+def _mode(args: argparse.Namespace) -> str:
+    if args.serve:
+        return "serve"
+    if args.batch is not None:
+        return "batch"
+    if args.roster is not None:
+        return "roster"
+    if args.realms is not None:
+        return "realms"
+    if args.long_horizon or args.resume is not None:
+        return "long_horizon"
+    return "run"
+
+
+def _check_flags(parser: argparse.ArgumentParser, args: argparse.Namespace, mode: str) -> None:
+    """Reject mode-specific flags that ``mode`` would ignore, per :data:`MODE_FLAGS`."""
+
+    given = {dest for dest in MODE_FLAGS if getattr(args, dest) != parser.get_default(dest)}
+    for dest in sorted(given):
+        modes = MODE_FLAGS[dest]
+        if mode not in modes:
+            names = [_MODE_NAMES[name] for name in modes]
+            listed = names[0] if len(names) == 1 else f"{', '.join(names[:-1])} or {names[-1]}"
+            parser.error(f"--{dest} only applies with {listed}")
+        needed = FLAG_NEEDS.get(dest)
+        if needed is not None and needed not in given:
+            parser.error(f"--{dest} needs --{needed}")
+        for other in FLAG_CONFLICTS.get(dest, ()):
+            if other in given:
+                parser.error(f"--{dest} cannot be combined with --{other}")
+    if args.log is not None:
+        from simulation.resultstore import RESULT_SUFFIX
+
+        if args.log.suffix == RESULT_SUFFIX and (mode != "run" or args.event_log or args.profile):
+            parser.error(f"--log *{RESULT_SUFFIX} only stores plain and --summary_only run reports")
+
+
+def _run_batch(parser: argparse.ArgumentParser, args: argparse.Namespace, cfg: SimConfig, log_mode: str) -> None:
+    from simulation.jsonl import completed_lines, drop_torn_tail, run_lines
+
+    out_path: Path | None = args.batch_out
+    if out_path is not None and not out_path.is_absolute():
+        out_path = (PROJECT_ROOT / out_path).resolve()
+
+    try:
+        source = sys.stdin if args.batch == "-" else open(args.batch, encoding="utf-8")
+    except OSError as exc:
+        parser.error(f"cannot read --batch input: {exc}")
+    skip: set[int] = set()
+    try:
+        if out_path is None:
+            sink = sys.stdout
+        else:
+            out_path.parent.mkdir(parents=True, exist_ok=True)
+            if args.resume_batch:
+                skip = completed_lines(out_path)
+                drop_torn_tail(out_path)
+            sink = out_path.open("a" if args.resume_batch else "w", encoding="utf-8")
+    except OSError as exc:
+        if source is not sys.stdin:
+            source.close()
+        parser.error(f"cannot write --batch_out: {exc}")
+    try:
+        replies = run_lines(
+            source,
+            cfg,
+            log_mode=log_mode,
+            workers=args.workers,
+            chunk_size=args.chunk_size,
+            ordered=args.ordered,
+            max_pending=args.max_pending,
+            skip=skip,
+        )
+        for reply in replies:
+            sink.write(reply + "\n")
+            sink.flush()
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if sink is not sys.stdout:
+            sink.close()
+
+
 def main() -> None:
     parser = build_parser()
     args = parser.parse_args()
@@ -304,17 +587,80 @@ def main() -> None:
         retirement_rite_min_streak=args.retirement_rite_min_streak,
         retirement_rite_favor_cost=args.retirement_rite_favor_cost,
     )
-    result = run_economy_sim(cfg)
+    mode = _mode(args)
+    _check_flags(parser, args, mode)
+    log_mode = "summary" if args.summary_only else "dicts"
+    if mode == "serve":
+        from simulation.jsonl import serve
 
+        serve(cfg, log_mode)
+        return
+    if mode == "batch":
+        _run_batch(parser, args, cfg, log_mode)
+        return
+    if mode == "long_horizon":
+        from simulation.horizon import load_checkpoint, run_long_horizon
+
+        state = None
+        if args.resume is not None:
+            state = load_checkpoint(args.resume)
+            cfg = replace(state.cfg, days=args.days)
+            if cfg.days <= state.day:
+                parser.error(f"--days must be past the checkpoint's day {state.day}")
+        checkpoint_dir: Path | None = args.checkpoint_dir
+        if checkpoint_dir is not None and not checkpoint_dir.is_absolute():
+            checkpoint_dir = (PROJECT_ROOT / checkpoint_dir).resolve()
+        result = run_long_horizon(
+            cfg,
+            every=args.sample_every,
+            events=args.event_days,
+            period=args.period,
+            checkpoint_every=args.checkpoint_every,
+            checkpoint_dir=checkpoint_dir,
+            state=state,
+        )
+    elif mode == "realms":
+        from simulation.realms import RealmArrays, run_realms_sim
+
+        result = run_realms_sim(cfg, RealmArrays.uniform(args.realms, tier=args.tier))
+    elif mode == "roster":
+        from simulation.roster import HeroRoster, run_roster_sim
+
+        result = run_roster_sim(cfg, HeroRoster.recruit(args.roster, cfg.campaign_seed))
+    elif args.profile or args.event_log:
+        from simulation.profiling import PhaseProfiler
+
+        result = run_economy_sim(
+            cfg,
+            log_mode="events" if args.event_log else log_mode,
+            profiler=PhaseProfiler() if args.profile else None,
+            precision=args.precision,
+        )
+    elif args.cache is not None:
+        from simulation.memo import SimCache
+
+        cache_dir: Path = args.cache
+        if not cache_dir.is_absolute():
+            cache_dir = (PROJECT_ROOT / cache_dir).resolve()
+        result = SimCache(cache_dir).run(cfg, log_mode)
+    else:
+        result = run_economy_sim(cfg, log_mode=log_mode)
+
+    text = json.dumps(result, separators=COMPACT_SEPARATORS) if args.compact else json.dumps(result, indent=2)
     log_path: Path | None = args.log
     if log_path is not None:
+        from simulation.resultstore import RESULT_SUFFIX, write_results
+
         if not log_path.is_absolute():
             log_path = (PROJECT_ROOT / log_path).resolve()
 
         log_path.parent.mkdir(parents=True, exist_ok=True)
-        log_path.write_text(json.dumps(result, indent=2))
+        if log_path.suffix == RESULT_SUFFIX:
+            write_results(log_path, [result])
+        else:
+            log_path.write_text(text)
 
-    print(json.dumps(result, indent=2))
+    print(text)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,160 @@
+"""Parallel parameter sweep harness for the Echoes of the Sankofa MVP sim."""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+SIMULATION_ROOT = Path(__file__).resolve().parents[1]
+PROJECT_ROOT = SIMULATION_ROOT.parent
+DEFAULT_OUT_DIR = SIMULATION_ROOT / "logs" / "sweep"
+
+if PROJECT_ROOT.as_posix() not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT.as_posix())
+
+from simulation.stopping import parse_stop_condition
+from simulation.sweep import expand_grid, load_spec, run_sweep
+
+
+def _parse_assignment(value: str) -> tuple[str, object]:
+    """Parse `field=<json>` into a (field, value) pair."""
+
+    key, sep, payload = value.partition("=")
+    if not sep or not key.strip():
+        raise argparse.ArgumentTypeError(f"Expected field=value, received '{value}'.")
+    try:
+        parsed = json.loads(payload)
+    except json.JSONDecodeError as exc:
+        raise argparse.ArgumentTypeError(f"Value for '{key}' must be JSON: {payload}") from exc
+    return key.strip(), parsed
+
+
+def _parse_seed_range(value: str) -> range:
+    """Parse `START:COUNT` (decimal or 0x-prefixed) into a range of seeds."""
+
+    start, sep, count = value.partition(":")
+    if not sep:
+        raise argparse.ArgumentTypeError("Seed range must look like START:COUNT.")
+    try:
+        first = int(start, 0)
+        total = int(count, 0)
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError("Seed range bounds must be integers.") from exc
+    if total <= 0:
+        raise argparse.ArgumentTypeError("Seed count must be positive.")
+    return range(first, first + total)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Fan a SimConfig sweep out across a process pool")
+    parser.add_argument(
+        "--spec",
+        type=Path,
+        help="JSON sweep spec ({base, grid, seeds} or {configs}); replaces --set/--grid/--seeds",
+    )
+    parser.add_argument(
+        "--set",
+        dest="overrides",
+        metavar="field=json",
+        type=_parse_assignment,
+        action="append",
+        default=[],
+        help="Fixed SimConfig override shared by every run (e.g. realm_tier=2)",
+    )
+    parser.add_argument(
+        "--grid",
+        metavar="field=json-list",
+        type=_parse_assignment,
+        action="append",
+        default=[],
+        help="Grid axis as a JSON list (e.g. encounters_per_day=[2,3,4])",
+    )
+    parser.add_argument(
+        "--seeds",
+        metavar="START:COUNT",
+        type=_parse_seed_range,
+        help="Campaign seed range swept fastest within every grid point",
+    )
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: all cores)")
+    parser.add_argument("--chunk_size", type=int, default=256, help="Runs per work unit and per shard")
+    parser.add_argument(
+        "--summary_only",
+        action="store_true",
+        help="Store running KPI aggregates per run instead of the full day log",
+    )
+    parser.add_argument(
+        "--format",
+        dest="output_format",
+        choices=("jsonl", "simres"),
+        default="jsonl",
+        help="Shard format: compact JSON lines or columnar binary .simres",
+    )
+    parser.add_argument(
+        "--stop",
+        dest="stop_when",
+        metavar="CONDITION",
+        action="append",
+        default=[],
+        help="End runs early: legacy_fragment, ase_below=X or steady_state[=EPS[:DAYS]] (repeatable)",
+    )
+    parser.add_argument(
+        "--out",
+        type=Path,
+        default=DEFAULT_OUT_DIR,
+        help="Output directory for shards and manifest.json (relative paths resolve against the repo root)",
+    )
+    return parser
+
+
+def main() -> None:
+    parser = build_parser()
+    args = parser.parse_args()
+
+    if args.chunk_size <= 0 or (args.workers is not None and args.workers <= 0):
+        parser.error("--chunk_size and --workers must be positive")
+
+    for key, values in args.grid:
+        if not isinstance(values, list) or not values:
+            parser.error(f"--grid {key} needs a non-empty JSON list")
+
+    try:
+        if args.spec is not None:
+            if args.overrides or args.grid or args.seeds:
+                parser.error("--spec cannot be combined with --set/--grid/--seeds")
+            configs = load_spec(args.spec)
+        else:
+            configs = expand_grid(dict(args.overrides), dict(args.grid), args.seeds)
+        stop_when = [parse_stop_condition(spec) for spec in args.stop_when]
+    except (TypeError, ValueError) as exc:
+        parser.error(str(exc))
+
+    out_dir: Path = args.out
+    if not out_dir.is_absolute():
+        out_dir = (PROJECT_ROOT / out_dir).resolve()
+
+    started = time.perf_counter()
+    manifest = run_sweep(
+        configs,
+        out_dir,
+        workers=args.workers,
+        chunk_size=args.chunk_size,
+        log_mode="summary" if args.summary_only else "dicts",
+        output_format=args.output_format,
+        stop_when=stop_when,
+    )
+    elapsed = time.perf_counter() - started
+    print(
+        json.dumps(
+            {
+                "out_dir": out_dir.as_posix(),
+                "runs": manifest["runs"],
+                "shards": len(manifest["shards"]),
+                "seconds": round(elapsed, 3),
+            }
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
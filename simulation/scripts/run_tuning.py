@@ -0,0 +1,153 @@
+"""Search SimConfig guardrails for values that land the KPIs inside their target bands."""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+SIMULATION_ROOT = Path(__file__).resolve().parents[1]
+PROJECT_ROOT = SIMULATION_ROOT.parent
+DEFAULT_CACHE_DIR = SIMULATION_ROOT / "logs" / ".sim_cache"
+
+if PROJECT_ROOT.as_posix() not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT.as_posix())
+
+from simulation.memo import SimCache
+from simulation.scripts.run_sweep import _parse_assignment, _parse_seed_range
+from simulation.tuning import GUARDRAIL_SPACE, MVP_TARGETS, STATS, Param, Target, tune
+
+
+def _parse_param(value: str) -> Param:
+    """Parse `field=LOW:HIGH[:int]` into a search range."""
+
+    name, sep, bounds = value.partition("=")
+    parts = bounds.split(":")
+    if not sep or len(parts) not in (2, 3) or (len(parts) == 3 and parts[2] != "int"):
+        raise argparse.ArgumentTypeError(f"Expected field=LOW:HIGH[:int], received '{value}'.")
+    try:
+        return Param(name.strip(), float(parts[0]), float(parts[1]), integer=len(parts) == 3)
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError(str(exc)) from exc
+
+
+def _parse_target(value: str) -> Target:
+    """Parse `metric[.stat]=LOW:HIGH[:WEIGHT]`; either bound may be empty."""
+
+    metric, sep, bounds = value.partition("=")
+    parts = bounds.split(":")
+    if not sep or len(parts) not in (2, 3):
+        raise argparse.ArgumentTypeError(f"Expected metric[.stat]=LOW:HIGH[:WEIGHT], received '{value}'.")
+    metric, _, stat = metric.strip().partition(".")
+    try:
+        low, high = (float(part) if part else None for part in parts[:2])
+        weight = float(parts[2]) if len(parts) == 3 else 1.0
+        return Target(metric, low, high, weight=weight, stat=stat or "mean")
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError(str(exc)) from exc
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Tune SimConfig guardrails against KPI target bands")
+    parser.add_argument(
+        "--param",
+        dest="space",
+        metavar="field=LOW:HIGH[:int]",
+        type=_parse_param,
+        action="append",
+        default=[],
+        help="Search range for one SimConfig field (default: the Pass-02 guardrail space)",
+    )
+    parser.add_argument(
+        "--target",
+        dest="targets",
+        metavar="metric[.stat]=LOW:HIGH[:WEIGHT]",
+        type=_parse_target,
+        action="append",
+        default=[],
+        help=f"KPI band over seeds; stat is one of {sorted(STATS)} (default: the MVP targets)",
+    )
+    parser.add_argument(
+        "--set",
+        dest="overrides",
+        metavar="field=json",
+        type=_parse_assignment,
+        action="append",
+        default=[],
+        help="Fixed SimConfig override shared by every run (e.g. realm_tier=2)",
+    )
+    parser.add_argument(
+        "--seeds",
+        metavar="START:COUNT",
+        type=_parse_seed_range,
+        default=range(0xA2B94D10, 0xA2B94D10 + 32),
+        help="Campaign seeds every finalist is scored on (default: 0xA2B94D10:32)",
+    )
+    parser.add_argument("--sampler", choices=("lhs", "random"), default="lhs", help="Candidate sampler")
+    parser.add_argument(
+        "--strategy",
+        choices=("halving", "full"),
+        default="halving",
+        help="Successive halving over seeds, or every candidate on every seed",
+    )
+    parser.add_argument("--candidates", type=int, default=64, help="Sampled candidates (the baseline is added)")
+    parser.add_argument("--min_seeds", type=int, default=4, help="Seeds per candidate in the first halving rung")
+    parser.add_argument("--eta", type=int, default=3, help="Halving rate: keep 1/eta, give eta times the seeds")
+    parser.add_argument("--seed", type=lambda text: int(text, 0), default=0, help="Sampler seed")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: all cores)")
+    parser.add_argument("--chunk_size", type=int, default=64, help="Runs per work unit")
+    parser.add_argument(
+        "--cache",
+        nargs="?",
+        type=Path,
+        const=DEFAULT_CACHE_DIR,
+        help="Reuse memoized summary runs across sessions (directory, or the flag alone for simulation/logs/.sim_cache)",
+    )
+    parser.add_argument("--top", type=int, default=10, help="Leaderboard entries to print (the report keeps all)")
+    parser.add_argument("--out", type=Path, help="Write the full JSON report here")
+    return parser
+
+
+def main() -> None:
+    parser = build_parser()
+    args = parser.parse_args()
+    if args.candidates < 0:
+        parser.error("--candidates must be non-negative")
+
+    cache = None
+    if args.cache is not None:
+        cache_dir: Path = args.cache
+        if not cache_dir.is_absolute():
+            cache_dir = (PROJECT_ROOT / cache_dir).resolve()
+        cache = SimCache(cache_dir)
+
+    started = time.perf_counter()
+    try:
+        report = tune(
+            args.space or GUARDRAIL_SPACE,
+            args.targets or MVP_TARGETS,
+            candidates=args.candidates,
+            sampler=args.sampler,
+            strategy=args.strategy,
+            sample_seed=args.seed,
+            min_seeds=args.min_seeds,
+            eta=args.eta,
+            seeds=args.seeds,
+            base=dict(args.overrides),
+            workers=args.workers,
+            chunk_size=args.chunk_size,
+            cache=cache,
+        )
+    except (TypeError, ValueError) as exc:
+        parser.error(str(exc))
+    report["seconds"] = round(time.perf_counter() - started, 3)
+
+    if args.out is not None:
+        args.out.parent.mkdir(parents=True, exist_ok=True)
+        args.out.write_text(json.dumps(report, indent=2), encoding="utf-8")
+    printed = dict(report, leaderboard=report["leaderboard"][: args.top])
+    print(json.dumps(printed, indent=2))
+
+
+if __name__ == "__main__":
+    main()
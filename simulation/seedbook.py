@@ -0,0 +1,263 @@
+"""Python port of the Godot seed layer (``game/echoes-mvp/core/seed``).
+
+Mirrors ``XXHash64.gd``, ``PCG32.gd``, ``SeedBook.gd`` (the pure derivations) and
+``SeedService.gd`` bit for bit, so a campaign seed yields the same named subseeds and
+the same draws in the sim as in the game.
+
+GDScript ints are signed 64-bit: products wrap, ``>>`` is an arithmetic shift and the
+scripts' ``& MASK64`` (``-1``) is a no-op. The port keeps values as signed Python ints
+and wraps with :func:`_s64`, so every right shift sign-extends exactly as in Godot.
+Two consequences worth knowing:
+
+- ``XXHash64.gd`` is *not* reference XXH64: it never mixes in the input length, its
+  merge rounds rotate the accumulator, and its rotations sign-fill negative values.
+  Its last avalanche shift sign-extends, so every hash comes out non-negative. Hashes
+  differ from ``xxhash.xxh64``; parity with the game is what counts.
+- ``PCG32.gd`` seeds via ``new_with_seed`` (PCG's two-step init with a stream-selected
+  increment), unlike :class:`simulation.prng.PCG32`, which takes a raw state. Its
+  outputs also differ from the unsigned generator whenever the state's top bit is set.
+  :class:`GodotPCG32` reproduces both.
+
+The sim's own encounter-flux stream still comes from ``PCG32(cfg.campaign_seed)`` so
+recorded seeds keep their outcomes; new random systems should draw from a named
+:class:`SeedService` stream instead, which leaves existing streams untouched.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict
+
+_MASK64 = (1 << 64) - 1
+_SIGN64 = 1 << 63
+_MULT = 6364136223846793005
+
+PRIME64_1 = -7046029288634856825
+PRIME64_2 = -4417276706812531889
+PRIME64_3 = 1609587929392839161
+PRIME64_4 = -8796714831421723037
+PRIME64_5 = 2870177450012600261
+
+DEFAULT_STREAM = 54
+# Godot's String.strip_edges() trims every code point <= 32 (space and ASCII controls).
+_EDGE_CHARS = "".join(chr(code) for code in range(33))
+
+
+def _s64(value: int) -> int:
+    """Wrap to a signed 64-bit int, as GDScript arithmetic does."""
+
+    value &= _MASK64
+    return value - (1 << 64) if value & _SIGN64 else value
+
+
+def _rotl(x: int, r: int) -> int:
+    # Port of _rotl164: the right shift is arithmetic, so negative inputs sign-fill.
+    x = _s64(x)
+    return _s64((x << r) | (x >> (64 - r)))
+
+
+def _round(acc: int, lane: int) -> int:
+    return _s64(_rotl(acc + _s64(lane * PRIME64_2), 31) * PRIME64_1)
+
+
+def _merge(h: int, v: int) -> int:
+    h ^= _s64(_rotl(_s64(v * PRIME64_2), 31) * PRIME64_1)
+    return _s64(_rotl(h, 27) * PRIME64_1 + PRIME64_4)
+
+
+def xxh64(data: bytes, seed: int = 0) -> int:
+    """Port of ``XXHash64.xxh64``; returns a signed 64-bit int like the GDScript."""
+
+    length = len(data)
+    p = 0
+    if length >= 32:
+        v1 = _s64(seed + PRIME64_1 + PRIME64_2)
+        v2 = _s64(seed + PRIME64_2)
+        v3 = _s64(seed)
+        v4 = _s64(seed - PRIME64_1)
+        limit = length - 32
+        while p <= limit:
+            v1 = _round(v1, int.from_bytes(data[p : p + 8], "little"))
+            v2 = _round(v2, int.from_bytes(data[p + 8 : p + 16], "little"))
+            v3 = _round(v3, int.from_bytes(data[p + 16 : p + 24], "little"))
+            v4 = _round(v4, int.from_bytes(data[p + 24 : p + 32], "little"))
+            p += 32
+        h = _s64(_rotl(v1, 1) + _rotl(v2, 7) + _rotl(v3, 12) + _rotl(v4, 18))
+        for lane in (v1, v2, v3, v4):
+            h = _merge(h, lane)
+    else:
+        h = _s64(seed + PRIME64_5)
+
+    while p + 8 <= length:
+        k1 = int.from_bytes(data[p : p + 8], "little")
+        h ^= _s64(_rotl(_s64(k1 * PRIME64_2), 31) * PRIME64_1)
+        h = _s64(_rotl(h, 27) * PRIME64_1 + PRIME64_4)
+        p += 8
+    if p + 4 <= length:
+        k2 = int.from_bytes(data[p : p + 4], "little")
+        h ^= _s64(k2 * PRIME64_1)
+        h = _s64(_rotl(h, 23) * PRIME64_2 + PRIME64_3)
+        p += 4
+    while p < length:
+        h ^= _s64(data[p] * PRIME64_5)
+        h = _s64(_rotl(h, 11) * PRIME64_1)
+        p += 1
+
+    h = _s64(h)
+    h ^= h >> 33
+    h = _s64(h * PRIME64_2)
+    h ^= h >> 29
+    h = _s64(h * PRIME64_3)
+    h ^= h >> 32
+    return _s64(h)
+
+
+def xxh64_string(text: str, seed: int = 0) -> int:
+    """Port of ``XXHash64.xxh64_string`` (UTF-8 bytes; the empty string hashes to 0)."""
+
+    if not text:
+        return 0
+    return xxh64(text.encode("utf-8"), seed)
+
+
+class GodotPCG32:
+    """Port of ``PCG32.gd`` (XSH-RR on a signed 64-bit state)."""
+
+    __slots__ = ("_state", "_inc")
+
+    def __init__(self) -> None:
+        self._state = 0
+        self._inc = 0
+
+    @classmethod
+    def new_with_seed(cls, seed_value: int, stream: int = DEFAULT_STREAM) -> "GodotPCG32":
+        rng = cls()
+        rng._inc = _s64((stream << 1) | 1) | 1
+        rng._state = 0
+        rng._step()
+        rng._state = _s64(rng._state + _s64(seed_value))
+        rng._step()
+        return rng
+
+    def _step(self) -> None:
+        self._state = _s64(self._state * _MULT + self._inc)
+
+    def next_u32(self) -> int:
+        oldstate = self._state
+        self._step()
+        xorshifted = (((oldstate >> 18) ^ oldstate) >> 27) & 0xFFFFFFFF
+        rot = (oldstate >> 59) & 31
+        return ((xorshifted >> rot) | (xorshifted << ((32 - rot) & 31))) & 0xFFFFFFFF
+
+    def next_float(self) -> float:
+        return self.next_u32() / 4294967296.0
+
+    def get_state(self) -> Dict[str, int]:
+        return {"state": self._state, "inc": self._inc}
+
+    def set_state(self, payload: Dict[str, Any]) -> None:
+        self._state = _s64(int(payload.get("state", 0)))
+        self._inc = _s64(int(payload.get("inc", 1)))
+
+    def advance(self, n: int) -> None:
+        """Same result as ``n`` calls to ``_step`` (the GDScript loops; this jumps)."""
+
+        if n <= 0:
+            return
+        cur_mult, cur_plus = _MULT, self._inc & _MASK64
+        acc_mult, acc_plus = 1, 0
+        while n:
+            if n & 1:
+                acc_mult = (acc_mult * cur_mult) & _MASK64
+                acc_plus = (acc_plus * cur_mult + cur_plus) & _MASK64
+            cur_plus = ((cur_mult + 1) * cur_plus) & _MASK64
+            cur_mult = (cur_mult * cur_mult) & _MASK64
+            n >>= 1
+        self._state = _s64(acc_mult * self._state + acc_plus)
+
+
+# -- SeedBook.gd derivations ---------------------------------------------------------
+
+
+def _canon(text: str) -> str:
+    return text.strip(_EDGE_CHARS).lower()
+
+
+def campaign_seed_from_inputs(player_id: str, mode: str, world_key: str) -> int:
+    return xxh64_string(f"campaign|pid={_canon(player_id)}|mode={_canon(mode)}|world={_canon(world_key)}")
+
+
+def derive_for_system(campaign_seed: int, system_key: str) -> int:
+    return xxh64_string(f"sys|{_s64(campaign_seed)}|{_canon(system_key)}")
+
+
+def derive_for_realm(campaign_seed: int, realm_index: int) -> int:
+    return xxh64_string(f"realm|{_s64(campaign_seed)}|{realm_index}")
+
+
+def derive_for_scope(campaign_seed: int, scope_path: str) -> int:
+    return xxh64_string(f"scope|{_s64(campaign_seed)}|{_canon(scope_path)}")
+
+
+def derive_with_salt(campaign_seed: int, scope_key: str, salt: str) -> int:
+    return xxh64_string(f"salt|{_s64(campaign_seed)}|{_canon(scope_key)}|{_canon(salt)}")
+
+
+# -- SeedService.gd ------------------------------------------------------------------
+
+
+class SeedService:
+    """Cached named PRNG streams for one campaign (port of the ``SeedService`` autoload).
+
+    Each stream is seeded only from the campaign seed and its own key, so streams are
+    independent: workers can rebuild any stream without coordinating, and adding a new
+    system never shifts the draws of an existing one.
+    """
+
+    def __init__(self, campaign_seed: int = 0) -> None:
+        self.campaign_seed = campaign_seed
+        self._cache: Dict[str, GodotPCG32] = {}
+
+    def init_with_campaign(self, seed_value: int) -> None:
+        self.campaign_seed = seed_value
+        self._cache.clear()
+
+    def rng_for_system(self, system_key: str, stream: int = DEFAULT_STREAM) -> GodotPCG32:
+        key = "sys|" + system_key
+        if key not in self._cache:
+            self._cache[key] = GodotPCG32.new_with_seed(derive_for_system(self.campaign_seed, system_key), stream)
+        return self._cache[key]
+
+    def rng_for_realm(self, realm_index: int, stream: int = DEFAULT_STREAM) -> GodotPCG32:
+        key = "realm|" + str(realm_index)
+        if key not in self._cache:
+            self._cache[key] = GodotPCG32.new_with_seed(derive_for_realm(self.campaign_seed, realm_index), stream)
+        return self._cache[key]
+
+    def rng_for_scope(self, scope_path: str, stream: int = DEFAULT_STREAM) -> GodotPCG32:
+        key = "scope|" + scope_path
+        if key not in self._cache:
+            self._cache[key] = GodotPCG32.new_with_seed(derive_for_scope(self.campaign_seed, scope_path), stream)
+        return self._cache[key]
+
+    def snapshot_state(self) -> Dict[str, Any]:
+        return {
+            "campaign_seed": self.campaign_seed,
+            "rng_states": {key: rng.get_state() for key, rng in self._cache.items()},
+            "version": 1,
+        }
+
+    def restore_state(self, save: Dict[str, Any]) -> None:
+        self.init_with_campaign(int(save.get("campaign_seed", 0)))
+        for key, state in save.get("rng_states", {}).items():
+            rng = self._ensure_rng_for_key(key)
+            if rng is not None:
+                rng.set_state(state)
+
+    def _ensure_rng_for_key(self, key: str):
+        if key.startswith("sys|"):
+            return self.rng_for_system(key[4:])
+        if key.startswith("realm|"):
+            return self.rng_for_realm(int(key[6:]))
+        if key.startswith("scope|"):
+            return self.rng_for_scope(key[6:])
+        return None
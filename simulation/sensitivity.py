@@ -0,0 +1,239 @@
+"""Global sensitivity analysis of KPIs over ``SimConfig`` ranges (Sobol and Morris).
+
+Both methods take a space of :class:`~simulation.tuning.Param` ranges and a list of
+per-run metrics from :data:`simulation.tuning.METRICS`. They run the whole design as
+summary-mode batches through :class:`~simulation.batch.BatchRunner`.
+
+- :func:`sobol_indices` uses the Saltelli design. Two base matrices ``A`` and ``B`` of
+  ``samples`` rows, plus one ``AB_i`` matrix per parameter (``A`` with column ``i``
+  taken from ``B``), give ``samples * (k + 2)`` runs. First-order indices use the
+  Saltelli (2010) estimator and total-order indices use Jansen's. ``A`` and ``B`` are
+  Latin hypercube samples drawn from the SeedBook ``sensitivity`` stream.
+- :func:`morris_effects` uses ``trajectories`` one-at-a-time paths across a
+  ``levels``-point grid, ``trajectories * (k + 1)`` runs in all. It reports the mean
+  (``mu``), mean absolute value (``mu_star``) and std (``sigma``) of each parameter's
+  elementary effects. These are scaled to the full parameter range, so ``mu_star`` is
+  in metric units per full sweep of the knob.
+
+Each design point is averaged over ``seeds``. One seed (the default) measures the knobs
+alone, without encounter-flux noise.
+"""
+
+from __future__ import annotations
+
+import math
+import os
+from typing import Any, Dict, List, Optional, Sequence
+
+from .batch import BatchRunner
+from .memo import SimCache
+from .seedbook import SeedService
+from .sim import SimConfig
+from .tuning import METRICS, Param
+
+Overrides = Dict[str, Any]
+Point = List[float]
+
+# The knobs designers keep asking about, over ranges the Pass-02 notes consider plausible.
+KPI_SPACE: List[Param] = [
+    Param("fear_per_encounter", 3.0, 12.0),
+    Param("encounters_per_day", 2, 7, integer=True),
+    Param("faith_initial", 40.0, 80.0),
+    Param("harmony_initial", 40.0, 70.0),
+    Param("favor_initial", 10.0, 30.0),
+    Param("realm_tier", 1, 5, integer=True),
+    Param("spike_guard_threshold", 80.0, 100.0),
+    Param("ward_beads_charges", 0, 4, integer=True),
+]
+KPI_METRICS = ("final_ase", "morale_min", "legacy_fragments")
+DEFAULT_SEEDS = (0xA2B94D10,)
+
+
+def _stream(seed: int):
+    return SeedService(seed).rng_for_system("sensitivity")
+
+
+def _unit_lhs(rng, rows: int, dims: int) -> List[Point]:
+    points: List[Point] = [[0.0] * dims for _ in range(rows)]
+    for dim in range(dims):
+        strata = list(range(rows))
+        for index in range(rows - 1, 0, -1):
+            swap = int(rng.next_float() * (index + 1))
+            strata[index], strata[swap] = strata[swap], strata[index]
+        for point, stratum in zip(points, strata):
+            point[dim] = (stratum + rng.next_float()) / rows
+    return points
+
+
+def _check(space: Sequence[Param], metrics: Sequence[str]) -> None:
+    if not space:
+        raise ValueError("need at least one parameter")
+    if not metrics:
+        raise ValueError("need at least one metric")
+    unknown = sorted(set(metrics) - set(METRICS))
+    if unknown:
+        raise ValueError(f"Unknown metrics {unknown}; expected some of {sorted(METRICS)}")
+
+
+def _evaluate(
+    space: Sequence[Param],
+    points: Sequence[Point],
+    metrics: Sequence[str],
+    base: Optional[Overrides],
+    seeds: Sequence[int],
+    workers: Optional[int],
+    chunk_size: int,
+    cache: Optional[SimCache],
+) -> tuple:
+    """Seed-averaged metric columns for ``points`` in the unit cube, and the run count."""
+
+    if not seeds:
+        raise ValueError("need at least one seed")
+    base = dict(base or {})
+    # Clamp float drift only; every design keeps its points inside the unit cube.
+    values = [{param.name: param.value(min(max(u, 0.0), 1.0)) for param, u in zip(space, point)} for point in points]
+    configs = [SimConfig.from_overrides({**base, **overrides, "campaign_seed": seed}) for overrides in values for seed in seeds]
+    with BatchRunner(workers or os.cpu_count() or 1, chunk_size, cache) as runner:
+        payloads = runner.run(configs)
+    width = len(seeds)
+    columns = {}
+    for name in metrics:
+        metric = METRICS[name]
+        values = [metric(payload) for payload in payloads]
+        columns[name] = [math.fsum(values[row : row + width]) / width for row in range(0, len(values), width)]
+    return columns, runner.runs
+
+
+def _variance(values: Sequence[float]) -> float:
+    mean = math.fsum(values) / len(values)
+    return math.fsum((value - mean) ** 2 for value in values) / len(values)
+
+
+def sobol_indices(
+    space: Sequence[Param] = KPI_SPACE,
+    metrics: Sequence[str] = KPI_METRICS,
+    samples: int = 256,
+    base: Optional[Overrides] = None,
+    seeds: Sequence[int] = DEFAULT_SEEDS,
+    sample_seed: int = 0,
+    workers: Optional[int] = 1,
+    chunk_size: int = 256,
+    cache: Optional[SimCache] = None,
+) -> Dict[str, Any]:
+    """First- and total-order Sobol indices of every metric for every parameter.
+
+    Returns a JSON-ready report. For each metric it holds the output ``variance`` and, per
+    parameter, ``first`` and ``total``. Both are ``None`` when the metric never varies.
+    Estimates carry sampling noise of roughly ``1 / sqrt(samples)``, so small negative
+    values mean "no effect".
+    """
+
+    _check(space, metrics)
+    if samples < 2:
+        raise ValueError("samples must be at least 2")
+    dims = len(space)
+    rng = _stream(sample_seed)
+    matrix_a = _unit_lhs(rng, samples, dims)
+    matrix_b = _unit_lhs(rng, samples, dims)
+    points = matrix_a + matrix_b
+    for dim in range(dims):
+        points.extend(row_a[:dim] + [row_b[dim]] + row_a[dim + 1 :] for row_a, row_b in zip(matrix_a, matrix_b))
+    columns, runs = _evaluate(space, points, metrics, base, seeds, workers, chunk_size, cache)
+
+    report: Dict[str, Any] = {}
+    for name in metrics:
+        values = columns[name]
+        f_a, f_b = values[:samples], values[samples : 2 * samples]
+        variance = _variance(f_a + f_b)
+        indices = {}
+        for dim, param in enumerate(space):
+            f_ab = values[(2 + dim) * samples : (3 + dim) * samples]
+            if variance == 0.0:
+                indices[param.name] = {"first": None, "total": None}
+                continue
+            first = math.fsum(b * (ab - a) for a, b, ab in zip(f_a, f_b, f_ab)) / samples / variance
+            total = math.fsum((a - ab) ** 2 for a, ab in zip(f_a, f_ab)) / (2 * samples) / variance
+            indices[param.name] = {"first": round(first, 4), "total": round(total, 4)}
+        report[name] = {"variance": round(variance, 6), "indices": indices}
+    return {
+        "method": "sobol",
+        "samples": samples,
+        "seeds": len(seeds),
+        "runs": runs,
+        "params": [param.name for param in space],
+        "metrics": report,
+    }
+
+
+def morris_effects(
+    space: Sequence[Param] = KPI_SPACE,
+    metrics: Sequence[str] = KPI_METRICS,
+    trajectories: int = 32,
+    levels: int = 4,
+    base: Optional[Overrides] = None,
+    seeds: Sequence[int] = DEFAULT_SEEDS,
+    sample_seed: int = 0,
+    workers: Optional[int] = 1,
+    chunk_size: int = 256,
+    cache: Optional[SimCache] = None,
+) -> Dict[str, Any]:
+    """Morris elementary-effect screening: ``mu``, ``mu_star`` and ``sigma`` per parameter.
+
+    Each trajectory starts at a random grid point and moves one parameter at a time, in
+    random order, by ``levels / (2 * (levels - 1))`` of its range. A step goes up when
+    there is room and down otherwise. ``levels`` must be even: that makes the step a
+    whole number of grid cells, so every point stays on the grid inside each range.
+    """
+
+    _check(space, metrics)
+    if trajectories < 1:
+        raise ValueError("trajectories must be at least 1")
+    if levels < 2 or levels % 2:
+        raise ValueError("levels must be an even number of at least 2")
+    dims = len(space)
+    delta = levels / (2 * (levels - 1))
+    rng = _stream(sample_seed)
+    points: List[Point] = []
+    steps: List[tuple] = []
+    for _ in range(trajectories):
+        point = [int(rng.next_float() * levels) / (levels - 1) for _ in range(dims)]
+        order = list(range(dims))
+        for index in range(dims - 1, 0, -1):
+            swap = int(rng.next_float() * (index + 1))
+            order[index], order[swap] = order[swap], order[index]
+        points.append(list(point))
+        for dim in order:
+            step = delta if point[dim] + delta <= 1.0 + 1e-9 else -delta
+            point[dim] += step
+            points.append(list(point))
+            steps.append((dim, step))
+    columns, runs = _evaluate(space, points, metrics, base, seeds, workers, chunk_size, cache)
+
+    report: Dict[str, Any] = {}
+    for name in metrics:
+        values = columns[name]
+        effects: List[List[float]] = [[] for _ in range(dims)]
+        for trajectory in range(trajectories):
+            offset = trajectory * (dims + 1)
+            for move in range(dims):
+                dim, step = steps[trajectory * dims + move]
+                effects[dim].append((values[offset + move + 1] - values[offset + move]) / step)
+        indices = {}
+        for param, samples in zip(space, effects):
+            mu = math.fsum(samples) / len(samples)
+            sigma = math.sqrt(math.fsum((effect - mu) ** 2 for effect in samples) / (len(samples) - 1)) if len(samples) > 1 else 0.0
+            indices[param.name] = {
+                "mu": round(mu, 4),
+                "mu_star": round(math.fsum(abs(effect) for effect in samples) / len(samples), 4),
+                "sigma": round(sigma, 4),
+            }
+        report[name] = {"indices": indices}
+    return {
+        "method": "morris",
+        "trajectories": trajectories,
+        "levels": levels,
+        "seeds": len(seeds),
+        "runs": runs,
+        "params": [param.name for param in space],
+        "metrics": report,
+    }
@@ -1,21 +1,23 @@
 """Deterministic MVP simulation loop for Echoes of the Sankofa."""
 
-from dataclasses import dataclass, asdict
-from typing import Any, Dict, List
+import itertools
+from dataclasses import dataclass, asdict, fields, replace
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
 
 from .curves import (
     ase_yield_per_tick,
-    ekwan_cost_for_tier,
+    clamp,
+    ekwan_upkeep_table,
     faith_recovery_step,
     harmony_efficiency,
     morale_decay_step,
 )
+from .daylog import ColumnarDailyLog, EventLog, RunningSummary
 from .models import RealmState, Sanctum
 from .prng import PCG32
+from .profiling import PhaseProfiler
 
-
-def _clamp(value: float, minimum: float, maximum: float) -> float:
-    return max(minimum, min(maximum, value))
+LOG_MODES = ("dicts", "columnar", "summary", "events")
 
 
 @dataclass
@@ -49,6 +51,37 @@ class SimConfig:
     retirement_rite_min_streak: int = 10
     retirement_rite_favor_cost: float = 3.0
 
+    @classmethod
+    def from_overrides(cls, overrides: Dict[str, Any]) -> "SimConfig":
+        """Build a config from a JSON-style mapping of field overrides.
+
+        Lists become tuples for the day-schedule fields and ``campaign_seed`` also accepts
+        ``"0x"``-prefixed strings; unknown keys raise ``ValueError``.
+        """
+
+        known = {item.name for item in fields(cls)}
+        unknown = sorted(set(overrides) - known)
+        if unknown:
+            raise ValueError(f"Unknown SimConfig field(s): {', '.join(unknown)}")
+
+        values: Dict[str, Any] = {}
+        for name, value in overrides.items():
+            if isinstance(value, list):
+                value = tuple(int(day) for day in value)
+            elif name == "campaign_seed" and isinstance(value, str):
+                value = int(value, 0)
+            values[name] = value
+        return cls(**values)
+
+
+_CONFIG_FIELDS = tuple(item.name for item in fields(SimConfig))
+
+
+def config_payload(cfg: SimConfig) -> Dict[str, Any]:
+    """``asdict(cfg)`` for the flat, tuple-only SimConfig, minus the deepcopy walk."""
+
+    return {name: getattr(cfg, name) for name in _CONFIG_FIELDS}
+
 
 @dataclass
 class DailyLog:
@@ -72,20 +105,222 @@ class DailyLog:
     voluntary_retirement: bool
 
 
-def run_economy_sim(cfg: SimConfig) -> Dict[str, Any]:
-    """Execute the MVP loop, fully driven by the campaign seed."""
+@dataclass
+class SimState:
+    """Everything the day loop carries from one day to the next.
+
+    ``day`` counts completed days. A state is plain data: :meth:`to_dict` gives a
+    JSON-safe snapshot and :meth:`from_dict` restores it, so a campaign can be
+    checkpointed, extended with :func:`step_days` or branched with :func:`resume`.
+    """
+
+    cfg: SimConfig
+    day: int
+    rng: PCG32
+    sanctum: Sanctum
+    morale: float
+    fear: float
+    legacy_fragments: int
+    voluntary_retirements: int
+    ward_bead_charges_remaining: int
+    courage_resistance_remaining: int
+    spike_guard_prevented_days: int
+    faith_guardrail_streak: int
+
+    def copy(self, cfg: Optional[SimConfig] = None) -> "SimState":
+        """Independent copy, optionally continuing under a different config."""
+
+        return replace(
+            self,
+            cfg=self.cfg if cfg is None else cfg,
+            rng=PCG32(self.rng.state, self.rng.inc),
+            sanctum=replace(self.sanctum),
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        payload = {name: getattr(self, name) for name in _STATE_SCALARS}
+        payload["cfg"] = config_payload(self.cfg)
+        payload["rng"] = {"state": self.rng.state, "inc": self.rng.inc}
+        payload["sanctum"] = asdict(self.sanctum)
+        return payload
+
+    @classmethod
+    def from_dict(cls, payload: Dict[str, Any]) -> "SimState":
+        return cls(
+            cfg=SimConfig.from_overrides(payload["cfg"]),
+            rng=PCG32(payload["rng"]["state"], payload["rng"]["inc"]),
+            sanctum=Sanctum(**payload["sanctum"]),
+            **{name: payload[name] for name in _STATE_SCALARS},
+        )
+
+
+_STATE_SCALARS = tuple(item.name for item in fields(SimState) if item.name not in {"cfg", "rng", "sanctum"})
+
+
+def initial_state(cfg: SimConfig) -> SimState:
+    """State before day 1 of ``cfg``'s campaign."""
 
-    rng = PCG32(cfg.campaign_seed)
     sanctum = Sanctum()
-    sanctum.faith = _clamp(cfg.faith_initial, 0.0, 100.0)
-    sanctum.harmony = _clamp(cfg.harmony_initial, 10.0, 100.0)
-    sanctum.favor = _clamp(cfg.favor_initial, 0.0, 100.0)
+    sanctum.faith = clamp(cfg.faith_initial, 0.0, 100.0)
+    sanctum.harmony = clamp(cfg.harmony_initial, 10.0, 100.0)
+    sanctum.favor = clamp(cfg.favor_initial, 0.0, 100.0)
+    return SimState(
+        cfg=cfg,
+        day=0,
+        rng=PCG32(cfg.campaign_seed),
+        sanctum=sanctum,
+        morale=80.0,
+        fear=25.0,
+        legacy_fragments=0,
+        voluntary_retirements=0,
+        ward_bead_charges_remaining=max(0, cfg.ward_beads_charges),
+        courage_resistance_remaining=0,
+        spike_guard_prevented_days=0,
+        faith_guardrail_streak=0,
+    )
+
+
+# -- Per-day rules ------------------------------------------------------------------
+# The engines (this loop, the batch kernel, rosters and realms) keep their day state in
+# locals and call these for every rule they share, so each rule is written once.
+
+
+def _economy_tick(
+    base_ase_tick: float, faith: float, harmony: float, ekwan: float, ase: float, ekwan_spend: float
+) -> Tuple[float, float, float, float]:
+    """Ase generation and realm upkeep (canon §12.1, §12.2, §12.5).
+
+    Returns ``(harmony_eff, ase_yield, ekwan, ase)``; the yield reads the opening Faith
+    and harmony.
+    """
+
+    harmony_eff = harmony_efficiency(harmony)
+    ase_yield = ase_yield_per_tick(base_ase_tick, faith) * harmony_eff
+    return (
+        harmony_eff,
+        ase_yield,
+        clamp(ekwan - ekwan_spend, 0.0, 9999.0),
+        max(0.0, ase + ase_yield - ekwan_spend * 0.35),
+    )
+
+
+def _fear_gain_multiplier(guardian: bool, resisting: bool, ward_beads: bool, spike_guard: bool) -> float:
+    """Share of the day's encounter fear that lands (canon §12.3 and the rituals)."""
+
+    multiplier = 1.0
+    if guardian:
+        multiplier *= 0.85
+    if resisting:
+        multiplier *= 0.5
+    if ward_beads:
+        multiplier *= 0.8
+    if spike_guard:
+        multiplier *= 0.7
+    return multiplier
+
+
+def _sanctum_drift(
+    faith: float, harmony: float, favor: float, fear: float, encounters: float
+) -> Tuple[float, float, float]:
+    """End-of-day Faith recovery, then harmony and favor drift (canon §12.4, §12.5).
+
+    Returns the new ``(faith, harmony, favor)``. Harmony reads the old favor; favor
+    reads the recovered Faith.
+    """
+
+    faith = clamp(faith_recovery_step(faith, harmony), 0.0, 100.0)
+    harmony = clamp(harmony + ((favor - 50.0) / 220.0 - fear / 500.0), 10.0, 100.0)
+    favor = clamp(favor + ((faith - 60.0) / 180.0 - encounters * 0.05), 0.0, 100.0)
+    return faith, harmony, favor
+
+
+def _faith_guardrail(cfg: SimConfig, faith: float, ase: float, streak: int) -> Tuple[float, float, int, bool]:
+    """Reflection prayer after ``faith_guardrail_required_days`` low-Faith days.
+
+    Returns ``(faith, ase, streak, used)``.
+    """
+
+    if faith < cfg.faith_guardrail_threshold:
+        streak += 1
+    else:
+        streak = 0
+    if cfg.faith_guardrail_required_days > 0 and streak >= cfg.faith_guardrail_required_days:
+        return max(faith, cfg.faith_guardrail_floor), max(0.0, ase - cfg.faith_guardrail_ase_cost), 0, True
+    return faith, ase, streak, False
+
+
+def _retirement_rite(cfg: SimConfig, spike_guard: bool, streak: int, favor: float) -> Tuple[float, int, bool]:
+    """Voluntary retirement once Spike Guard has held for ``retirement_rite_min_streak`` days.
+
+    Returns ``(favor, streak, used)``; the caller books the legacy fragment.
+    """
+
+    if cfg.retirement_rite_enabled and spike_guard and streak >= cfg.retirement_rite_min_streak:
+        return clamp(favor - cfg.retirement_rite_favor_cost, 0.0, 100.0), 0, True
+    return favor, streak, False
+
+
+def _log_row(
+    day: int,
+    ase: float,
+    faith: float,
+    harmony: float,
+    favor: float,
+    morale: float,
+    fear: float,
+    ase_yield: float,
+    ekwan_spend: float,
+    harmony_eff: float,
+    faith_recovered: float,
+    legacy_fragments: int,
+    *flags: bool,
+) -> Tuple[Any, ...]:
+    """One rounded day-log row in :class:`DailyLog` field order (``flags`` in ``FLAG_FIELDS`` order)."""
+
+    return (
+        day,
+        round(ase, 2),
+        round(faith, 2),
+        round(harmony, 2),
+        round(favor, 2),
+        round(morale, 2),
+        round(fear, 2),
+        round(ase_yield, 2),
+        round(ekwan_spend, 2),
+        round(harmony_eff, 3),
+        round(faith_recovered, 2),
+        legacy_fragments,
+        *flags,
+    )
+
+
+def _day_loop(
+    state: SimState,
+    last_day: Optional[int],
+    summary: Optional[RunningSummary] = None,
+    profiler: Optional[PhaseProfiler] = None,
+) -> Iterator[Optional[DailyLog]]:
+    """Advance ``state`` in place one day per step through ``last_day`` (``None``: forever).
+
+    Yields each day's :class:`DailyLog`, or ``None`` when the day is folded into
+    ``summary`` instead; a truthy ``summary.update`` return asks for that day's row too. ``state`` is synced before every yield, so a consumer that
+    stops early still holds a valid checkpoint. ``profiler`` receives phase marks,
+    branch counts and the synced state at the end of each day.
+    """
+
+    # simulation/batch.py:_run_campaign replays this loop's state plumbing on locals and
+    # calls the same per-day rule helpers; tests/test_batch.py fuzzes the two against
+    # each other.
+    cfg = state.cfg
+    rng = state.rng
+    sanctum = state.sanctum
     realm = RealmState(tier=cfg.realm_tier)
+    # The realm tier is fixed for the campaign, so its upkeep is a single table lookup.
+    ekwan_spend = ekwan_upkeep_table(cfg.base_ekwan_cost, realm.tier)[max(0, realm.tier)]
 
-    morale = 80.0
-    fear = 25.0
-    legacy_fragments = 0
-    log: List[DailyLog] = []
+    morale = state.morale
+    fear = state.fear
+    legacy_fragments = state.legacy_fragments
 
     courage_days = set(cfg.courage_ritual_days)
     ward_beads_days = set(cfg.ward_beads_days)
@@ -95,18 +330,23 @@ def run_economy_sim(cfg: SimConfig) -> Dict[str, Any]:
     if not ward_beads_days and cfg.ward_beads_charges > 0:
         auto_ward_schedule = set(cfg.ward_beads_auto_days)
 
-    ward_bead_charges_remaining = max(0, cfg.ward_beads_charges)
-    courage_resistance_remaining = 0
-    spike_guard_prevented_days = 0
-    voluntary_retirements = 0
-    faith_guardrail_streak = 0
+    ward_bead_charges_remaining = state.ward_bead_charges_remaining
+    courage_resistance_remaining = state.courage_resistance_remaining
+    spike_guard_prevented_days = state.spike_guard_prevented_days
+    voluntary_retirements = state.voluntary_retirements
+    faith_guardrail_streak = state.faith_guardrail_streak
 
-    for day in range(1, cfg.days + 1):
-        fear = _clamp(fear - 5.0, 0.0, 100.0)
-        morale = _clamp(morale + 5.0, 0.0, 100.0)
+    days = itertools.count(state.day + 1) if last_day is None else range(state.day + 1, last_day + 1)
+    for day in days:
+        if profiler is not None:
+            profiler.start_day()
+        fear = clamp(fear - 5.0, 0.0, 100.0)
+        morale = clamp(morale + 5.0, 0.0, 100.0)
 
         encounter_flux = 0.9 + 0.2 * rng.random()
         encounters_today = max(1, int(round(cfg.encounters_per_day * encounter_flux)))
+        if profiler is not None:
+            profiler.mark("encounter_flux")
 
         planned_courage = day in courage_days
         courage_ritual_skipped = False
@@ -118,144 +358,320 @@ def run_economy_sim(cfg: SimConfig) -> Dict[str, Any]:
         ):
             courage_ritual_skipped = True
             planned_courage = False
+            if profiler is not None:
+                profiler.branch("courage_ritual_skipped")
 
         ward_beads_today = False
         if day in ward_beads_days or day in auto_ward_schedule:
             if ward_bead_charges_remaining > 0:
                 ward_beads_today = True
                 ward_bead_charges_remaining -= 1
+                if profiler is not None:
+                    profiler.branch("ward_beads_used")
+        if profiler is not None:
+            profiler.mark("ritual_planning")
 
         forecast_fear_gain = encounters_today * cfg.fear_per_encounter
-        forecast_fear = _clamp(fear + forecast_fear_gain, 0.0, 100.0)
+        forecast_fear = clamp(fear + forecast_fear_gain, 0.0, 100.0)
         spike_guard_today = False
         if cfg.spike_guard_enabled and forecast_fear >= cfg.spike_guard_threshold:
             spike_guard_today = True
-            fear = _clamp(fear - 18.0, 0.0, 100.0)
-            morale = _clamp(morale + 12.0, 0.0, 100.0)
+            fear = clamp(fear - 18.0, 0.0, 100.0)
+            morale = clamp(morale + 12.0, 0.0, 100.0)
             spike_guard_prevented_days += 1
-
-        harmony_eff = harmony_efficiency(sanctum.harmony)
-
-        # Ase generation: Faith resonance first, Harmony lifts second (canon §12.1, §12.5)
-        ase_tick = ase_yield_per_tick(cfg.base_ase_tick, sanctum.faith)
-        ase_yield = ase_tick * harmony_eff
-
-        # Realm upkeep: spend ekwan, upkeep drains ase reserves (canon §12.2)
-        ekwan_spend = ekwan_cost_for_tier(cfg.base_ekwan_cost, realm.tier)
-        sanctum.ekwan = _clamp(sanctum.ekwan - ekwan_spend, 0.0, 9999.0)
-        sanctum.ase = max(0.0, sanctum.ase + ase_yield - ekwan_spend * 0.35)
+            if profiler is not None:
+                profiler.branch("spike_guard_used")
+        if profiler is not None:
+            profiler.mark("spike_guard")
+
+        # Ase generation (Faith resonance, lifted by harmony) and realm upkeep (canon §12.1, §12.2)
+        harmony_eff, ase_yield, sanctum.ekwan, sanctum.ase = _economy_tick(
+            cfg.base_ase_tick, sanctum.faith, sanctum.harmony, sanctum.ekwan, sanctum.ase, ekwan_spend
+        )
+        if profiler is not None:
+            profiler.mark("economy")
 
         # Courage rituals fire before the encounters begin; they pre-buffer morale and reduce fear
         courage_ritual_today = planned_courage
         if courage_ritual_today:
-            fear = _clamp(fear - 20.0, 0.0, 100.0)
-            morale = _clamp(morale + 25.0, 0.0, 100.0)
+            fear = clamp(fear - 20.0, 0.0, 100.0)
+            morale = clamp(morale + 25.0, 0.0, 100.0)
             courage_resistance_remaining = max(courage_resistance_remaining, 8)
+            if profiler is not None:
+                profiler.branch("courage_ritual_used")
 
         # Fear pressure shaped by encounters; Guardians mitigate decay (canon §12.3)
         guardian_today = cfg.guardian_present or sanctum.favor >= 65.0
-        fear_gain_multiplier = 1.0
-        if guardian_today:
-            fear_gain_multiplier *= 0.85
-        if courage_resistance_remaining > 0:
-            fear_gain_multiplier *= 0.5
-        if ward_beads_today:
-            fear_gain_multiplier *= 0.8
-        if spike_guard_today:
-            fear_gain_multiplier *= 0.7
+        resisting = courage_resistance_remaining > 0
+        if profiler is not None:
+            if guardian_today:
+                profiler.branch("guardian_active")
+            if resisting:
+                profiler.branch("courage_resistance_active")
+        fear_gain_multiplier = _fear_gain_multiplier(guardian_today, resisting, ward_beads_today, spike_guard_today)
         fear_gain = encounters_today * cfg.fear_per_encounter * fear_gain_multiplier
-        fear = _clamp(fear + fear_gain, 0.0, 100.0)
-        morale = _clamp(morale_decay_step(morale, fear, guardian=guardian_today), 0.0, 100.0)
+        fear = clamp(fear + fear_gain, 0.0, 100.0)
+        morale = clamp(morale_decay_step(morale, fear, guardian=guardian_today), 0.0, 100.0)
 
         if courage_resistance_remaining > 0:
-            fear = _clamp(fear - 5.0, 0.0, 100.0)
+            fear = clamp(fear - 5.0, 0.0, 100.0)
 
         # Legacy continuity: morale collapse becomes fragments and a reset (canon §12.6)
         if morale <= 0.0:
             legacy_fragments += 1
             morale = 45.0
-            fear = _clamp(fear * 0.6, 0.0, 100.0)
+            fear = clamp(fear * 0.6, 0.0, 100.0)
+            if profiler is not None:
+                profiler.branch("morale_collapse")
+        if profiler is not None:
+            profiler.mark("fear_morale")
 
-        # Faith rebounds with harmony; track recovery delta (canon §12.4)
+        # Faith rebounds with harmony, then harmony and favor drift (canon §12.4, §12.5)
         prior_faith = sanctum.faith
-        sanctum.faith = _clamp(faith_recovery_step(sanctum.faith, sanctum.harmony), 0.0, 100.0)
+        sanctum.faith, sanctum.harmony, sanctum.favor = _sanctum_drift(
+            sanctum.faith, sanctum.harmony, sanctum.favor, fear, encounters_today
+        )
         faith_recovered = sanctum.faith - prior_faith
+        if profiler is not None:
+            profiler.mark("faith_recovery")
 
-        # Emotional globals remain consistent and interdependent (canon §12.5)
-        harmony_shift = (sanctum.favor - 50.0) / 220.0 - fear / 500.0
-        sanctum.harmony = _clamp(sanctum.harmony + harmony_shift, 10.0, 100.0)
-
-        favor_shift = (sanctum.faith - 60.0) / 180.0 - encounters_today * 0.05
-        sanctum.favor = _clamp(sanctum.favor + favor_shift, 0.0, 100.0)
-
-        reflection_prayer_used = False
-        if sanctum.faith < cfg.faith_guardrail_threshold:
-            faith_guardrail_streak += 1
-        else:
-            faith_guardrail_streak = 0
-        if (
-            cfg.faith_guardrail_required_days > 0
-            and faith_guardrail_streak >= cfg.faith_guardrail_required_days
-        ):
-            sanctum.faith = max(sanctum.faith, cfg.faith_guardrail_floor)
-            sanctum.ase = max(0.0, sanctum.ase - cfg.faith_guardrail_ase_cost)
-            reflection_prayer_used = True
-            faith_guardrail_streak = 0
+        sanctum.faith, sanctum.ase, faith_guardrail_streak, reflection_prayer_used = _faith_guardrail(
+            cfg, sanctum.faith, sanctum.ase, faith_guardrail_streak
+        )
+        if profiler is not None:
+            if reflection_prayer_used:
+                profiler.branch("reflection_prayer_used")
+            profiler.mark("guardrail")
 
-        voluntary_retirement_today = False
-        if (
-            cfg.retirement_rite_enabled
-            and spike_guard_today
-            and spike_guard_prevented_days >= cfg.retirement_rite_min_streak
-        ):
+        sanctum.favor, spike_guard_prevented_days, voluntary_retirement_today = _retirement_rite(
+            cfg, spike_guard_today, spike_guard_prevented_days, sanctum.favor
+        )
+        if voluntary_retirement_today:
             legacy_fragments += 1
             voluntary_retirements += 1
-            sanctum.favor = _clamp(
-                sanctum.favor - cfg.retirement_rite_favor_cost, 0.0, 100.0
-            )
-            voluntary_retirement_today = True
-            spike_guard_prevented_days = 0
-
-        log.append(
-            DailyLog(
-                day=day,
-                ase=round(sanctum.ase, 2),
-                faith=round(sanctum.faith, 2),
-                harmony=round(sanctum.harmony, 2),
-                favor=round(sanctum.favor, 2),
-                morale=round(morale, 2),
-                fear=round(fear, 2),
-                ase_yield=round(ase_yield, 2),
-                ekwan_spend=round(ekwan_spend, 2),
-                harmony_efficiency=round(harmony_eff, 3),
-                faith_recovered=round(faith_recovered, 2),
-                legacy_fragments=legacy_fragments,
-                courage_ritual_used=courage_ritual_today,
-                ward_beads_used=ward_beads_today,
-                courage_ritual_skipped=courage_ritual_skipped,
-                spike_guard_used=spike_guard_today,
-                reflection_prayer_used=reflection_prayer_used,
-                voluntary_retirement=voluntary_retirement_today,
-            )
-        )
+            if profiler is not None:
+                profiler.branch("voluntary_retirement")
+        if profiler is not None:
+            profiler.mark("retirement_rite")
 
         if courage_resistance_remaining > 0:
             courage_resistance_remaining -= 1
 
+        state.day = day
+        state.morale = morale
+        state.fear = fear
+        state.legacy_fragments = legacy_fragments
+        state.voluntary_retirements = voluntary_retirements
+        state.ward_bead_charges_remaining = ward_bead_charges_remaining
+        state.courage_resistance_remaining = courage_resistance_remaining
+        state.spike_guard_prevented_days = spike_guard_prevented_days
+        state.faith_guardrail_streak = faith_guardrail_streak
+
+        entry = None
+        if summary is None or summary.update(
+            ase_yield,
+            morale,
+            fear,
+            courage_ritual_today,
+            ward_beads_today,
+            courage_ritual_skipped,
+            spike_guard_today,
+            reflection_prayer_used,
+            voluntary_retirement_today,
+        ):
+            entry = DailyLog(
+                *_log_row(
+                    day,
+                    sanctum.ase,
+                    sanctum.faith,
+                    sanctum.harmony,
+                    sanctum.favor,
+                    morale,
+                    fear,
+                    ase_yield,
+                    ekwan_spend,
+                    harmony_eff,
+                    faith_recovered,
+                    legacy_fragments,
+                    courage_ritual_today,
+                    ward_beads_today,
+                    courage_ritual_skipped,
+                    spike_guard_today,
+                    reflection_prayer_used,
+                    voluntary_retirement_today,
+                )
+            )
+        if profiler is not None:
+            profiler.end_day(state)
+        yield entry
+
+
+def _final(state: SimState) -> Dict[str, Any]:
+    sanctum = state.sanctum
     return {
-        "config": asdict(cfg),
-        "final": {
-            "ase": round(sanctum.ase, 2),
-            "faith": round(sanctum.faith, 2),
-            "harmony": round(sanctum.harmony, 2),
-            "favor": round(sanctum.favor, 2),
-            "morale": round(morale, 2),
-            "fear": round(fear, 2),
-            "legacy_fragments": legacy_fragments,
-            "voluntary_retirements": voluntary_retirements,
-        },
-        "log": [asdict(entry) for entry in log],
+        "ase": round(sanctum.ase, 2),
+        "faith": round(sanctum.faith, 2),
+        "harmony": round(sanctum.harmony, 2),
+        "favor": round(sanctum.favor, 2),
+        "morale": round(state.morale, 2),
+        "fear": round(state.fear, 2),
+        "legacy_fragments": state.legacy_fragments,
+        "voluntary_retirements": state.voluntary_retirements,
+    }
+
+
+def _play(
+    state: SimState,
+    last_day: int,
+    log_mode: str,
+    stop_when: Sequence[Any] = (),
+    profiler: Optional[PhaseProfiler] = None,
+    precision: Optional[int] = None,
+) -> Dict[str, Any]:
+    if log_mode not in LOG_MODES:
+        raise ValueError(f"log_mode must be one of {LOG_MODES}, received '{log_mode}'")
+
+    log: List[DailyLog] = []
+    columns: Optional[ColumnarDailyLog] = None
+    summary: Optional[RunningSummary] = None
+    events: Optional[EventLog] = None
+    if log_mode == "columnar":
+        columns = ColumnarDailyLog(last_day - state.day)
+    elif log_mode == "summary":
+        summary = RunningSummary()
+    elif log_mode == "events":
+        events = EventLog(state.day + 1, state.legacy_fragments)
+    days = _day_loop(state, last_day, summary, profiler)
+
+    stopped: Optional[Dict[str, Any]] = None
+    projected: Optional[SimState] = None
+    if stop_when:
+        monitors = [(condition.reason, condition.monitor(state)) for condition in stop_when]
+        for entry in days:
+            if columns is not None:
+                columns.append(entry)
+            elif events is not None:
+                events.append(entry)
+            elif summary is None:
+                log.append(entry)
+            for reason, monitor in monitors:
+                if monitor.check(state):
+                    projected = monitor.project(state, last_day)
+                    stopped = {"reason": reason, "day": state.day, "extrapolated": projected is not None}
+                    break
+            if stopped is not None:
+                break
+    elif columns is not None:
+        for entry in days:
+            columns.append(entry)
+    elif events is not None:
+        for entry in days:
+            events.append(entry)
+    elif summary is not None:
+        for _ in days:
+            pass
+    else:
+        log = list(days)
+
+    result: Dict[str, Any] = {
+        "config": config_payload(state.cfg),
+        "final": _final(state if projected is None else projected),
     }
+    if profiler is not None:
+        result["profile"] = profiler.as_dict()
+    if stop_when:
+        result["stop"] = stopped or {"reason": None, "day": state.day, "extrapolated": False}
+    if summary is not None:
+        result["summary"] = summary.as_dict()
+    elif events is not None:
+        result["event_log"] = events.as_dict(precision)
+    else:
+        result["log"] = columns if columns is not None else [asdict(entry) for entry in log]
+    return result
+
+
+def run_economy_sim(
+    cfg: SimConfig,
+    log_mode: str = "dicts",
+    stop_when: Sequence[Any] = (),
+    profiler: Optional[PhaseProfiler] = None,
+    precision: Optional[int] = None,
+) -> Dict[str, Any]:
+    """Execute the MVP loop, fully driven by the campaign seed.
+
+    ``log_mode="dicts"`` returns the day log as a list of dicts (the JSON report shape);
+    ``log_mode="columnar"`` returns a :class:`ColumnarDailyLog` with the same rows;
+    ``log_mode="summary"`` skips the day log entirely and returns a ``"summary"`` block
+    of running aggregates (see :class:`RunningSummary`) next to the same ``"final"``;
+    ``log_mode="events"`` replaces ``"log"`` with an ``"event_log"`` block (see
+    :class:`~simulation.daylog.EventLog`): dense float columns, rounded to at most
+    ``precision`` decimals when given, plus a sparse list of flag and fragment events.
+
+    ``stop_when`` takes early-termination conditions from :mod:`simulation.stopping`.
+    When any are given, the report gains a ``"stop"`` block with the firing condition's
+    ``reason`` (``None`` if the campaign ran to the end), the last simulated ``day`` and
+    whether ``"final"`` was ``extrapolated`` to ``cfg.days``.
+
+    ``profiler`` (a :class:`~simulation.profiling.PhaseProfiler`) instruments the loop;
+    its export lands in the report under ``"profile"``.
+    """
+
+    return _play(initial_state(cfg), cfg.days, log_mode, stop_when, profiler, precision)
+
+
+def iter_economy_sim(cfg: SimConfig) -> Iterator[Dict[str, Any]]:
+    """Stream ``cfg``'s day-log rows as they are computed, in constant memory.
+
+    Yields the same dicts as ``run_economy_sim(cfg)["log"]``; nothing is buffered, so
+    callers can stop early or pipe multi-year campaigns straight into a writer.
+    """
+
+    return iter_days(initial_state(cfg), cfg.days)
+
+
+def iter_days(state: SimState, n: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+    """Stream day-log rows while advancing ``state`` in place.
+
+    Runs ``n`` more days, or indefinitely when ``n`` is ``None``; ``state`` is a valid
+    checkpoint after every yielded row.
+    """
+
+    if n is not None and n < 0:
+        raise ValueError("n must be non-negative")
+    last_day = None if n is None else state.day + n
+    return (asdict(entry) for entry in _day_loop(state, last_day))
+
+
+def step_days(state: SimState, n: int) -> List[Dict[str, Any]]:
+    """Advance ``state`` in place by ``n`` days and return their day-log rows.
+
+    Days past ``state.cfg.days`` are allowed, so a 20-day campaign can be extended
+    to 365 days without replaying the first 20.
+    """
+
+    return list(iter_days(state, n))
+
+
+def resume(
+    state: SimState,
+    cfg: Optional[SimConfig] = None,
+    log_mode: str = "dicts",
+    stop_when: Sequence[Any] = (),
+    profiler: Optional[PhaseProfiler] = None,
+    precision: Optional[int] = None,
+) -> Dict[str, Any]:
+    """Finish a campaign from a snapshot without touching ``state``.
+
+    Runs days ``state.day + 1`` through ``cfg.days`` under ``cfg`` (default: the
+    state's own config), so one snapshot can fork several what-if branches. The report
+    has the :func:`run_economy_sim` shape, with a log covering only the resumed days
+    and ``"resumed_from_day"`` set to the fork point.
+    """
+
+    branch = state.copy(cfg)
+    result = _play(branch, branch.cfg.days, log_mode, stop_when, profiler, precision)
+    result["resumed_from_day"] = state.day
+    return result
 
 
 if __name__ == "__main__":
@@ -0,0 +1,190 @@
+"""Early-termination conditions for ``run_economy_sim``.
+
+A stop condition is a small picklable value object (so sweeps can ship it to worker
+processes). ``monitor(state)`` creates the per-run tracker; the sim calls its
+``check(state)`` after every day and ends the run on the first ``True``. A monitor may
+also ``project`` the stopped state forward to the campaign's last day, which is how
+:class:`SteadyState` lets a sweep skip the remaining days of a converged run.
+
+Conditions also round-trip through short text specs (``legacy_fragment``,
+``ase_below=50``, ``steady_state=0.001:30``) for CLIs and sweep manifests.
+"""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import List, Optional, Tuple, Union
+
+from .sim import SimState
+
+# Continuous fields a steady state extrapolates, with the clamps the day loop applies.
+STEADY_FIELDS: Tuple[Tuple[str, float, float], ...] = (
+    ("ase", 0.0, float("inf")),
+    ("faith", 0.0, 100.0),
+    ("harmony", 10.0, 100.0),
+    ("favor", 0.0, 100.0),
+    ("morale", 0.0, 100.0),
+    ("fear", 0.0, 100.0),
+)
+
+
+def _read(state: SimState, name: str) -> float:
+    if name in ("morale", "fear"):
+        return getattr(state, name)
+    return getattr(state.sanctum, name)
+
+
+def _write(state: SimState, name: str, value: float) -> None:
+    if name in ("morale", "fear"):
+        setattr(state, name, value)
+    else:
+        setattr(state.sanctum, name, value)
+
+
+class _Monitor(ABC):
+    @abstractmethod
+    def check(self, state: SimState) -> bool:
+        """``True`` once the run should stop after the day just simulated."""
+
+    def project(self, state: SimState, last_day: int) -> Optional[SimState]:
+        return None
+
+
+class _FirstLegacyFragmentMonitor(_Monitor):
+    def __init__(self, state: SimState) -> None:
+        self.baseline = state.legacy_fragments
+
+    def check(self, state: SimState) -> bool:
+        return state.legacy_fragments > self.baseline
+
+
+class _AseBelowMonitor(_Monitor):
+    def __init__(self, threshold: float) -> None:
+        self.threshold = threshold
+
+    def check(self, state: SimState) -> bool:
+        return state.sanctum.ase < self.threshold
+
+
+class _SteadyStateMonitor(_Monitor):
+    def __init__(self, condition: "SteadyState", state: SimState) -> None:
+        cfg = state.cfg
+        scheduled = list(cfg.courage_ritual_days or cfg.courage_auto_days)
+        if cfg.ward_beads_days:
+            scheduled.extend(cfg.ward_beads_days)
+        elif cfg.ward_beads_charges > 0:
+            scheduled.extend(cfg.ward_beads_auto_days)
+        self.quiet_after = max(scheduled, default=0)
+        self.epsilon = condition.epsilon
+        self.days = condition.days
+        self.extrapolate = condition.extrapolate
+        self.previous: Optional[List[float]] = None
+        self.deltas: Optional[List[float]] = None
+        self.counters = (state.legacy_fragments, state.voluntary_retirements)
+        self.streak = 0
+
+    def check(self, state: SimState) -> bool:
+        values = [_read(state, name) for name, _, _ in STEADY_FIELDS]
+        counters = (state.legacy_fragments, state.voluntary_retirements)
+        if self.previous is not None:
+            deltas = [value - prior for value, prior in zip(values, self.previous)]
+            if (
+                self.deltas is not None
+                and counters == self.counters
+                and all(abs(delta - prior) <= self.epsilon for delta, prior in zip(deltas, self.deltas))
+            ):
+                self.streak += 1
+            else:
+                self.streak = 0
+            self.deltas = deltas
+        self.previous = values
+        self.counters = counters
+        return self.streak >= self.days and state.day > self.quiet_after
+
+    def project(self, state: SimState, last_day: int) -> Optional[SimState]:
+        remaining = last_day - state.day
+        if not self.extrapolate or remaining <= 0 or self.deltas is None:
+            return None
+        projected = state.copy()
+        for (name, low, high), delta in zip(STEADY_FIELDS, self.deltas):
+            _write(projected, name, max(low, min(high, _read(state, name) + delta * remaining)))
+        projected.rng.advance(remaining)  # one encounter-flux draw per skipped day
+        projected.day = last_day
+        return projected
+
+
+@dataclass(frozen=True)
+class FirstLegacyFragment:
+    """Stop on the first morale collapse or retirement that earns a legacy fragment."""
+
+    reason = "legacy_fragment"
+
+    def monitor(self, state: SimState) -> _Monitor:
+        return _FirstLegacyFragmentMonitor(state)
+
+    def to_spec(self) -> str:
+        return self.reason
+
+
+@dataclass(frozen=True)
+class AseBelow:
+    """Stop once the Sanctum's ase reserve drops below ``threshold``."""
+
+    threshold: float
+    reason = "ase_below"
+
+    def monitor(self, state: SimState) -> _Monitor:
+        return _AseBelowMonitor(self.threshold)
+
+    def to_spec(self) -> str:
+        return f"{self.reason}={self.threshold!r}"
+
+
+@dataclass(frozen=True)
+class SteadyState:
+    """Stop once every global has moved by a constant per-day step for ``days`` days.
+
+    A constant step covers both fixed points (step 0) and the steady linear drift of
+    the ase reserve; steps may wobble by ``epsilon``. Counters (legacy fragments,
+    retirements) must not change inside the window, and no scheduled ritual may remain,
+    so ``days`` should exceed any event cycle you expect (e.g. the retirement streak).
+    With ``extrapolate`` the report's ``"final"`` is projected linearly (and clamped) to
+    the campaign's last day.
+    """
+
+    epsilon: float = 1e-3
+    days: int = 30
+    extrapolate: bool = True
+    reason = "steady_state"
+
+    def monitor(self, state: SimState) -> _Monitor:
+        return _SteadyStateMonitor(self, state)
+
+    def to_spec(self) -> str:
+        return f"{self.reason}={self.epsilon!r}:{self.days}"
+
+
+StopCondition = Union["FirstLegacyFragment", "AseBelow", "SteadyState"]
+
+
+def parse_stop_condition(spec: str) -> StopCondition:
+    """Parse a text spec (see module docstring) into a stop condition."""
+
+    name, _, argument = spec.strip().partition("=")
+    try:
+        if name == FirstLegacyFragment.reason and not argument:
+            return FirstLegacyFragment()
+        if name == AseBelow.reason and argument:
+            return AseBelow(float(argument))
+        if name == SteadyState.reason:
+            if not argument:
+                return SteadyState()
+            epsilon, _, days = argument.partition(":")
+            return SteadyState(float(epsilon), int(days)) if days else SteadyState(float(epsilon))
+    except ValueError as exc:
+        raise ValueError(f"Malformed stop condition '{spec}'") from exc
+    raise ValueError(
+        f"Unknown stop condition '{spec}'; expected legacy_fragment, ase_below=X or steady_state[=EPS[:DAYS]]"
+    )
+
@@ -0,0 +1,184 @@
+"""Parallel parameter sweeps over ``SimConfig`` with sharded JSON-lines output.
+
+A sweep is a list of ``SimConfig`` instances, usually expanded from a base override
+mapping, a grid of per-field value lists and a campaign seed range. Configs are cut
+into fixed-size chunks; each chunk is one work unit for the process pool and becomes
+one ``shard-NNNNN.jsonl`` (or columnar ``.simres``) file as soon as it finishes. ``manifest.json`` is written
+last and lists every shard, so a directory without a manifest is an unfinished sweep.
+"""
+
+from __future__ import annotations
+
+import itertools
+import json
+import os
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from .batch import BATCH_LOG_MODES, run_economy_sim_batch
+from .resultstore import RESULT_SUFFIX, open_results, write_results
+from .sim import SimConfig
+
+MANIFEST_NAME = "manifest.json"
+SHARD_TEMPLATE = "shard-{index:05d}{suffix}"
+SHARD_FORMATS = {"jsonl": ".jsonl", "simres": RESULT_SUFFIX}
+
+
+def expand_grid(
+    base: Optional[Dict[str, Any]] = None,
+    grid: Optional[Dict[str, Sequence[Any]]] = None,
+    seeds: Optional[Iterable[int]] = None,
+) -> List[SimConfig]:
+    """Cartesian product of ``grid`` values (and ``seeds``) layered over ``base`` overrides.
+
+    Grid keys vary slowest in insertion order and seeds vary fastest, so runs that share
+    a scenario sit next to each other in the shards.
+    """
+
+    base = dict(base or {})
+    grid = dict(grid or {})
+    if seeds is not None:
+        grid["campaign_seed"] = list(seeds)
+
+    keys = list(grid)
+    configs: List[SimConfig] = []
+    for combo in itertools.product(*(grid[key] for key in keys)):
+        overrides = dict(base)
+        overrides.update(zip(keys, combo))
+        configs.append(SimConfig.from_overrides(overrides))
+    return configs
+
+
+def load_spec(path: Path) -> List[SimConfig]:
+    """Expand a JSON sweep spec.
+
+    The spec is either ``{"configs": [overrides, ...]}`` or
+    ``{"base": {...}, "grid": {field: [values]}, "seeds": {"start": s, "count": n}}``.
+    """
+
+    spec = json.loads(Path(path).read_text())
+    if "configs" in spec:
+        base = spec.get("base", {})
+        return [SimConfig.from_overrides({**base, **overrides}) for overrides in spec["configs"]]
+
+    seeds = None
+    if "seeds" in spec:
+        start = spec["seeds"]["start"]
+        start = int(start, 0) if isinstance(start, str) else int(start)
+        seeds = range(start, start + int(spec["seeds"]["count"]))
+    return expand_grid(spec.get("base"), spec.get("grid"), seeds)
+
+
+def _chunks(configs: Sequence[SimConfig], chunk_size: int) -> Iterator[Tuple[int, int, Sequence[SimConfig]]]:
+    for index, offset in enumerate(range(0, len(configs), chunk_size)):
+        yield index, offset, configs[offset : offset + chunk_size]
+
+
+def _run_chunk(
+    offset: int, configs: Sequence[SimConfig], log_mode: str, stop_when: Sequence[Any] = ()
+) -> List[Dict[str, Any]]:
+    results = run_economy_sim_batch(configs, log_mode=log_mode, stop_when=stop_when)
+    for run_id, result in enumerate(results, start=offset):
+        result["run_id"] = run_id
+    return results
+
+
+def _write_shard(out_dir: Path, index: int, results: List[Dict[str, Any]], output_format: str) -> str:
+    name = SHARD_TEMPLATE.format(index=index, suffix=SHARD_FORMATS[output_format])
+    if output_format == "simres":
+        write_results(out_dir / name, results)
+        return name
+
+    tmp_path = out_dir / (name + ".tmp")
+    with tmp_path.open("w") as handle:
+        for result in results:
+            handle.write(json.dumps(result, separators=(",", ":")))
+            handle.write("\n")
+    tmp_path.replace(out_dir / name)
+    return name
+
+
+def run_sweep(
+    configs: Sequence[SimConfig],
+    out_dir: Path,
+    workers: Optional[int] = None,
+    chunk_size: int = 256,
+    log_mode: str = "dicts",
+    output_format: str = "jsonl",
+    stop_when: Sequence[Any] = (),
+) -> Dict[str, Any]:
+    """Run ``configs`` across a process pool and write one shard per chunk.
+
+    ``log_mode="summary"`` stores running aggregates instead of day logs (see
+    :func:`simulation.batch.run_economy_sim_batch`); ``output_format="simres"`` writes
+    columnar binary shards (see :mod:`simulation.resultstore`); ``stop_when`` ends runs
+    early (see :mod:`simulation.stopping`). ``workers=1`` runs in-process. At most
+    ``2 * workers`` chunks are in flight, so the parent never holds more than that many
+    chunks of results. Returns the manifest.
+    """
+
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be positive")
+    if log_mode not in BATCH_LOG_MODES:
+        raise ValueError(f"log_mode must be one of {BATCH_LOG_MODES}, received '{log_mode}'")
+    if output_format not in SHARD_FORMATS:
+        raise ValueError(f"output_format must be one of {tuple(SHARD_FORMATS)}, received '{output_format}'")
+    workers = workers or os.cpu_count() or 1
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    (out_dir / MANIFEST_NAME).unlink(missing_ok=True)
+
+    shards: Dict[int, Dict[str, Any]] = {}
+
+    def _record(index: int, offset: int, results: List[Dict[str, Any]]) -> None:
+        shards[index] = {
+            "file": _write_shard(out_dir, index, results, output_format),
+            "first_run_id": offset,
+            "runs": len(results),
+        }
+
+    work = _chunks(configs, chunk_size)
+    if workers == 1:
+        for index, offset, chunk in work:
+            _record(index, offset, _run_chunk(offset, chunk, log_mode, stop_when))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            pending: Dict[Future, Tuple[int, int]] = {}
+            for index, offset, chunk in work:
+                if len(pending) >= 2 * workers:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        _record(*pending.pop(future), future.result())
+                pending[pool.submit(_run_chunk, offset, chunk, log_mode, stop_when)] = (index, offset)
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    _record(*pending.pop(future), future.result())
+
+    manifest = {
+        "runs": len(configs),
+        "chunk_size": chunk_size,
+        "log_mode": log_mode,
+        "format": output_format,
+        "stop_when": [condition.to_spec() for condition in stop_when],
+        "shards": [shards[index] for index in sorted(shards)],
+    }
+    (out_dir / MANIFEST_NAME).write_text(json.dumps(manifest, indent=2))
+    return manifest
+
+
+def iter_shard_results(out_dir: Path) -> Iterator[Dict[str, Any]]:
+    """Yield every run payload of a finished sweep in ``run_id`` order."""
+
+    out_dir = Path(out_dir)
+    manifest = json.loads((out_dir / MANIFEST_NAME).read_text())
+    for shard in manifest["shards"]:
+        shard_path = out_dir / shard["file"]
+        if shard_path.suffix == RESULT_SUFFIX:
+            with open_results(shard_path) as store:
+                yield from store
+            continue
+        with shard_path.open() as handle:
+            for line in handle:
+                yield json.loads(line)
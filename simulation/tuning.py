@@ -0,0 +1,349 @@
+"""Automated tuning of ``SimConfig`` guardrails against declared KPI targets.
+
+A search space is a list of :class:`Param` ranges over ``SimConfig`` fields; targets are
+:class:`Target` bands on per-run metrics (see :data:`METRICS`) aggregated across
+campaign seeds. Candidates come from :func:`random_candidates` or
+:func:`latin_hypercube` and are scored by :class:`Tuner`, which runs every
+candidate/seed pair through the batch engine in summary mode, in parallel chunks, and
+keeps each run's metrics so a config is never simulated twice. An optional
+:class:`~simulation.memo.SimCache` extends that reuse across processes and sessions.
+
+:meth:`Tuner.full` scores every candidate on every seed; :meth:`Tuner.halving` runs
+successive halving, scoring all candidates on a few seeds and giving the survivors of
+each rung ``eta`` times more seeds.
+
+The loss of a candidate is ``sum(weight * (miss / scale) ** 2)`` over targets, where
+``miss`` is how far the aggregated metric falls outside its band (0 inside).
+"""
+
+from __future__ import annotations
+
+import os
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from .batch import BatchRunner
+from .memo import SimCache
+from .seedbook import SeedService
+from .sim import SimConfig, config_payload
+
+Overrides = Dict[str, Any]
+
+
+def _final(key: str) -> Callable[[Dict[str, Any]], float]:
+    return lambda payload: payload["final"][key]
+
+
+def _summary(key: str) -> Callable[[Dict[str, Any]], float]:
+    return lambda payload: payload["summary"][key]
+
+
+def _fragments_per_20d(payload: Dict[str, Any]) -> float:
+    days = payload["summary"]["days"]
+    return payload["final"]["legacy_fragments"] * 20.0 / days if days else 0.0
+
+
+# Per-run metrics over a summary-mode payload.
+METRICS: Dict[str, Callable[[Dict[str, Any]], float]] = {
+    "final_ase": _final("ase"),
+    "final_faith": _final("faith"),
+    "final_harmony": _final("harmony"),
+    "final_favor": _final("favor"),
+    "final_morale": _final("morale"),
+    "final_fear": _final("fear"),
+    "legacy_fragments": _final("legacy_fragments"),
+    "voluntary_retirements": _final("voluntary_retirements"),
+    "fragments_per_20d": _fragments_per_20d,
+    "morale_min": _summary("morale_min"),
+    "fear_max": _summary("fear_max"),
+    "ase_yield_last": _summary("ase_yield_last"),
+    "spike_guard_used": _summary("spike_guard_used"),
+    "courage_ritual_used": _summary("courage_ritual_used"),
+    "ward_beads_used": _summary("ward_beads_used"),
+    "reflection_prayer_used": _summary("reflection_prayer_used"),
+}
+
+STATS: Dict[str, Callable[[Sequence[float]], float]] = {
+    "mean": lambda values: sum(values) / len(values),
+    "min": min,
+    "max": max,
+}
+
+
+@dataclass(frozen=True)
+class Param:
+    """Inclusive ``[low, high]`` range for one ``SimConfig`` field."""
+
+    name: str
+    low: float
+    high: float
+    integer: bool = False
+
+    def __post_init__(self) -> None:
+        if self.name not in config_payload(SimConfig()):
+            raise ValueError(f"Unknown SimConfig field '{self.name}'")
+        if self.high < self.low:
+            raise ValueError(f"Param '{self.name}' has high < low")
+
+    def value(self, u: float) -> Any:
+        """Map ``u`` in ``[0, 1)`` onto the range."""
+
+        if self.integer:
+            span = int(self.high) - int(self.low) + 1
+            return int(self.low) + min(span - 1, int(u * span))
+        return round(self.low + (self.high - self.low) * u, 4)
+
+
+@dataclass(frozen=True)
+class Target:
+    """Band ``[low, high]`` (either end open) for a metric aggregated with ``stat``."""
+
+    metric: str
+    low: Optional[float] = None
+    high: Optional[float] = None
+    weight: float = 1.0
+    stat: str = "mean"
+    scale: float = 1.0
+
+    def __post_init__(self) -> None:
+        if self.metric not in METRICS:
+            raise ValueError(f"Unknown metric '{self.metric}'; expected one of {sorted(METRICS)}")
+        if self.stat not in STATS:
+            raise ValueError(f"Unknown stat '{self.stat}'; expected one of {sorted(STATS)}")
+
+    @property
+    def key(self) -> str:
+        return f"{self.metric}.{self.stat}"
+
+    def miss(self, value: float) -> float:
+        if self.low is not None and value < self.low:
+            return self.low - value
+        if self.high is not None and value > self.high:
+            return value - self.high
+        return 0.0
+
+
+# Pass-02 guardrails and the KPI bands they were hand-tuned towards.
+GUARDRAIL_SPACE: List[Param] = [
+    Param("spike_guard_threshold", 80.0, 100.0),
+    Param("ward_beads_charges", 0, 4, integer=True),
+    Param("faith_guardrail_threshold", 50.0, 70.0),
+    Param("faith_guardrail_floor", 55.0, 70.0),
+    Param("faith_guardrail_ase_cost", 5.0, 30.0),
+    Param("faith_guardrail_required_days", 1, 4, integer=True),
+    Param("retirement_rite_min_streak", 5, 15, integer=True),
+    Param("retirement_rite_favor_cost", 1.0, 6.0),
+]
+MVP_TARGETS: List[Target] = [
+    Target("final_harmony", 55.0, 60.0),
+    Target("morale_min", 70.0, None, stat="min"),
+    Target("fear_max", None, 90.0, stat="max"),
+    Target("fragments_per_20d", None, 1.0),
+]
+
+
+def _stream(seed: int):
+    return SeedService(seed).rng_for_system("tuning")
+
+
+def random_candidates(space: Sequence[Param], count: int, seed: int = 0) -> List[Overrides]:
+    """``count`` independent uniform draws from ``space``."""
+
+    rng = _stream(seed)
+    return [{param.name: param.value(rng.next_float()) for param in space} for _ in range(count)]
+
+
+def latin_hypercube(space: Sequence[Param], count: int, seed: int = 0) -> List[Overrides]:
+    """``count`` Latin hypercube samples: each param's range is cut into ``count`` strata
+    and every stratum is used exactly once, with strata shuffled independently per param."""
+
+    rng = _stream(seed)
+    candidates: List[Overrides] = [{} for _ in range(count)]
+    for param in space:
+        strata = list(range(count))
+        for index in range(count - 1, 0, -1):
+            swap = int(rng.next_float() * (index + 1))
+            strata[index], strata[swap] = strata[swap], strata[index]
+        for candidate, stratum in zip(candidates, strata):
+            candidate[param.name] = param.value((stratum + rng.next_float()) / count)
+    return candidates
+
+
+@dataclass
+class Evaluation:
+    """A candidate's score on its first ``seeds`` campaign seeds."""
+
+    overrides: Overrides
+    seeds: int
+    loss: float
+    metrics: Dict[str, float] = field(default_factory=dict)
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {"overrides": self.overrides, "seeds": self.seeds, "loss": self.loss, "metrics": self.metrics}
+
+
+def _key(cfg: SimConfig) -> tuple:
+    return tuple(config_payload(cfg).items())
+
+
+class Tuner:
+    """Scores candidate overrides against ``targets`` over ``seeds``.
+
+    ``base`` holds overrides shared by every run (e.g. ``{"realm_tier": 2}``); candidate
+    overrides are layered on top. Runs go through one :class:`~simulation.batch.BatchRunner`
+    in chunks of ``chunk_size``; inside a ``with`` block and with ``workers`` above 1 its
+    process pool lives as long as the block, so every halving rung reuses it. Per-run
+    metrics are memoised for the tuner's lifetime, and ``cache`` (a :class:`SimCache`)
+    also persists whole summary results.
+    """
+
+    def __init__(
+        self,
+        targets: Sequence[Target] = MVP_TARGETS,
+        seeds: Sequence[int] = range(0xA2B94D10, 0xA2B94D10 + 32),
+        base: Optional[Overrides] = None,
+        workers: Optional[int] = 1,
+        chunk_size: int = 64,
+        cache: Optional[SimCache] = None,
+    ) -> None:
+        if not targets:
+            raise ValueError("need at least one target")
+        if not seeds:
+            raise ValueError("need at least one seed")
+        self.targets = list(targets)
+        self.seeds = list(seeds)
+        self.base = dict(base or {})
+        self.workers = workers or os.cpu_count() or 1
+        self.cache = cache
+        self.metrics = sorted({target.metric for target in self.targets})
+        self._runner = BatchRunner(self.workers, chunk_size, cache)
+        self._memo: Dict[tuple, List[float]] = {}
+
+    def __enter__(self) -> "Tuner":
+        self._runner.__enter__()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self._runner.__exit__(*exc_info)
+
+    @property
+    def runs(self) -> int:
+        """Simulations actually executed (memo and cache hits excluded)."""
+
+        return self._runner.runs
+
+    def _config(self, overrides: Overrides, seed: int) -> SimConfig:
+        return SimConfig.from_overrides({**self.base, **overrides, "campaign_seed": seed})
+
+    def _fill(self, configs: List[SimConfig]) -> None:
+        """Compute metrics for every config not memoised yet."""
+
+        pending: Dict[tuple, SimConfig] = {}
+        for cfg in configs:
+            key = _key(cfg)
+            if key not in self._memo:
+                pending.setdefault(key, cfg)
+        if not pending:
+            return
+        for key, result in zip(pending, self._runner.run(list(pending.values()))):
+            self._memo[key] = [METRICS[name](result) for name in self.metrics]
+
+    def evaluate(self, candidates: Sequence[Overrides], seeds: Optional[int] = None) -> List[Evaluation]:
+        """Score ``candidates`` on the first ``seeds`` seeds (all by default), in order."""
+
+        count = len(self.seeds) if seeds is None else max(1, min(seeds, len(self.seeds)))
+        grid = [[self._config(overrides, seed) for seed in self.seeds[:count]] for overrides in candidates]
+        self._fill([cfg for row in grid for cfg in row])
+
+        evaluations = []
+        for overrides, row in zip(candidates, grid):
+            columns = list(zip(*(self._memo[_key(cfg)] for cfg in row)))
+            by_metric = dict(zip(self.metrics, columns))
+            metrics: Dict[str, float] = {}
+            loss = 0.0
+            for target in self.targets:
+                value = STATS[target.stat](by_metric[target.metric])
+                metrics[target.key] = round(value, 4)
+                loss += target.weight * (target.miss(value) / target.scale) ** 2
+            evaluations.append(Evaluation(dict(overrides), count, round(loss, 6), metrics))
+        return evaluations
+
+    def full(self, candidates: Sequence[Overrides]) -> List[Evaluation]:
+        """Every candidate on every seed, best (lowest loss) first."""
+
+        return sorted(self.evaluate(candidates), key=lambda evaluation: evaluation.loss)
+
+    def halving(self, candidates: Sequence[Overrides], min_seeds: int = 4, eta: int = 3) -> List[Evaluation]:
+        """Successive halving: keep the best ``1/eta`` per rung, with ``eta`` times the seeds.
+
+        Returns the final ranking (all seeds) followed by earlier-rung eliminations,
+        each group ordered by loss. Runs from earlier rungs are reused, so a survivor only
+        pays for its new seeds.
+        """
+
+        if eta < 2:
+            raise ValueError("eta must be at least 2")
+        pool = list(candidates)
+        seeds = max(1, min_seeds)
+        eliminated: List[List[Evaluation]] = []
+        while True:
+            ranked = sorted(self.evaluate(pool, seeds), key=lambda evaluation: evaluation.loss)
+            if len(ranked) <= 1 or seeds >= len(self.seeds):
+                break
+            keep = max(1, len(ranked) // eta)
+            eliminated.append(ranked[keep:])
+            pool = [evaluation.overrides for evaluation in ranked[:keep]]
+            seeds = min(len(self.seeds), seeds * eta)
+        if seeds < len(self.seeds):
+            ranked = sorted(self.evaluate(pool), key=lambda evaluation: evaluation.loss)
+        return ranked + [evaluation for rung in reversed(eliminated) for evaluation in rung]
+
+
+def tune(
+    space: Sequence[Param] = GUARDRAIL_SPACE,
+    targets: Sequence[Target] = MVP_TARGETS,
+    candidates: int = 64,
+    sampler: str = "lhs",
+    strategy: str = "halving",
+    sample_seed: int = 0,
+    min_seeds: int = 4,
+    eta: int = 3,
+    **tuner_options: Any,
+) -> Dict[str, Any]:
+    """Sample ``candidates`` points from ``space`` and rank them against ``targets``.
+
+    The config implied by ``tuner_options["base"]`` alone (the current defaults for the
+    searched fields) always competes as the ``"baseline"`` entry. ``tuner_options`` are
+    passed to :class:`Tuner`. Returns a JSON-ready report.
+    """
+
+    samplers = {"lhs": latin_hypercube, "random": random_candidates}
+    if sampler not in samplers:
+        raise ValueError(f"sampler must be one of {tuple(samplers)}, received '{sampler}'")
+    if strategy not in {"full", "halving"}:
+        raise ValueError(f"strategy must be 'full' or 'halving', received '{strategy}'")
+
+    with Tuner(targets, **tuner_options) as tuner:
+        base_cfg = config_payload(SimConfig.from_overrides(tuner.base))
+        baseline = {param.name: base_cfg[param.name] for param in space}
+        pool = [baseline] + samplers[sampler](space, candidates, sample_seed)
+        if strategy == "full":
+            ranked = tuner.full(pool)
+        else:
+            ranked = tuner.halving(pool, min_seeds=min_seeds, eta=eta)
+
+    reference = next(evaluation for evaluation in ranked if evaluation.overrides == baseline)
+    return {
+        "sampler": sampler,
+        "strategy": strategy,
+        "candidates": len(pool),
+        "seeds": len(tuner.seeds),
+        "runs": tuner.runs,
+        "targets": [
+            {"metric": t.metric, "stat": t.stat, "low": t.low, "high": t.high, "weight": t.weight, "scale": t.scale}
+            for t in tuner.targets
+        ],
+        "best": ranked[0].as_dict(),
+        "baseline": reference.as_dict(),
+        "leaderboard": [evaluation.as_dict() for evaluation in ranked],
+    }
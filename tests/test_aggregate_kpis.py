@@ -0,0 +1,118 @@
+"""Streaming KPI aggregation tests."""
+
+import csv
+import json
+import random
+import statistics
+
+from simulation import SimConfig, run_economy_sim
+from simulation.resultstore import write_results
+from simulation.scripts import aggregate_kpis
+from simulation.scripts.aggregate_kpis import StreamingStats, iter_run_summaries
+from simulation.sweep import expand_grid, run_sweep
+
+
+def test_streaming_stats_track_exact_moments_and_close_quantiles():
+    rng = random.Random(7)
+    values = [rng.gauss(100.0, 15.0) for _ in range(20000)]
+    stats = StreamingStats()
+    for value in values:
+        stats.add(value)
+
+    ordered = sorted(values)
+    assert abs(stats.mean - statistics.fmean(values)) < 1e-9
+    assert abs(stats.std - statistics.stdev(values)) < 1e-6
+    assert stats.minimum == ordered[0] and stats.maximum == ordered[-1]
+    for p in (0.1, 0.5, 0.9):
+        assert abs(stats.quantile(p) - ordered[int(p * len(ordered))]) < 1.0
+
+
+def test_small_samples_use_exact_quantiles():
+    stats = StreamingStats()
+    for value in (4.0, 1.0, 3.0):
+        stats.add(value)
+    assert stats.quantile(0.5) == 3.0
+
+
+def test_stream_reads_json_jsonl_simres_and_sweep_dirs(tmp_path):
+    single = tmp_path / "single.json"
+    single.write_text(json.dumps(run_economy_sim(SimConfig(days=5))))
+    write_results(tmp_path / "binary.simres", [run_economy_sim(SimConfig(days=5, campaign_seed=s)) for s in range(3)])
+    sweep_dir = tmp_path / "sweep"
+    run_sweep(expand_grid({"days": 5}, None, range(4)), sweep_dir, workers=1, chunk_size=3, log_mode="summary")
+
+    names = [run.name for run in iter_run_summaries([str(single), str(tmp_path / "*.simres"), str(sweep_dir)])]
+    assert names[0] == "single"
+    assert names[1:4] == ["binary:0", "binary:1", "binary:2"]
+    assert len(names) == 8
+
+
+def test_event_log_payloads_summarise_like_day_logs(tmp_path):
+    cfg = SimConfig(days=40, encounters_per_day=5, fear_per_encounter=12.0, spike_guard_threshold=70.0)
+    path = tmp_path / "events.json"
+    path.write_text(json.dumps(run_economy_sim(cfg, log_mode="events")))
+
+    (from_events,) = iter_run_summaries([str(path)])
+    expected = aggregate_kpis.RunSummary.from_payload("events", run_economy_sim(cfg))
+    assert from_events == expected
+
+
+def test_cli_streams_inputs_into_csv_and_md(tmp_path):
+    sweep_dir = tmp_path / "sweep"
+    run_sweep(expand_grid({"days": 6}, {"encounters_per_day": [2, 6]}, range(5)), sweep_dir, workers=1, chunk_size=4)
+    out_dir = tmp_path / "kpis"
+
+    aggregate_kpis.main([str(sweep_dir / "manifest.json"), "--out_dir", str(out_dir), "--md_run_limit", "2"])
+
+    with (out_dir / "mvp_ready_numbers.csv").open() as handle:
+        rows = list(csv.reader(handle))
+    assert rows[0] == aggregate_kpis.CSV_HEADER
+    assert len(rows) == 11
+    markdown = (out_dir / "mvp_ready_numbers.md").read_text()
+    assert "**Distribution over 10 runs**" in markdown
+    assert "**Legacy fragments histogram**" in markdown
+
+
+def test_summary_cache_reuses_unchanged_files_and_reparses_edits(tmp_path):
+    from simulation.scripts.aggregate_kpis import SummaryCache
+
+    sweep_dir = tmp_path / "sweep"
+    run_sweep(expand_grid({"days": 4}, None, range(6)), sweep_dir, workers=1, chunk_size=2)
+    cache = SummaryCache(tmp_path / "cache")
+
+    first = list(iter_run_summaries([str(sweep_dir)], cache=cache))
+    assert (cache.hits, cache.misses) == (0, 3)
+
+    # Same bytes with a new mtime still hits via the content hash.
+    shard = sweep_dir / "shard-00001.jsonl"
+    shard.write_bytes(shard.read_bytes())
+    assert list(iter_run_summaries([str(sweep_dir)], cache=cache)) == first
+    assert (cache.hits, cache.misses) == (3, 3)
+
+    lines = shard.read_text().splitlines()
+    shard.write_text(lines[0] + "\n")
+    rerun = list(iter_run_summaries([str(sweep_dir)], cache=cache))
+    assert len(rerun) == 5
+    assert (cache.hits, cache.misses) == (5, 4)
+
+
+def test_parallel_summaries_preserve_input_order(tmp_path):
+    sweep_dir = tmp_path / "sweep"
+    run_sweep(expand_grid({"days": 3}, None, range(9)), sweep_dir, workers=1, chunk_size=2)
+
+    serial = list(iter_run_summaries([str(sweep_dir)]))
+    parallel = list(iter_run_summaries([str(sweep_dir)], workers=2))
+    assert parallel == serial
+
+
+def test_regression_logs_load_through_the_cache_and_pool(tmp_path):
+    from simulation.scripts.aggregate_kpis import LOG_DIR, RUN_FILES, RunSummary, SummaryCache, _load_runs
+
+    expected = [
+        RunSummary.from_payload(name, json.loads((LOG_DIR / filename).read_text()))
+        for name, filename in RUN_FILES.items()
+    ]
+    cache = SummaryCache(tmp_path / "cache")
+    assert _load_runs(cache, workers=2) == expected
+    assert _load_runs(cache) == expected
+    assert (cache.hits, cache.misses) == (len(RUN_FILES), len(RUN_FILES))
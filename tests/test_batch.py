@@ -0,0 +1,106 @@
+"""Batch engine parity tests against the scalar MVP loop."""
+
+import json
+import random
+
+from simulation import SimConfig, run_economy_sim, run_economy_sim_batch
+
+
+def _sweep_configs():
+    configs = []
+    for offset in range(24):
+        configs.append(
+            SimConfig(
+                campaign_seed=0xA2B94D10 + offset * 7919,
+                days=20 + offset,
+                realm_tier=1 + offset % 5,
+                encounters_per_day=1 + offset % 7,
+                fear_per_encounter=4.0 + (offset % 6) * 2.5,
+                guardian_present=offset % 5 == 0,
+                faith_initial=40.0 + offset,
+                harmony_initial=35.0 + offset,
+                courage_ritual_days=(3, 11) if offset % 3 == 0 else (),
+                ward_beads_days=(2,) if offset % 4 == 0 else (),
+                skip_courage_when_comfortable=offset % 2 == 0,
+                spike_guard_threshold=70.0 + offset,
+                retirement_rite_min_streak=1 + offset % 4,
+            )
+        )
+    # Morale collapse path: no Spike Guard, heavy encounter pressure.
+    configs.append(
+        SimConfig(days=40, encounters_per_day=6, fear_per_encounter=18.0, spike_guard_enabled=False)
+    )
+    return configs
+
+
+def test_batch_matches_scalar_bit_for_bit():
+    configs = _sweep_configs()
+    batch = run_economy_sim_batch(configs)
+    scalar = [run_economy_sim(cfg) for cfg in configs]
+
+    assert len(batch) == len(configs)
+    assert json.dumps(batch) == json.dumps(scalar)
+
+
+def test_batch_preserves_input_order_and_handles_empty_input():
+    configs = [SimConfig(days=3, campaign_seed=seed) for seed in (5, 1, 3)]
+    results = run_economy_sim_batch(configs)
+
+    assert [r["config"]["campaign_seed"] for r in results] == [5, 1, 3]
+    assert run_economy_sim_batch([]) == []
+
+
+def test_batch_summary_mode_matches_scalar_summary():
+    configs = _sweep_configs()
+    batch = run_economy_sim_batch(configs, log_mode="summary")
+    scalar = [run_economy_sim(cfg, log_mode="summary") for cfg in configs]
+
+    assert batch == scalar
+
+
+def _random_config(rng):
+    def days(limit):
+        return tuple(sorted(rng.sample(range(1, limit + 1), rng.randint(0, min(3, limit)))))
+
+    length = rng.randint(1, 120)
+    return SimConfig(
+        campaign_seed=rng.getrandbits(64),
+        days=length,
+        base_ase_tick=rng.uniform(20.0, 80.0),
+        base_ekwan_cost=rng.uniform(5.0, 20.0),
+        realm_tier=rng.randint(1, 10),
+        fear_per_encounter=rng.uniform(0.0, 20.0),
+        encounters_per_day=rng.randint(0, 8),
+        guardian_present=rng.random() < 0.3,
+        faith_initial=rng.uniform(20.0, 95.0),
+        harmony_initial=rng.uniform(10.0, 95.0),
+        favor_initial=rng.uniform(0.0, 60.0),
+        courage_ritual_days=days(length),
+        ward_beads_days=days(length),
+        courage_auto_days=days(length),
+        ward_beads_auto_days=days(length),
+        ward_beads_charges=rng.randint(0, 4),
+        skip_courage_when_comfortable=rng.random() < 0.5,
+        spike_guard_enabled=rng.random() < 0.8,
+        spike_guard_threshold=rng.uniform(50.0, 100.0),
+        faith_guardrail_threshold=rng.uniform(40.0, 80.0),
+        faith_guardrail_required_days=rng.randint(1, 5),
+        faith_guardrail_floor=rng.uniform(40.0, 80.0),
+        faith_guardrail_ase_cost=rng.uniform(0.0, 30.0),
+        retirement_rite_enabled=rng.random() < 0.8,
+        retirement_rite_min_streak=rng.randint(1, 15),
+        retirement_rite_favor_cost=rng.uniform(0.0, 10.0),
+    )
+
+
+def test_batch_matches_scalar_across_random_configs():
+    # The batch kernel re-plumbs sim._day_loop's state on locals; fuzz every knob so a
+    # change to the plumbing of only one of them shows up here.
+    rng = random.Random(0x5A4B)
+    configs = [_random_config(rng) for _ in range(400)]
+
+    for log_mode in ("dicts", "summary"):
+        batch = run_economy_sim_batch(configs, log_mode=log_mode)
+        scalar = [run_economy_sim(cfg, log_mode=log_mode) for cfg in configs]
+        mismatched = [cfg for cfg, left, right in zip(configs, batch, scalar) if json.dumps(left) != json.dumps(right)]
+        assert not mismatched, f"{log_mode}: {len(mismatched)} configs diverge, first {mismatched[0]}"
@@ -0,0 +1,58 @@
+"""Benchmark harness smoke tests (selection, report shape, baseline comparison)."""
+
+import json
+
+import pytest
+
+from simulation.bench import BENCHMARKS, _bench, compare, run_benchmarks, select
+from simulation.scripts import run_bench
+
+
+def test_selection_skips_slow_benchmarks_unless_asked():
+    fast = {bench.name for bench in select()}
+    assert "sim.run_economy_sim.365d" in fast
+    assert "sim.run_economy_sim.3650d" not in fast
+    assert {bench.name for bench in select(["sim.*"], include_slow=True)} >= {
+        "sim.run_economy_sim.20d",
+        "sim.run_economy_sim.3650d",
+    }
+    assert [bench.name for bench in select(["batch.summary.10000x20d"])] == ["batch.summary.10000x20d"]
+    assert all(name == bench.name and bench.ops > 0 for name, bench in BENCHMARKS.items())
+    assert all(part for name in BENCHMARKS for part in name.split("."))
+    with pytest.raises(ValueError):
+        _bench("sim.run_economy_sim.20d")(lambda workdir: lambda: None)
+
+
+def test_report_is_json_and_compares_against_a_baseline():
+    report = run_benchmarks(select(["curves.harmony_efficiency", "io.simres.*"]), repeat=2, min_time=0.001)
+    report = json.loads(json.dumps(report))
+    assert set(report["results"]) == {
+        "curves.harmony_efficiency",
+        "io.simres.write",
+        "io.simres.read_column",
+        "io.simres.read_payloads",
+    }
+    result = report["results"]["curves.harmony_efficiency"]
+    assert result["best_s"] <= result["median_s"]
+    assert result["per_op_ns"] == result["best_s"] / result["ops"] * 1e9
+
+    slower = json.loads(json.dumps(report))
+    for entry in slower["results"].values():
+        entry["best_s"] /= 2
+    rows = compare(report, slower, threshold=0.10)
+    assert len(rows) == 4 and all(row["regressed"] for row in rows)
+    assert not any(row["regressed"] for row in compare(report, report))
+
+
+def test_cli_exits_nonzero_on_regression(tmp_path, capsys):
+    baseline = tmp_path / "baseline.json"
+    args = ["curves.harmony_efficiency", "--repeat", "1", "--min_time", "0.001"]
+    assert run_bench.main(args + ["--out", str(baseline)]) == 0
+
+    stored = json.loads(baseline.read_text())
+    stored["results"]["curves.harmony_efficiency"]["best_s"] /= 1000
+    baseline.write_text(json.dumps(stored))
+    capsys.readouterr()
+    assert run_bench.main(args + ["--baseline", str(baseline)]) == 1
+    report = json.loads(capsys.readouterr().out)
+    assert report["comparison"]["rows"][0]["regressed"]
@@ -1,10 +1,18 @@
 """Curve regression tests anchored to canon §12."""
 
 from simulation.curves import (
+    MoraleDecayTable,
     ase_yield_per_tick,
+    ase_yield_per_tick_array,
     ekwan_cost_for_tier,
+    ekwan_cost_for_tiers,
+    ekwan_upkeep_table,
     faith_recovery_step,
+    faith_recovery_step_array,
     harmony_efficiency,
+    harmony_efficiency_array,
+    morale_decay_step,
+    morale_decay_step_array,
 )
 
 
@@ -41,3 +49,34 @@ def test_ekwan_tier_scaling_geometric():
 
     assert tier_five > tier_one
     assert round(tier_five / tier_one, 2) == round(1.28 ** 4, 2)
+
+
+def test_array_curves_match_scalar_curves_exactly():
+    levels = [-20.0, 0.0, 12.5, 37.3, 50.0, 61.7, 99.9, 100.0, 140.0]
+    guardians = [index % 2 == 0 for index in range(len(levels))]
+
+    assert list(ase_yield_per_tick_array(50.0, levels)) == [ase_yield_per_tick(50.0, v) for v in levels]
+    assert list(harmony_efficiency_array(levels)) == [harmony_efficiency(v) for v in levels]
+    assert list(faith_recovery_step_array(levels, 55.0)) == [faith_recovery_step(v, 55.0) for v in levels]
+    assert list(morale_decay_step_array(80.0, levels, guardians)) == [
+        morale_decay_step(80.0, v, guardian=g) for v, g in zip(levels, guardians)
+    ]
+    tiers = [-1, 0, 1, 2, 5, 9]
+    assert list(ekwan_cost_for_tiers(12.0, tiers)) == [ekwan_cost_for_tier(12.0, t) for t in tiers]
+    assert ekwan_upkeep_table(12.0, 9)[9] == ekwan_cost_for_tier(12.0, 9)
+
+
+def test_morale_decay_table_stays_within_its_error_bound():
+    for guardian in (False, True):
+        table = MoraleDecayTable(guardian=guardian)
+        assert table.error_bound < 1e-3
+        worst = max(
+            abs(table.step(80.0, fear / 100.0) - morale_decay_step(80.0, fear / 100.0, guardian=guardian))
+            for fear in range(-100, 10001)
+        )
+        assert worst <= table.error_bound + 1e-12
+        # Outside the table the exact curve takes over.
+        assert table.step(80.0, 130.0) == morale_decay_step(80.0, 130.0, guardian=guardian)
+
+    coarse = MoraleDecayTable(cells_per_point=1)
+    assert coarse.error_bound > MoraleDecayTable(cells_per_point=8).error_bound
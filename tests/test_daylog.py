@@ -0,0 +1,81 @@
+"""Columnar and event-sparse day-log storage tests."""
+
+import json
+from dataclasses import fields
+
+import pytest
+
+from simulation import SimConfig, run_economy_sim
+from simulation.daylog import FLAG_FIELDS, FRAGMENT_EVENT, LOG_FIELDS, ColumnarDailyLog, event_counts
+from simulation.sim import DailyLog, initial_state, resume, step_days
+
+
+def test_schema_tracks_daily_log_fields():
+    assert LOG_FIELDS == tuple(field.name for field in fields(DailyLog))
+
+
+def test_columnar_rows_match_dict_log():
+    cfg = SimConfig(days=40, encounters_per_day=5, fear_per_encounter=12.0, spike_guard_threshold=70.0)
+    dicts = run_economy_sim(cfg)
+    columnar = run_economy_sim(cfg, log_mode="columnar")
+
+    log = columnar["log"]
+    assert isinstance(log, ColumnarDailyLog)
+    assert columnar["final"] == dicts["final"]
+    assert json.dumps(log.to_dicts()) == json.dumps(dicts["log"])
+    assert log[-1] == dicts["log"][-1]
+    assert log[2:4] == dicts["log"][2:4]
+    assert list(log.column("morale")) == [entry["morale"] for entry in dicts["log"]]
+    for flag in ("spike_guard_used", "voluntary_retirement", "ward_beads_used"):
+        assert log.flag_count(flag) == sum(1 for entry in dicts["log"] if entry[flag])
+
+
+def test_columnar_log_grows_past_preallocated_capacity():
+    log = ColumnarDailyLog(1)
+    for entry in run_economy_sim(SimConfig(days=11))["log"]:
+        log.append(DailyLog(**entry))
+
+    assert len(log) == 11
+    assert log[10]["day"] == 11
+    with pytest.raises(IndexError):
+        log[11]
+
+
+def test_event_log_matches_dict_log():
+    cfg = SimConfig(days=60, encounters_per_day=5, fear_per_encounter=12.0, spike_guard_threshold=70.0)
+    dicts = run_economy_sim(cfg)
+    result = run_economy_sim(cfg, log_mode="events")
+
+    assert "log" not in result and result["final"] == dicts["final"]
+    event_log = result["event_log"]
+    assert event_log["first_day"] == 1 and event_log["days"] == 60
+    for name, column in event_log["columns"].items():
+        assert column == [entry[name] for entry in dicts["log"]]
+    flagged = [[entry["day"], flag, None] for entry in dicts["log"] for flag in FLAG_FIELDS if entry[flag]]
+    assert [event for event in event_log["events"] if event[1] != FRAGMENT_EVENT] == flagged
+
+    fragments = [event for event in event_log["events"] if event[1] == FRAGMENT_EVENT]
+    assert fragments and fragments[-1][2]["total"] == dicts["final"]["legacy_fragments"]
+    assert sum(event[2]["gained"] for event in fragments) == dicts["final"]["legacy_fragments"]
+    counts = event_counts(event_log)
+    assert counts["spike_guard_used"] == sum(entry["spike_guard_used"] for entry in dicts["log"])
+
+
+def test_event_log_precision_and_resume():
+    cfg = SimConfig(days=30)
+    coarse = run_economy_sim(cfg, log_mode="events", precision=0)["event_log"]
+    assert coarse["precision"] == 0
+    assert all(value == round(value) for value in coarse["columns"]["ase"])
+
+    state = initial_state(cfg)
+    step_days(state, 10)
+    tail = resume(state, log_mode="events")["event_log"]
+    full = run_economy_sim(cfg, log_mode="events")["event_log"]
+    assert tail["first_day"] == 11 and tail["days"] == 20
+    assert tail["columns"]["ase"] == full["columns"]["ase"][10:]
+    assert tail["events"] == [event for event in full["events"] if event[0] > 10]
+
+
+def test_unknown_log_mode_is_rejected():
+    with pytest.raises(ValueError):
+        run_economy_sim(SimConfig(days=1), log_mode="parquet")
@@ -0,0 +1,92 @@
+"""Long-horizon mode: sampled logs, period rollups, checkpoints and resume parity."""
+
+import json
+import sys
+
+import pytest
+
+from simulation import SimConfig, run_economy_sim, run_long_horizon
+from simulation.horizon import EVENT_FLAGS, load_checkpoint
+from simulation.scripts import run_sim as run_sim_cli
+
+CFG = SimConfig(days=730, realm_tier=2, encounters_per_day=3, fear_per_encounter=6.0)
+
+
+def test_sampled_log_and_summary_match_full_run():
+    full = run_economy_sim(CFG)
+    result = run_long_horizon(CFG, every=30, period=365)
+
+    assert result["final"] == full["final"]
+    assert result["summary"] == run_economy_sim(CFG, log_mode="summary")["summary"]
+    by_day = {row["day"]: row for row in full["log"]}
+    assert all(by_day[row["day"]] == row for row in result["log"])
+
+    kept = {row["day"] for row in result["log"]}
+    assert {30, 60, 720, 730} <= kept
+    expected_events = {
+        row["day"]
+        for previous, row in zip([{"legacy_fragments": 0}] + full["log"], full["log"])
+        if any(row[flag] for flag in EVENT_FLAGS) or row["legacy_fragments"] != previous["legacy_fragments"]
+    }
+    assert expected_events and expected_events <= kept
+    assert len(kept) < len(full["log"]) / 2
+
+
+def test_periods_roll_up_the_day_log():
+    full = run_economy_sim(CFG)["log"]
+    periods = run_long_horizon(CFG, every=0, events=False, period=365)["periods"]
+
+    assert [(p["start_day"], p["end_day"]) for p in periods] == [(1, 365), (366, 730)]
+    second = full[365:]
+    assert periods[1]["ase"] == second[-1]["ase"]
+    assert periods[1]["morale_min"] == min(row["morale"] for row in second)
+    assert periods[1]["spike_guard_used"] == sum(row["spike_guard_used"] for row in second)
+    assert periods[1]["legacy_fragments_gained"] == second[-1]["legacy_fragments"] - full[364]["legacy_fragments"]
+    assert sum(p["legacy_fragments_gained"] for p in periods) == full[-1]["legacy_fragments"]
+
+
+def test_resuming_a_checkpoint_reproduces_the_tail(tmp_path):
+    first = run_long_horizon(
+        SimConfig(days=365, realm_tier=2, encounters_per_day=3, fear_per_encounter=6.0),
+        checkpoint_every=365,
+        checkpoint_dir=tmp_path,
+    )
+    (checkpoint,) = first["checkpoints"]
+    assert checkpoint["day"] == 365
+
+    resumed = run_long_horizon(CFG, state=load_checkpoint(checkpoint["path"]))
+    whole = run_long_horizon(CFG, checkpoint_every=365)
+    assert resumed["final"] == whole["final"]
+    assert resumed["log"] == [row for row in whole["log"] if row["day"] > 365]
+    assert resumed["periods"] == whole["periods"][1:]
+    assert resumed["horizon"]["first_day"] == 366
+    in_memory = whole["checkpoints"][0]["state"]
+    on_disk = json.loads((tmp_path / "day-000365.json").read_text())
+    assert in_memory["cfg"]["days"] == 730 and on_disk["cfg"]["days"] == 365
+    assert {key: value for key, value in in_memory.items() if key != "cfg"} == {
+        key: value for key, value in on_disk.items() if key != "cfg"
+    }
+
+
+def test_rejects_bad_windows():
+    with pytest.raises(ValueError):
+        run_long_horizon(CFG, period=0)
+    with pytest.raises(ValueError):
+        run_long_horizon(CFG, checkpoint_every=0)
+
+
+def test_cli_long_horizon_and_resume(tmp_path, monkeypatch, capsys):
+    base = ["run_sim.py", "--tier", "2", "--encounters", "3", "--fear", "6"]
+    monkeypatch.setattr(
+        sys,
+        "argv",
+        base + ["--days", "400", "--long_horizon", "--checkpoint_every", "200", "--checkpoint_dir", tmp_path.as_posix()],
+    )
+    run_sim_cli.main()
+    report = json.loads(capsys.readouterr().out)
+    assert [entry["day"] for entry in report["checkpoints"]] == [200, 400]
+
+    monkeypatch.setattr(sys, "argv", ["run_sim.py", "--days", "730", "--resume", (tmp_path / "day-000400.json").as_posix()])
+    run_sim_cli.main()
+    resumed = json.loads(capsys.readouterr().out)
+    assert resumed["final"] == run_economy_sim(CFG)["final"]
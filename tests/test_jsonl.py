@@ -0,0 +1,150 @@
+"""JSON-lines requests: the lockstep server, batch ordering, backpressure, resume and the run_sim CLI."""
+
+import io
+import json
+import sys
+
+import pytest
+
+from simulation import SimConfig, run_economy_sim
+from simulation.jsonl import completed_lines, drop_torn_tail, run_lines, serve
+from simulation.scripts import run_sim as run_sim_cli
+
+BASE = SimConfig(days=6, fear_per_encounter=6.0)
+REQUESTS = [json.dumps({"id": seed, "campaign_seed": seed}) for seed in range(12)]
+
+
+def _expected(seed):
+    payload = {"line": seed + 1, "id": seed, **run_economy_sim(SimConfig(days=6, fear_per_encounter=6.0, campaign_seed=seed))}
+    return json.loads(json.dumps(payload))
+
+
+def test_serve_answers_one_line_per_request():
+    base = SimConfig(days=5, fear_per_encounter=6.0)
+    requests = [
+        {"id": "a"},
+        {"id": 7, "days": 9, "campaign_seed": "0x10", "courage_auto_days": [3], "log_mode": "summary"},
+        {"log_mode": "events"},
+        {"id": "bad", "dayz": 3},
+        [1, 2],
+    ]
+    stdin = io.StringIO("\n".join(json.dumps(request) for request in requests) + "\n\n")
+    stdout = io.StringIO()
+
+    assert serve(base, stdin=stdin, stdout=stdout) == len(requests)
+    replies = [json.loads(line) for line in stdout.getvalue().splitlines()]
+    assert replies[0] == json.loads(json.dumps({"id": "a", **run_economy_sim(base)}))
+    branch = SimConfig(days=9, fear_per_encounter=6.0, campaign_seed=0x10, courage_auto_days=(3,))
+    assert replies[1] == json.loads(json.dumps({"id": 7, **run_economy_sim(branch, log_mode="summary")}))
+    assert replies[2]["event_log"]["first_day"] == 1 and "id" not in replies[2]
+    assert replies[3]["id"] == "bad" and "dayz" in replies[3]["error"]
+    assert replies[4] == {"id": None, "error": "each request must be a JSON object"}
+
+
+def test_ordered_pool_matches_in_process_run():
+    serial = list(run_lines(REQUESTS, BASE, workers=1, chunk_size=5))
+    parallel = list(run_lines(REQUESTS, BASE, workers=2, chunk_size=2, ordered=True))
+
+    assert parallel == serial
+    assert [json.loads(reply) for reply in serial] == [_expected(seed) for seed in range(12)]
+    unordered = list(run_lines(REQUESTS, BASE, workers=2, chunk_size=1))
+    assert sorted(unordered) == sorted(serial)
+
+
+def test_backpressure_bounds_lines_read_ahead():
+    read = []
+
+    def source():
+        for text in REQUESTS:
+            read.append(text)
+            yield text
+
+    replies = run_lines(source(), BASE, log_mode="summary", workers=2, chunk_size=2, max_pending=2, ordered=True)
+    first = json.loads(next(replies))
+    assert first["line"] == 1 and "summary" in first
+    assert len(read) <= (2 + 1) * 2
+    assert len(list(replies)) == len(REQUESTS) - 1
+
+
+def test_resume_skips_answered_lines_and_drops_torn_tail(tmp_path):
+    out = tmp_path / "replies.jsonl"
+    done = list(run_lines(REQUESTS[:5], BASE, workers=1))
+    done[2] = done[2][:30] + "#corrupt"
+    torn = "\n".join(done) + "\n" + done[0][:17]
+    out.write_text(torn)
+
+    assert completed_lines(out) == {1, 2, 4, 5}
+    assert out.read_text() == torn  # reading never modifies the file
+    assert drop_torn_tail(out) == 17 and out.read_text().endswith("}\n")
+    assert drop_torn_tail(out) == 0
+    rest = list(run_lines(REQUESTS, BASE, workers=1, skip=completed_lines(out)))
+    assert [json.loads(reply)["line"] for reply in rest] == [3] + list(range(6, 13))
+    assert completed_lines(tmp_path / "missing.jsonl") == set()
+
+
+def test_drop_torn_tail_reads_backwards_in_blocks(tmp_path, monkeypatch):
+    from simulation import jsonl
+
+    monkeypatch.setattr(jsonl, "_TAIL_BLOCK", 4)
+    out = tmp_path / "replies.jsonl"
+    out.write_bytes(b'{"line":1}\n{"line":2,"torn')
+    assert drop_torn_tail(out) == 15 and out.read_bytes() == b'{"line":1}\n'
+    out.write_bytes(b"no newline at all")
+    assert drop_torn_tail(out) == 17 and out.read_bytes() == b""
+
+
+def test_rejects_bad_windows():
+    with pytest.raises(ValueError):
+        list(run_lines(REQUESTS, BASE, chunk_size=0))
+    with pytest.raises(ValueError):
+        list(run_lines(REQUESTS, BASE, max_pending=0))
+    with pytest.raises(ValueError):
+        list(run_lines(REQUESTS, BASE, log_mode="columnar"))
+
+
+def test_cli_batch_writes_and_resumes(tmp_path, monkeypatch, capsys):
+    source = tmp_path / "requests.jsonl"
+    source.write_text("\n".join(REQUESTS[:4] + ['{"dayz": 1}', ""] + REQUESTS[4:]) + "\n")
+    out = tmp_path / "replies.jsonl"
+    out.write_text("\n".join(run_lines(REQUESTS[:3], BASE, workers=1)) + "\n")
+    argv = ["run_sim.py", "--days", "6", "--fear", "6", "--batch", source.as_posix(), "--batch_out", out.as_posix()]
+    monkeypatch.setattr(sys, "argv", argv + ["--resume_batch", "--workers", "2", "--chunk_size", "3", "--ordered"])
+    run_sim_cli.main()
+
+    assert capsys.readouterr().out == ""
+    replies = [json.loads(text) for text in out.read_text().splitlines()]
+    assert [reply["line"] for reply in replies] == [1, 2, 3, 4, 5, 7, 8, 9, 10, 11, 12, 13, 14]
+    assert replies[4]["id"] is None and "dayz" in replies[4]["error"]
+    assert replies[-1] == _expected(11) | {"line": 14}
+
+    monkeypatch.setattr(sys, "argv", ["run_sim.py", "--ordered"])
+    with pytest.raises(SystemExit):
+        run_sim_cli.main()
+
+
+def test_cli_batch_reports_missing_input(tmp_path, monkeypatch, capsys):
+    monkeypatch.setattr(sys, "argv", ["run_sim.py", "--batch", (tmp_path / "nope.jsonl").as_posix()])
+    with pytest.raises(SystemExit):
+        run_sim_cli.main()
+    assert "cannot read --batch input" in capsys.readouterr().err
+
+
+@pytest.mark.parametrize(
+    "flags",
+    [
+        ["--workers", "2"],
+        ["--chunk_size", "8"],
+        ["--max_pending", "2"],
+        ["--batch", "-", "--workers", "0"],
+        ["--batch", "-", "--chunk_size", "0"],
+        ["--batch", "-", "--profile"],
+        ["--serve", "--precision", "2"],
+        ["--serve", "--compact"],
+        ["--serve", "--batch", "-"],
+    ],
+)
+def test_cli_rejects_flags_serve_and_batch_would_ignore(flags, monkeypatch, capsys):
+    monkeypatch.setattr(sys, "argv", ["run_sim.py", "--days", "2"] + flags)
+    with pytest.raises(SystemExit):
+        run_sim_cli.main()
+    assert "error" in capsys.readouterr().err
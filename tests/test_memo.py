@@ -0,0 +1,89 @@
+"""Tests for the content-addressed run_economy_sim cache."""
+
+import pytest
+
+from simulation import SimConfig, run_economy_sim
+from simulation import memo
+from simulation.memo import SimCache, config_key
+
+
+def test_cached_results_match_fresh_runs(tmp_path):
+    cache = SimCache(tmp_path)
+    cfg = SimConfig(days=12, realm_tier=2, courage_ritual_days=(3, 7))
+
+    first = cache.run(cfg)
+    second = cache.run(cfg)
+    assert first == second == run_economy_sim(cfg)
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    # A fresh cache over the same directory is served from disk.
+    reopened = SimCache(tmp_path)
+    assert reopened.run(cfg) == first
+    assert reopened.run(cfg, log_mode="summary") == run_economy_sim(cfg, log_mode="summary")
+    assert (reopened.hits, reopened.misses) == (1, 1)
+
+
+def test_hits_are_isolated_from_caller_mutation():
+    cache = SimCache()
+    cfg = SimConfig(days=3)
+    cache.run(cfg)["final"]["ase"] = -1.0
+    cache.run(cfg)["log"].clear()
+    assert cache.run(cfg) == run_economy_sim(cfg)
+
+
+def test_key_tracks_config_mode_and_sources():
+    cfg = SimConfig(days=5)
+    assert config_key(cfg) == config_key(SimConfig(days=5))
+    assert config_key(cfg) != config_key(SimConfig(days=6))
+    assert config_key(cfg) != config_key(cfg, log_mode="summary")
+    assert config_key(cfg) != config_key(cfg, fingerprint="curves-edited")
+
+
+def test_stale_fingerprint_misses(tmp_path, monkeypatch):
+    cfg = SimConfig(days=4)
+    SimCache(tmp_path).run(cfg)
+
+    monkeypatch.setattr(memo, "sim_fingerprint", lambda: "curves-edited")
+    cache = SimCache(tmp_path)
+    cache.run(cfg)
+    assert (cache.hits, cache.misses) == (0, 1)
+
+
+def test_bounds_evict_least_recently_used(tmp_path):
+    cache = SimCache(tmp_path, max_entries=2)
+    configs = [SimConfig(days=2, campaign_seed=seed) for seed in range(3)]
+    for cfg in configs:
+        cache.run(cfg)
+    assert len(cache) == 2
+    entry_size = max(path.stat().st_size for path in tmp_path.glob("*.json"))
+
+    small = SimCache(tmp_path / "small", max_bytes=2 * entry_size)
+    for cfg in configs:
+        small.run(cfg)
+    assert len(list((tmp_path / "small").glob("*.json"))) == 2
+    assert small.run(configs[0]) and small.misses == 4
+
+
+def test_rejects_uncacheable_log_mode():
+    with pytest.raises(ValueError):
+        SimCache().run(SimConfig(days=1), log_mode="columnar")
+
+
+def test_fingerprint_covers_the_batch_kernel():
+    assert "batch.py" in memo.FINGERPRINT_MODULES
+
+
+def test_disk_is_rescanned_only_when_over_budget(tmp_path, monkeypatch):
+    cache = SimCache(tmp_path)
+    scans = []
+    original = SimCache._scan
+    monkeypatch.setattr(SimCache, "_scan", lambda self: scans.append(1) or original(self))
+
+    for seed in range(20):
+        cache.run(SimConfig(days=2, campaign_seed=seed))
+    assert len(scans) == 1  # the initial size count only
+
+    cache.max_bytes = cache._disk_bytes // 2
+    cache.run(SimConfig(days=2, campaign_seed=99))
+    assert len(scans) == 2
+    assert cache._disk_bytes == sum(path.stat().st_size for path in tmp_path.glob("*.json")) <= cache.max_bytes
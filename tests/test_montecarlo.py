@@ -0,0 +1,107 @@
+"""Monte Carlo confidence reporting: interval maths, adaptive seeding and CLI."""
+
+import json
+import statistics
+import sys
+
+import pytest
+
+from simulation import SimConfig, run_economy_sim
+from simulation.memo import SimCache
+from simulation.montecarlo import monte_carlo, summarize, t_quantile
+from simulation.scripts import run_montecarlo as run_montecarlo_cli
+
+NOISY = {"days": 40, "realm_tier": 2, "encounters_per_day": 7, "fear_per_encounter": 6.0}
+STEADY = {"days": 40, "realm_tier": 2, "encounters_per_day": 3, "fear_per_encounter": 6.0}
+
+
+def test_t_quantile_matches_tables():
+    assert t_quantile(0.975, 4) == pytest.approx(2.776, abs=0.01)
+    assert t_quantile(0.975, 15) == pytest.approx(2.131, abs=1e-3)
+    assert t_quantile(0.975, 1000) == pytest.approx(1.962, abs=1e-3)
+
+
+def test_summarize_reports_mean_interval_and_percentiles():
+    values = [float(value) for value in range(1, 101)]
+    stats = summarize(values, confidence=0.95)
+
+    half = t_quantile(0.975, 99) * statistics.stdev(values) / 10
+    assert stats["mean"] == 50.5 and stats["n"] == 100
+    assert stats["ci"] == pytest.approx([50.5 - half, 50.5 + half])
+    assert stats["percentiles"]["p50"]["value"] == 50.5
+    low, high = stats["percentiles"]["p90"]["ci"]
+    assert low < stats["percentiles"]["p90"]["value"] < high
+    assert summarize([3.0, 3.0, 3.0])["ci_width"] == 0.0
+
+
+def test_adaptive_seeding_spends_seeds_only_on_noisy_scenarios():
+    reports = monte_carlo(
+        {"steady": STEADY, "noisy": NOISY},
+        widths={"morale_min": 1.0},
+        min_seeds=8,
+        max_seeds=256,
+    )
+
+    steady, noisy = reports["steady"], reports["noisy"]
+    assert steady["rounds"] == [8] and steady["converged"]
+    assert len(noisy["rounds"]) > 1 and noisy["rounds"][-1] <= 256
+    assert noisy["converged"] == (noisy["stats"]["morale_min"]["ci_width"] <= 1.0)
+    assert noisy["seeds"] == [0xA2B94D10, 0xA2B94D10 + noisy["rounds"][-1] - 1]
+
+    expected = [
+        run_economy_sim(SimConfig.from_overrides({**NOISY, "campaign_seed": 0xA2B94D10 + index}), log_mode="summary")[
+            "summary"
+        ]["morale_min"]
+        for index in range(noisy["rounds"][-1])
+    ]
+    assert noisy["stats"]["morale_min"]["mean"] == pytest.approx(statistics.fmean(expected))
+
+
+def test_max_seeds_caps_unconverged_scenarios_and_workers_match(tmp_path):
+    options = dict(widths={"morale_min": 1e-6}, min_seeds=4, max_seeds=20, chunk_size=3)
+    serial = monte_carlo({"noisy": NOISY}, **options)
+    cache = SimCache(tmp_path)
+    parallel = monte_carlo({"noisy": NOISY}, workers=2, cache=cache, **options)
+
+    assert serial == parallel
+    assert serial["noisy"]["rounds"] == [4, 8, 16, 20]
+    assert not serial["noisy"]["converged"] and "morale_min" in serial["noisy"]["unmet"]
+    assert cache.misses == 20
+    with pytest.raises(ValueError):
+        monte_carlo({"noisy": NOISY}, widths={"morale": 1.0}, min_seeds=2, max_seeds=2)
+
+
+def test_cli_writes_confidence_sheet(tmp_path, monkeypatch, capsys):
+    monkeypatch.setattr(
+        sys,
+        "argv",
+        [
+            "run_montecarlo.py",
+            "--scenario",
+            f"noisy={json.dumps(NOISY)}",
+            "--scenario",
+            f"steady={json.dumps(STEADY)}",
+            "--set",
+            "days=30",
+            "--width",
+            "final_ase=5",
+            "--min_seeds",
+            "4",
+            "--max_seeds",
+            "16",
+            "--workers",
+            "1",
+            "--out_dir",
+            tmp_path.as_posix(),
+        ],
+    )
+    run_montecarlo_cli.main()
+
+    printed = json.loads(capsys.readouterr().out)
+    assert printed["scenarios"]["steady"] == {"runs": 4, "converged": True}
+    report = json.loads((tmp_path / "mvp_confidence.json").read_text())
+    assert report["noisy"]["overrides"]["days"] == 30
+    assert "voluntary_retirement_flags" in report["noisy"]["stats"]
+    rows = (tmp_path / "mvp_confidence.csv").read_text().splitlines()
+    assert rows[0].startswith("scenario,metric,seeds,mean") and len(rows) == 1 + 2 * 18
+    assert "## steady" in (tmp_path / "mvp_confidence.md").read_text()
@@ -0,0 +1,41 @@
+"""PCG32 bulk generation and jump-ahead parity with the scalar stream."""
+
+from simulation.prng import PCG32, fill_u32_across
+
+
+def test_fill_u32_matches_scalar_draws():
+    scalar = PCG32(0xA2B94D10)
+    bulk = PCG32(0xA2B94D10)
+
+    expected = [scalar.next_u32() for _ in range(257)]
+    assert list(bulk.fill_u32(257)) == expected
+    assert bulk.state == scalar.state
+    assert bulk.random() == scalar.random()
+
+
+def test_fill_random_matches_scalar_random():
+    scalar = PCG32(0xDEADBEEF)
+    bulk = PCG32(0xDEADBEEF)
+
+    assert list(bulk.fill_random(64)) == [scalar.random() for _ in range(64)]
+
+
+def test_advance_skips_to_day_n_and_rewinds():
+    stepped = PCG32(12345)
+    for _ in range(1000):
+        stepped.next_u32()
+
+    jumped = PCG32(12345).advance(1000)
+    assert jumped.state == stepped.state
+    assert jumped.next_u32() == stepped.next_u32()
+
+    jumped.advance(-1001)
+    assert jumped.state == PCG32(12345).state
+
+
+def test_fill_u32_across_draws_once_per_generator():
+    rngs = [PCG32(seed) for seed in (1, 2, 3)]
+    expected = [PCG32(seed).next_u32() for seed in (1, 2, 3)]
+
+    assert list(fill_u32_across(rngs)) == expected
+    assert [rng.state for rng in rngs] == [PCG32(seed).advance(1).state for seed in (1, 2, 3)]
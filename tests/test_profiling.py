@@ -0,0 +1,51 @@
+"""Tests for the opt-in day-loop profiler."""
+
+import json
+import sys
+
+from simulation import SimConfig, run_economy_sim
+from simulation.profiling import BRANCHES, PHASES, PhaseProfiler
+from simulation.scripts import run_sim
+
+
+def test_profiler_counts_match_the_day_log_and_leave_results_unchanged():
+    cfg = SimConfig(days=120, encounters_per_day=4, fear_per_encounter=7.0, faith_initial=40.0)
+    plain = run_economy_sim(cfg)
+    profiled = run_economy_sim(cfg, profiler=PhaseProfiler())
+
+    profile = profiled.pop("profile")
+    assert profiled == plain
+    assert profile["days"] == cfg.days
+    assert set(profile["branches"]) == set(BRANCHES)
+    assert set(profile["phases"]) == set(PHASES)
+    assert abs(sum(phase["share"] for phase in profile["phases"].values()) - 1.0) < 1e-3
+
+    log = plain["log"]
+    for flag in (
+        "courage_ritual_skipped",
+        "ward_beads_used",
+        "spike_guard_used",
+        "courage_ritual_used",
+        "reflection_prayer_used",
+    ):
+        assert profile["branches"][flag] == sum(row[flag] for row in log), flag
+    assert profile["branches"]["voluntary_retirement"] == plain["final"]["voluntary_retirements"]
+
+
+def test_hooks_see_each_synced_day_and_timers_can_be_disabled():
+    seen = []
+    profiler = PhaseProfiler(timers=False, hooks=[lambda state: seen.append((state.day, state.morale))])
+    result = run_economy_sim(SimConfig(days=9), log_mode="summary", profiler=profiler)
+
+    assert [day for day, _ in seen] == list(range(1, 10))
+    assert round(seen[-1][1], 2) == result["final"]["morale"]
+    assert "phases" not in result["profile"]
+    assert result["profile"]["days"] == 9
+
+
+def test_cli_profile_flag_adds_profile_block(monkeypatch, capsys):
+    monkeypatch.setattr(sys, "argv", ["run_sim.py", "--days", "5", "--profile"])
+    run_sim.main()
+    report = json.loads(capsys.readouterr().out)
+    assert report["profile"]["days"] == 5
+    assert len(report["log"]) == 5
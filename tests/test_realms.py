@@ -0,0 +1,68 @@
+"""Multi-realm mode: scalar parity, stream independence, dynamics and save mapping."""
+
+import pytest
+
+from simulation import RealmArrays, RealmRules, RealmState, SimConfig, run_economy_sim, run_realms_sim
+from simulation.seedbook import derive_for_realm
+
+
+@pytest.mark.parametrize(
+    "cfg",
+    [
+        SimConfig(days=120, realm_tier=3, encounters_per_day=3, fear_per_encounter=6.0),
+        SimConfig(days=120, encounters_per_day=4, fear_per_encounter=15.0, spike_guard_enabled=False),
+    ],
+)
+def test_single_frozen_realm_matches_scalar_loop(cfg):
+    scalar = run_economy_sim(cfg)
+    realms = run_realms_sim(cfg, RealmArrays.uniform(1, tier=cfg.realm_tier), RealmRules.frozen())
+
+    assert realms["log"] == scalar["log"]
+    assert {key: realms["final"][key] for key in scalar["final"]} == scalar["final"]
+
+
+def test_adding_realms_keeps_existing_encounter_streams():
+    cfg = SimConfig(days=60)
+    rules = RealmRules(corruption_fear=0.0, corruption_upkeep=0.0, restoration_spill=0.0)
+    three = run_realms_sim(cfg, RealmArrays.uniform(3), rules)["realms"]
+    five = run_realms_sim(cfg, RealmArrays.uniform(5), rules)["realms"]
+
+    assert [realm["encounter_cursor"] for realm in five[:3]] == [realm["encounter_cursor"] for realm in three]
+
+
+def test_restoration_raises_tier_and_spills_corruption():
+    cfg = SimConfig(days=200, encounters_per_day=4)
+    rules = RealmRules(corruption_growth=0.0, purification=0.0, encounters_per_stage=10.0, stages_per_tier=2)
+    result = run_realms_sim(cfg, RealmArrays.uniform(2, corruption=0.0), rules)
+
+    first, second = result["realms"]
+    assert first["tier"] > 1 and result["final"]["realm_restorations"] >= first["tier"] - 1
+    assert first["modifiers"]["corruption"] == 0.0
+    assert second["modifiers"]["corruption"] > 0.0
+
+
+def test_corruption_inflates_upkeep_and_fear():
+    cfg = SimConfig(days=30, spike_guard_enabled=False)
+    still = RealmRules(corruption_growth=0.0, purification=0.0, stages_per_tier=0)
+    clean = run_realms_sim(cfg, RealmArrays.uniform(2, corruption=0.0), still)["log"]
+    tainted = run_realms_sim(cfg, RealmArrays.uniform(2, corruption=80.0), still)["log"]
+
+    assert tainted[0]["ekwan_spend"] > clean[0]["ekwan_spend"]
+    assert max(row["fear"] for row in tainted) > max(row["fear"] for row in clean)
+
+
+def test_save_round_trip_and_model_mapping():
+    realms = RealmArrays.from_states([RealmState(tier=2, corruption=30.0), RealmState(tier=4, corruption=10.0)])
+    save = realms.to_save(0xA2B94D10)
+    assert [realm["realm_seed"] for realm in save] == [str(derive_for_realm(0xA2B94D10, i)) for i in range(2)]
+    assert RealmArrays.from_save(save).to_save(0xA2B94D10) == save
+    assert realms.to_states()[1] == RealmState(tier=4, corruption=10.0)
+
+    result = run_realms_sim(SimConfig(days=5), realms, log_mode="summary")
+    assert realms.tier.tolist() == [2, 4]  # input untouched
+    assert result["summary"]["days"] == 5 and len(result["realms"]) == 2
+
+
+def test_rejects_event_log_mode():
+    with pytest.raises(ValueError, match="log_mode"):
+        run_realms_sim(SimConfig(days=2), RealmArrays.uniform(2), log_mode="events")
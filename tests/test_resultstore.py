@@ -0,0 +1,90 @@
+"""Columnar binary result format (.simres) tests."""
+
+import json
+import sys
+
+import pytest
+
+from simulation import SimConfig, run_economy_sim
+from simulation.resultstore import open_results, write_results
+from simulation.scripts import run_sim
+from simulation.scripts.aggregate_kpis import RunSummary
+from simulation.sweep import expand_grid, iter_shard_results, run_sweep
+
+
+def _payloads():
+    payloads = [
+        dict(run_economy_sim(SimConfig(days=12, campaign_seed=seed, courage_ritual_days=(2,))), run_id=seed)
+        for seed in range(3)
+    ]
+    payloads.append(dict(run_economy_sim(SimConfig(days=6), log_mode="summary"), run_id=7))
+    payloads.append(dict(run_economy_sim(SimConfig(days=0, campaign_seed=2**64 - 1), log_mode="summary"), run_id=8))
+    return payloads
+
+
+def test_round_trip_reproduces_json_payloads(tmp_path):
+    payloads = _payloads()
+    path = tmp_path / "runs.simres"
+    assert write_results(path, payloads) == len(payloads)
+
+    with open_results(path) as store:
+        assert store.runs == len(payloads)
+        assert store.day_rows == 36
+        restored = list(store)
+
+    assert json.dumps(restored) == json.dumps(payloads)
+    assert restored[0]["config"]["courage_ritual_days"] == (2,)
+
+
+def test_day_columns_are_memory_mapped_views(tmp_path):
+    payloads = _payloads()[:3]
+    path = tmp_path / "runs.simres"
+    write_results(path, payloads)
+
+    with open_results(path) as store:
+        morale = store.day_column("morale")
+        assert isinstance(morale, memoryview)
+        assert min(morale) == min(e["morale"] for p in payloads for e in p["log"])
+        assert list(store.day_column("day", 1)) == list(range(1, 13))
+        for index, payload in enumerate(payloads):
+            assert RunSummary.from_store("run", store, index) == RunSummary.from_payload("run", payload)
+        del morale
+
+
+def test_rejects_foreign_files(tmp_path):
+    path = tmp_path / "not.simres"
+    path.write_text("{}")
+    with pytest.raises(ValueError):
+        open_results(path)
+
+
+def test_sweep_can_shard_to_simres(tmp_path):
+    configs = expand_grid({"days": 4}, None, seeds=range(5))
+    manifest = run_sweep(configs, tmp_path, workers=1, chunk_size=2, output_format="simres")
+
+    assert all(shard["file"].endswith(".simres") for shard in manifest["shards"])
+    results = list(iter_shard_results(tmp_path))
+    assert [r["final"] for r in results] == [run_economy_sim(cfg)["final"] for cfg in configs]
+
+
+def test_cli_log_writes_simres_when_suffix_requested(tmp_path, monkeypatch, capsys):
+    log_path = tmp_path / "out.simres"
+    monkeypatch.setattr(sys, "argv", ["run_sim.py", "--days", "2", "--log", str(log_path)])
+
+    run_sim.main()
+    stdout_payload = json.loads(capsys.readouterr().out)
+
+    with open_results(log_path) as store:
+        assert store.payload(0)["final"] == stdout_payload["final"]
+
+
+def test_refuses_payload_blocks_it_cannot_store(tmp_path, monkeypatch):
+    cfg = SimConfig(days=3)
+    with pytest.raises(ValueError, match="event_log"):
+        write_results(tmp_path / "events.simres", [run_economy_sim(cfg, log_mode="events")])
+    assert not list(tmp_path.iterdir())
+
+    monkeypatch.setattr(sys, "argv", ["run_sim.py", "--days", "2", "--roster", "3", "--log", str(tmp_path / "r.simres")])
+    with pytest.raises(SystemExit):
+        run_sim.main()
+    assert not list(tmp_path.iterdir())
@@ -0,0 +1,123 @@
+"""Multi-hero roster mode: scalar parity, trait effects, retirement and save mapping."""
+
+import random
+
+import pytest
+
+from simulation import Hero, HeroRoster, SimConfig, run_economy_sim, run_roster_sim
+from simulation.roster import TRAITS
+
+HARSH = dict(days=120, encounters_per_day=4, fear_per_encounter=15.0)
+FIRED = ("spike_guard_used", "reflection_prayer_used", "voluntary_retirement")
+
+
+@pytest.mark.parametrize("log_mode", ["dicts", "summary"])
+def test_single_neutral_hero_matches_scalar_loop(log_mode):
+    cfg = SimConfig(spike_guard_enabled=False, retirement_rite_enabled=False, **HARSH)
+    scalar = run_economy_sim(cfg, log_mode=log_mode)
+    roster = run_roster_sim(cfg, HeroRoster.uniform(1), log_mode=log_mode)
+
+    assert scalar["final"]["legacy_fragments"] > 0
+    assert {key: roster["final"][key] for key in scalar["final"]} == scalar["final"]
+    key = "summary" if log_mode == "summary" else "log"
+    assert roster[key] == scalar[key]
+
+
+def _guarded_config(rng):
+    """A random campaign with the Spike Guard, faith guardrail and retirement rite all on."""
+    return SimConfig(
+        campaign_seed=rng.getrandbits(32),
+        days=rng.randint(20, 150),
+        realm_tier=rng.randint(0, 5),
+        encounters_per_day=rng.randint(1, 6),
+        fear_per_encounter=rng.uniform(2.0, 20.0),
+        guardian_present=rng.random() < 0.3,
+        faith_initial=rng.uniform(30.0, 90.0),
+        harmony_initial=rng.uniform(20.0, 90.0),
+        favor_initial=rng.uniform(0.0, 80.0),
+        ward_beads_charges=rng.randint(0, 4),
+        spike_guard_threshold=rng.uniform(60.0, 100.0),
+        faith_guardrail_threshold=rng.uniform(50.0, 80.0),
+        faith_guardrail_required_days=rng.randint(1, 4),
+        faith_guardrail_floor=rng.uniform(55.0, 80.0),
+        retirement_rite_min_streak=rng.randint(1, 12),
+    )
+
+
+def test_uniform_rosters_match_scalar_loop_until_first_retirement():
+    # Neutral heroes all follow the scalar trajectory, so every hero collapses on the
+    # scalar's collapse days (the party books one fragment each). The retirement rite
+    # is where a party first differs (the successor starts fresh); its day matches on
+    # everything but the party's morale and fear.
+    rng = random.Random(0x7E57)
+    fired = set()
+    for _ in range(120):
+        cfg = _guarded_config(rng)
+        size = rng.choice([1, 2, 4, 8])
+        scalar = run_economy_sim(cfg)["log"]
+        party = run_roster_sim(cfg, HeroRoster.uniform(size))["log"]
+        retired = next((row["day"] for row in scalar if row["voluntary_retirement"]), cfg.days + 1)
+        for solo, row in zip(scalar[:retired], party[:retired]):
+            skip = {"legacy_fragments"}
+            fragments = size * solo["legacy_fragments"]
+            if solo["day"] == retired:
+                skip |= {"morale", "fear"}
+                fragments -= size - 1  # only the retiring hero books the rite's fragment
+            assert row["legacy_fragments"] == fragments
+            assert {k: v for k, v in row.items() if k not in skip} == {k: v for k, v in solo.items() if k not in skip}
+        fired.update(name for row in scalar[:retired] for name in FIRED if row[name])
+    assert fired == set(FIRED)
+
+
+def test_courage_scales_fear_per_hero():
+    roster = HeroRoster()
+    roster.add("Bold", traits={"courage": 90})
+    roster.add("Timid", traits={"courage": 10})
+    result = run_roster_sim(SimConfig(days=3, retirement_rite_enabled=False), roster)
+
+    bold, timid = result["roster"]["active"]
+    assert bold["stats"]["fear"] < timid["stats"]["fear"]
+    assert len(roster) == 2 and roster.fear[0] == 25.0  # input roster untouched
+
+
+def test_retirement_rite_replaces_most_fearful_hero():
+    cfg = SimConfig(retirement_rite_min_streak=3, **HARSH)
+    result = run_roster_sim(cfg, HeroRoster.recruit(6, cfg.campaign_seed))
+
+    save = result["roster"]
+    assert result["final"]["voluntary_retirements"] == len(save["retired"]) > 0
+    assert len(save["active"]) == 6
+    active_ids = {hero["id"] for hero in save["active"]}
+    retired_ids = [hero["id"] for hero in save["retired"]]
+    assert len(set(retired_ids)) == len(retired_ids) and not active_ids & set(retired_ids)
+    assert save["retired"][0]["history"][0].startswith("retired:day=")
+    assert any(hero.get("lineage_id") for hero in save["active"])
+
+
+def test_save_round_trip_keeps_schema_shape():
+    roster = HeroRoster.recruit(4, 0xA2B94D10)
+    roster.add("Elder", traits={"wisdom": 80}, hero_id="h0042", lineage_id="h0007", bonds=["h0001"])
+    save = roster.to_save()
+    save["fallen"].append({"id": "h0099", "name": "Lost", "traits": save["active"][0]["traits"], "stats": {"hp": 0, "morale": 0, "fear": 100}})
+
+    reloaded = HeroRoster.from_save(save)
+    assert reloaded.to_save() == save
+    for hero in save["active"]:
+        assert set(hero) <= {"id", "name", "traits", "stats", "conditions", "bonds", "lineage_id", "history"}
+        assert set(hero["traits"]) == set(TRAITS)
+        assert all(isinstance(value, int) for value in hero["stats"].values())
+    new_index = reloaded.add("Recruit")
+    assert reloaded.ids[new_index] == "h0100"
+
+
+def test_recruit_is_deterministic_and_maps_hero_models():
+    assert HeroRoster.recruit(5, 7).to_save() == HeroRoster.recruit(5, 7).to_save()
+    assert HeroRoster.recruit(5, 7).to_save() != HeroRoster.recruit(5, 8).to_save()
+
+    roster = HeroRoster.from_heroes([Hero("Ama", courage=8, morale=70.0, fear=10.0)])
+    assert roster.traits["courage"][0] == 80 and roster.morale[0] == 70.0
+
+
+def test_rejects_event_log_mode():
+    with pytest.raises(ValueError, match="log_mode"):
+        run_roster_sim(SimConfig(days=2), HeroRoster.recruit(2, 7), log_mode="events")
@@ -0,0 +1,84 @@
+"""SeedBook/XXHash64/PCG32 port of the Godot seed layer."""
+
+from simulation.prng import PCG32
+from simulation.seedbook import (
+    GodotPCG32,
+    SeedService,
+    campaign_seed_from_inputs,
+    derive_for_realm,
+    derive_for_scope,
+    derive_for_system,
+    derive_with_salt,
+    xxh64,
+    xxh64_string,
+)
+
+CAMPAIGN = campaign_seed_from_inputs("P1", "Story", "Alpha")
+
+
+def test_golden_vectors_are_stable():
+    # Pinned from the port; regenerate only alongside a matching change to core/seed/*.gd.
+    assert xxh64_string("") == 0
+    assert xxh64_string("a") == 3118365020822296414
+    assert xxh64_string("x" * 40) == 5166033510151732503
+    assert CAMPAIGN == 9073964878775190127
+    assert derive_for_system(CAMPAIGN, "combat") == 93857199127170205
+    assert derive_for_realm(CAMPAIGN, 0) == 1023016186912136589
+    assert derive_for_scope(CAMPAIGN, "realm/0/loot") == 4501173887188353408
+    assert derive_with_salt(CAMPAIGN, "loot", "drop") == 2674820369728957603
+    rng = SeedService(CAMPAIGN).rng_for_system("combat")
+    assert [rng.next_u32() for _ in range(3)] == [1099401831, 1090834466, 1102774711]
+
+
+def test_hashes_are_non_negative_and_seeded():
+    # The final ``h ^= h >> 32`` sign-extends, which always clears the sign bit.
+    values = [xxh64(bytes(range(length))) for length in range(0, 70)]
+    assert all(0 <= value < (1 << 63) for value in values)
+    assert len(set(values)) == len(values)
+    assert xxh64(b"echoes", seed=1) != xxh64(b"echoes")
+
+
+def test_keys_are_canonicalised_like_strip_edges_to_lower():
+    assert campaign_seed_from_inputs("  p1\t", "STORY", "alpha\n") == CAMPAIGN
+    assert derive_for_system(CAMPAIGN, " Combat ") == derive_for_system(CAMPAIGN, "combat")
+    # strip_edges() only trims code points <= 32, so a no-break space is kept.
+    assert derive_for_system(CAMPAIGN, "combat\u00a0") != derive_for_system(CAMPAIGN, "combat")
+    assert derive_for_system(CAMPAIGN - (1 << 64), "combat") == derive_for_system(CAMPAIGN, "combat")
+
+
+def test_pcg32_matches_unsigned_generator_below_the_sign_bit():
+    godot = GodotPCG32()
+    godot.set_state({"state": 0x1234_5678_9ABC_DEF0, "inc": 109})
+    plain = PCG32(0x1234_5678_9ABC_DEF0, 109)
+    assert godot.next_u32() == plain.next_u32()
+    # With the top bit set, the GDScript's arithmetic shifts change the output bits.
+    godot.set_state({"state": -5, "inc": 109})
+    plain = PCG32((1 << 64) - 5, 109)
+    assert godot.next_u32() != plain.next_u32()
+    assert godot.get_state()["state"] % (1 << 64) == plain.state
+
+
+def test_advance_matches_stepping():
+    stepped = GodotPCG32.new_with_seed(-42)
+    jumped = GodotPCG32.new_with_seed(-42)
+    for _ in range(1000):
+        stepped.next_u32()
+    jumped.advance(1000)
+    assert jumped.get_state() == stepped.get_state()
+
+
+def test_named_streams_are_independent_and_restorable():
+    service = SeedService(CAMPAIGN)
+    encounters = [service.rng_for_system("encounters").next_float() for _ in range(5)]
+
+    other = SeedService(CAMPAIGN)
+    other.rng_for_system("loot").next_u32()
+    other.rng_for_realm(3).next_u32()
+    assert [other.rng_for_system("encounters").next_float() for _ in range(5)] == encounters
+
+    snapshot = service.snapshot_state()
+    expected = [service.rng_for_system("encounters").next_u32() for _ in range(4)]
+    restored = SeedService()
+    restored.restore_state(snapshot)
+    assert restored.campaign_seed == CAMPAIGN
+    assert [restored.rng_for_system("encounters").next_u32() for _ in range(4)] == expected
@@ -0,0 +1,94 @@
+"""Sobol and Morris sensitivity analysis over SimConfig parameters."""
+
+import json
+import sys
+
+import pytest
+
+from simulation.memo import SimCache
+from simulation.scripts import run_sensitivity as run_sensitivity_cli
+from simulation.sensitivity import morris_effects, sobol_indices
+from simulation.tuning import Param
+
+SPACE = [
+    Param("faith_initial", 40.0, 80.0),
+    Param("harmony_initial", 40.0, 70.0),
+    Param("ward_beads_charges", 0, 4, integer=True),
+]
+BASE = {"days": 20, "realm_tier": 2, "encounters_per_day": 3, "fear_per_encounter": 6.0}
+
+
+def test_sobol_design_size_and_dominant_knobs():
+    report = sobol_indices(SPACE, ["final_ase", "legacy_fragments"], samples=64, base=BASE)
+
+    assert report["runs"] == 64 * (len(SPACE) + 2)
+    ase = report["metrics"]["final_ase"]["indices"]
+    assert ase["faith_initial"]["total"] > 0.3 and ase["harmony_initial"]["total"] > 0.1
+    assert ase["ward_beads_charges"]["total"] < 0.05
+    assert all(0.0 <= entry["total"] <= 1.5 for entry in ase.values())
+    fragments = report["metrics"]["legacy_fragments"]
+    assert fragments["variance"] == 0.0
+    assert fragments["indices"]["faith_initial"] == {"first": None, "total": None}
+
+
+def test_morris_screens_out_inert_knobs():
+    report = morris_effects(SPACE, ["final_ase"], trajectories=8, levels=4, base=BASE)
+
+    assert report["runs"] == 8 * (len(SPACE) + 1)
+    effects = report["metrics"]["final_ase"]["indices"]
+    assert effects["faith_initial"]["mu_star"] > effects["ward_beads_charges"]["mu_star"]
+    assert effects["harmony_initial"]["mu"] > 0  # brighter harmony never costs Ase
+    assert morris_effects(SPACE, ["final_ase"], trajectories=8, base=BASE) == report
+
+
+def test_parallel_cached_runs_match_serial(tmp_path):
+    options = dict(space=SPACE, metrics=["final_ase"], samples=16, base=BASE, seeds=[1, 2], chunk_size=7)
+    serial = sobol_indices(**options)
+    cache = SimCache(tmp_path)
+    assert sobol_indices(workers=2, cache=cache, **options) == serial
+    assert cache.misses == serial["runs"] == 16 * 5 * 2
+    assert sobol_indices(cache=SimCache(tmp_path), **options)["metrics"] == serial["metrics"]
+
+
+def test_rejects_unknown_metrics_and_tiny_designs():
+    with pytest.raises(ValueError):
+        sobol_indices(SPACE, ["ase"], samples=8)
+    with pytest.raises(ValueError):
+        sobol_indices(SPACE, samples=1)
+    with pytest.raises(ValueError):
+        morris_effects([], trajectories=4)
+    with pytest.raises(ValueError, match="even"):
+        morris_effects(SPACE, trajectories=4, levels=3)
+
+
+def test_cli_reports_indices(tmp_path, monkeypatch, capsys):
+    out = tmp_path / "sensitivity.json"
+    monkeypatch.setattr(
+        sys,
+        "argv",
+        [
+            "run_sensitivity.py",
+            "--method",
+            "morris",
+            "--param",
+            "faith_initial=40:80",
+            "--param",
+            "ward_beads_charges=0:4:int",
+            "--metric",
+            "final_ase",
+            "--set",
+            "days=10",
+            "--trajectories",
+            "4",
+            "--workers",
+            "1",
+            "--out",
+            out.as_posix(),
+        ],
+    )
+    run_sensitivity_cli.main()
+
+    printed = json.loads(capsys.readouterr().out)
+    assert printed["method"] == "morris" and printed["runs"] == 12
+    assert set(printed["metrics"]["final_ase"]["indices"]) == {"faith_initial", "ward_beads_charges"}
+    assert json.loads(out.read_text(encoding="utf-8"))["metrics"] == printed["metrics"]
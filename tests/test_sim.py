@@ -5,7 +5,10 @@ import subprocess
 import sys
 from pathlib import Path
 
+import pytest
+
 from simulation import SimConfig, run_economy_sim
+from simulation.sim import SimState, initial_state, iter_days, iter_economy_sim, resume, step_days
 from simulation.scripts import run_sim
 
 
@@ -186,6 +189,46 @@ def test_script_executes_without_pythonpath_requirement():
     assert result.returncode == 0, result.stderr
 
 
+def test_package_import_defers_heavy_modules():
+    probe = (
+        "import sys, simulation, simulation.sim; "
+        "assert not {'simulation.batch', 'simulation.horizon', 'concurrent.futures'} & set(sys.modules); "
+        "assert simulation.run_economy_sim_batch.__module__ == 'simulation.batch'"
+    )
+    result = subprocess.run([sys.executable, "-c", probe], cwd=Path(__file__).resolve().parents[1], capture_output=True, text=True)
+
+    assert result.returncode == 0, result.stderr
+
+
+def test_cli_compact_summary_only(monkeypatch, capsys):
+    monkeypatch.setattr(sys, "argv", ["run_sim.py", "--days", "12", "--fear", "6", "--compact", "--summary_only"])
+    run_sim.main()
+    out = capsys.readouterr().out
+
+    assert out.count("\n") == 1 and ": " not in out
+    expected = run_economy_sim(SimConfig(days=12, fear_per_encounter=6.0), log_mode="summary")
+    assert json.loads(out) == json.loads(json.dumps(expected))
+
+
+@pytest.mark.parametrize(
+    "flags",
+    [
+        ["--profile", "--cache"],
+        ["--roster", "2", "--cache"],
+        ["--roster", "2", "--resume", "day-000001.json"],
+        ["--precision", "2"],
+        ["--event_log", "--summary_only"],
+        ["--roster", "0"],
+        ["--period", "0", "--long_horizon"],
+    ],
+)
+def test_cli_rejects_flags_that_would_be_ignored(flags, monkeypatch, capsys):
+    monkeypatch.setattr(sys, "argv", ["run_sim.py", "--days", "2"] + flags)
+    with pytest.raises(SystemExit):
+        run_sim.main()
+    assert "error" in capsys.readouterr().err
+
+
 def test_spike_guard_triggers_on_high_forecast():
     cfg = SimConfig(
         days=1,
@@ -250,3 +293,70 @@ def test_retirement_rite_unlocks_after_spike_guard_streak():
 
     assert retirements, "Expected the retirement rite to trigger"
     assert result["final"]["voluntary_retirements"] >= 1
+
+
+def test_summary_mode_matches_full_log_aggregates():
+    from simulation.scripts.aggregate_kpis import RunSummary
+
+    cfg = SimConfig(
+        days=30,
+        encounters_per_day=6,
+        fear_per_encounter=12.0,
+        spike_guard_threshold=75.0,
+        retirement_rite_min_streak=3,
+        faith_initial=45.0,
+    )
+    full = run_economy_sim(cfg)
+    summary = run_economy_sim(cfg, log_mode="summary")
+
+    assert "log" not in summary
+    assert summary["final"] == full["final"]
+    assert summary["config"] == full["config"]
+    assert RunSummary.from_payload("run", summary) == RunSummary.from_payload("run", full)
+
+
+def test_step_days_and_resume_match_a_single_run():
+    cfg = SimConfig(days=40, realm_tier=3, encounters_per_day=4, fear_per_encounter=7.0)
+    full = run_economy_sim(cfg)
+
+    state = initial_state(SimConfig(days=15, realm_tier=3, encounters_per_day=4, fear_per_encounter=7.0))
+    head = step_days(state, 10) + step_days(state, 5)
+    assert head == full["log"][:15]
+
+    # Round-trip the checkpoint through JSON, then extend the campaign to 40 days.
+    restored = SimState.from_dict(json.loads(json.dumps(state.to_dict())))
+    tail = resume(restored, cfg)
+    assert tail["resumed_from_day"] == 15
+    assert tail["log"] == full["log"][15:]
+    assert tail["final"] == full["final"]
+    assert restored.day == 15  # resume works on a copy
+
+
+def test_resume_branches_share_the_prefix():
+    base = SimConfig(days=30, fear_per_encounter=6.0)
+    state = initial_state(base)
+    step_days(state, 12)
+
+    branch_cfg = SimConfig(days=30, fear_per_encounter=6.0, courage_ritual_days=(20,))
+    branch = resume(state, branch_cfg)
+    direct = run_economy_sim(branch_cfg)
+    assert branch["log"] == direct["log"][12:]
+    assert branch["final"] == direct["final"]
+    assert resume(state, log_mode="summary")["final"] == run_economy_sim(base)["final"]
+
+
+def test_iter_economy_sim_streams_the_same_rows():
+    cfg = SimConfig(days=25, realm_tier=2, encounters_per_day=3)
+    assert list(iter_economy_sim(cfg)) == run_economy_sim(cfg)["log"]
+
+
+def test_iter_days_runs_open_ended_and_checkpoints_each_row():
+    cfg = SimConfig(days=10, fear_per_encounter=6.0)
+    state = initial_state(cfg)
+    rows = iter_days(state)
+    for _, row in zip(range(30), rows):
+        assert state.day == row["day"]
+
+    # Abandoning the stream leaves a state that resumes exactly where it stopped.
+    longer = SimConfig(days=50, fear_per_encounter=6.0)
+    assert resume(state, longer)["log"] == run_economy_sim(longer)["log"][30:]
@@ -0,0 +1,78 @@
+"""Tests for early-termination conditions and steady-state extrapolation."""
+
+import pytest
+
+from simulation import SimConfig, run_economy_sim
+from simulation.stopping import AseBelow, FirstLegacyFragment, SteadyState, parse_stop_condition
+from simulation.sweep import expand_grid, iter_shard_results, run_sweep
+
+COLLAPSING = dict(days=200, encounters_per_day=4, fear_per_encounter=7.0)
+CONVERGING = dict(days=2000, guardian_present=True, encounters_per_day=1)
+
+
+def test_first_legacy_fragment_stops_on_the_collapse_day():
+    full = run_economy_sim(SimConfig(**COLLAPSING))
+    first = next(row["day"] for row in full["log"] if row["legacy_fragments"])
+
+    result = run_economy_sim(SimConfig(**COLLAPSING), stop_when=[FirstLegacyFragment()])
+    assert result["stop"] == {"reason": "legacy_fragment", "day": first, "extrapolated": False}
+    assert result["log"] == full["log"][:first]
+    assert result["final"]["legacy_fragments"] == 1
+
+
+def test_ase_below_and_unfired_conditions_report_the_end():
+    cfg = SimConfig(days=30, realm_tier=14, faith_initial=10.0)
+    result = run_economy_sim(cfg, stop_when=[AseBelow(50.0)])
+    assert result["stop"] == {"reason": "ase_below", "day": 3, "extrapolated": False}
+    assert result["log"][-1]["ase"] < 50.0 <= result["log"][-2]["ase"]
+
+    ran_out = run_economy_sim(SimConfig(days=10), log_mode="summary", stop_when=[AseBelow(-1.0)])
+    assert ran_out["stop"] == {"reason": None, "day": 10, "extrapolated": False}
+    assert "stop" not in run_economy_sim(SimConfig(days=10))
+
+
+def test_steady_state_extrapolates_to_the_full_run():
+    cfg = SimConfig(**CONVERGING)
+    full = run_economy_sim(cfg, log_mode="summary")
+    result = run_economy_sim(cfg, log_mode="summary", stop_when=[SteadyState()])
+
+    assert result["stop"]["reason"] == "steady_state"
+    assert result["stop"]["extrapolated"]
+    assert result["stop"]["day"] < cfg.days // 2
+    assert result["summary"]["days"] == result["stop"]["day"]
+    assert result["final"] == pytest.approx(full["final"], abs=0.02)
+
+
+def test_steady_state_ignores_cycling_campaigns():
+    result = run_economy_sim(SimConfig(**COLLAPSING), stop_when=[SteadyState(days=20)])
+    assert result["stop"]["reason"] is None
+
+
+def test_specs_round_trip_and_reject_garbage():
+    for condition in (FirstLegacyFragment(), AseBelow(12.5), SteadyState(0.01, 14)):
+        assert parse_stop_condition(condition.to_spec()) == condition
+    assert parse_stop_condition("steady_state") == SteadyState()
+    for spec in ("ase_below", "ase_below=low", "collapse"):
+        with pytest.raises(ValueError):
+            parse_stop_condition(spec)
+
+
+def test_sweeps_carry_stop_conditions(tmp_path):
+    configs = expand_grid(COLLAPSING, None, range(4))
+    manifest = run_sweep(
+        configs, tmp_path, workers=2, chunk_size=2, output_format="simres", stop_when=[FirstLegacyFragment()]
+    )
+    assert manifest["stop_when"] == ["legacy_fragment"]
+    for payload in iter_shard_results(tmp_path):
+        assert payload["stop"]["reason"] == "legacy_fragment"
+        assert len(payload["log"]) == payload["stop"]["day"]
+
+
+def test_monitor_without_check_fails_at_creation():
+    from simulation.stopping import _Monitor
+
+    class Incomplete(_Monitor):
+        pass
+
+    with pytest.raises(TypeError):
+        Incomplete()
@@ -0,0 +1,92 @@
+"""Sweep expansion, sharding and CLI tests."""
+
+import json
+import sys
+
+import pytest
+
+from simulation import SimConfig, run_economy_sim
+from simulation.scripts import run_sweep as run_sweep_cli
+from simulation.sweep import expand_grid, iter_shard_results, load_spec, run_sweep
+
+
+def test_expand_grid_varies_seeds_fastest():
+    configs = expand_grid({"days": 3}, {"realm_tier": [1, 2]}, seeds=range(10, 13))
+
+    assert len(configs) == 6
+    assert [(c.realm_tier, c.campaign_seed) for c in configs[:4]] == [
+        (1, 10),
+        (1, 11),
+        (1, 12),
+        (2, 10),
+    ]
+    assert all(c.days == 3 for c in configs)
+
+
+def test_from_overrides_coerces_lists_and_rejects_unknown_fields():
+    cfg = SimConfig.from_overrides({"courage_ritual_days": [3, 9], "campaign_seed": "0x10"})
+    assert cfg.courage_ritual_days == (3, 9)
+    assert cfg.campaign_seed == 16
+
+    try:
+        SimConfig.from_overrides({"dayz": 3})
+    except ValueError as exc:
+        assert "dayz" in str(exc)
+    else:  # pragma: no cover - defensive
+        raise AssertionError("Expected unknown field to be rejected")
+
+
+def test_parallel_sweep_matches_serial_runs(tmp_path):
+    configs = expand_grid({"days": 5}, {"encounters_per_day": [2, 4]}, seeds=range(7))
+    manifest = run_sweep(configs, tmp_path, workers=2, chunk_size=3)
+
+    assert manifest["runs"] == 14
+    assert len(manifest["shards"]) == 5
+    results = list(iter_shard_results(tmp_path))
+    assert [r["run_id"] for r in results] == list(range(14))
+    for cfg, result in zip(configs, results):
+        result.pop("run_id")
+        assert result == json.loads(json.dumps(run_economy_sim(cfg)))
+
+
+def test_load_spec_supports_explicit_config_lists(tmp_path):
+    spec = tmp_path / "spec.json"
+    spec.write_text(json.dumps({"base": {"days": 4}, "configs": [{"realm_tier": 3}, {}]}))
+
+    configs = load_spec(spec)
+    assert [(c.days, c.realm_tier) for c in configs] == [(4, 3), (4, 1)]
+
+
+def test_cli_writes_manifest_and_summary(tmp_path, monkeypatch, capsys):
+    out_dir = tmp_path / "sweep"
+    monkeypatch.setattr(
+        sys,
+        "argv",
+        [
+            "run_sweep.py",
+            "--set",
+            "days=2",
+            "--grid",
+            "realm_tier=[1,2]",
+            "--seeds",
+            "0x10:3",
+            "--workers",
+            "1",
+            "--out",
+            str(out_dir),
+        ],
+    )
+
+    run_sweep_cli.main()
+    summary = json.loads(capsys.readouterr().out)
+
+    assert summary["runs"] == 6
+    assert (out_dir / "manifest.json").exists()
+
+
+@pytest.mark.parametrize("flags", [["--chunk_size", "0"], ["--chunk_size", "-4"], ["--workers", "0"]])
+def test_cli_rejects_non_positive_sizes(flags, tmp_path, monkeypatch, capsys):
+    monkeypatch.setattr(sys, "argv", ["run_sweep.py", "--set", "days=2", "--out", str(tmp_path)] + flags)
+    with pytest.raises(SystemExit):
+        run_sweep_cli.main()
+    assert "must be positive" in capsys.readouterr().err
@@ -0,0 +1,147 @@
+"""Guardrail tuning: samplers, scoring, successive halving, cache reuse and CLI."""
+
+import json
+import sys
+
+import pytest
+
+from simulation import SimConfig, run_economy_sim
+from simulation.memo import SimCache
+from simulation.scripts import run_tuning as run_tuning_cli
+from simulation.tuning import (
+    GUARDRAIL_SPACE,
+    METRICS,
+    Param,
+    Target,
+    Tuner,
+    latin_hypercube,
+    random_candidates,
+    tune,
+)
+
+BASE = {"days": 40, "realm_tier": 2, "encounters_per_day": 3, "fear_per_encounter": 6.0}
+SPACE = [Param("spike_guard_threshold", 80.0, 100.0), Param("ward_beads_charges", 0, 4, integer=True)]
+
+
+def test_latin_hypercube_uses_every_stratum_once():
+    candidates = latin_hypercube(SPACE, 5, seed=3)
+
+    strata = sorted(int((c["spike_guard_threshold"] - 80.0) / 20.0 * 5) for c in candidates)
+    assert strata == [0, 1, 2, 3, 4]
+    assert sorted(c["ward_beads_charges"] for c in candidates) == [0, 1, 2, 3, 4]
+    assert latin_hypercube(SPACE, 5, seed=3) == candidates != latin_hypercube(SPACE, 5, seed=4)
+    assert all(0 <= c["ward_beads_charges"] <= 4 for c in random_candidates(SPACE, 20, seed=1))
+
+
+def test_target_band_and_metric_validation():
+    band = Target("final_harmony", 55.0, 60.0)
+    assert (band.miss(50.0), band.miss(57.0), band.miss(61.5)) == (5.0, 0.0, 1.5)
+    with pytest.raises(ValueError):
+        Target("harmony")
+    with pytest.raises(ValueError):
+        Param("dayz", 0, 1)
+
+
+def test_evaluate_aggregates_per_run_metrics_over_seeds():
+    seeds = range(10, 13)
+    tuner = Tuner([Target("fear_max", None, 0.0, stat="max")], seeds=seeds, base=BASE)
+    (evaluation,) = tuner.evaluate([{"ward_beads_charges": 1}])
+
+    expected = max(
+        run_economy_sim(SimConfig.from_overrides({**BASE, "ward_beads_charges": 1, "campaign_seed": seed}), log_mode="summary")[
+            "summary"
+        ]["fear_max"]
+        for seed in seeds
+    )
+    assert evaluation.metrics == {"fear_max.max": round(expected, 4)}
+    assert evaluation.loss == round(expected**2, 6)
+    assert tuner.runs == 3
+    tuner.evaluate([{"ward_beads_charges": 1}], seeds=2)
+    assert tuner.runs == 3
+
+
+def test_halving_reuses_runs_and_agrees_with_full_search():
+    options = dict(candidates=8, sample_seed=5, seeds=range(100, 109), base=BASE, workers=1)
+    full = tune(SPACE, strategy="full", **options)
+    halving = tune(SPACE, strategy="halving", min_seeds=1, eta=3, **options)
+
+    assert full["runs"] == 9 * 9
+    assert halving["runs"] < full["runs"]
+    assert len(halving["leaderboard"]) == len(full["leaderboard"]) == 9
+    assert halving["best"]["seeds"] == 9
+    full_losses = {json.dumps(e["overrides"], sort_keys=True): e["loss"] for e in full["leaderboard"]}
+    assert halving["best"]["loss"] == full_losses[json.dumps(halving["best"]["overrides"], sort_keys=True)]
+    assert full["baseline"]["overrides"] == {"spike_guard_threshold": 90.0, "ward_beads_charges": 2}
+
+
+def test_parallel_workers_and_cache_match_serial(tmp_path):
+    options = dict(candidates=4, strategy="full", seeds=range(3), base=BASE, chunk_size=2)
+    serial = tune(SPACE, **options, workers=1)
+
+    cache = SimCache(tmp_path)
+    parallel = tune(SPACE, **options, workers=2, cache=cache)
+    assert parallel["leaderboard"] == serial["leaderboard"]
+    assert cache.misses == parallel["runs"] == 15
+
+    warm = SimCache(tmp_path)
+    again = tune(SPACE, **options, workers=1, cache=warm)
+    assert again["leaderboard"] == serial["leaderboard"]
+    assert again["runs"] == 0 and warm.hits == 15
+
+
+def test_halving_rungs_share_one_process_pool(monkeypatch):
+    import concurrent.futures
+
+    started = []
+
+    class CountingPool(concurrent.futures.ProcessPoolExecutor):
+        def __init__(self, *args, **kwargs):
+            started.append(1)
+            super().__init__(*args, **kwargs)
+
+    monkeypatch.setattr(concurrent.futures, "ProcessPoolExecutor", CountingPool)
+    report = tune(SPACE, candidates=8, seeds=range(9), base=BASE, workers=2, chunk_size=2, min_seeds=1, eta=3)
+
+    assert report["runs"] > 9 and len(started) == 1
+
+
+def test_default_space_and_metrics_cover_summary_payload():
+    payload = run_economy_sim(SimConfig(days=5), log_mode="summary")
+    assert all(isinstance(metric(payload), (int, float)) for metric in METRICS.values())
+    assert len(latin_hypercube(GUARDRAIL_SPACE, 3)) == 3
+
+
+def test_cli_prints_report_and_writes_file(tmp_path, monkeypatch, capsys):
+    out = tmp_path / "tuning.json"
+    monkeypatch.setattr(
+        sys,
+        "argv",
+        [
+            "run_tuning.py",
+            "--param",
+            "ward_beads_charges=0:3:int",
+            "--target",
+            "fear_max.max=:80:2",
+            "--set",
+            "days=20",
+            "--seeds",
+            "5:4",
+            "--candidates",
+            "3",
+            "--workers",
+            "1",
+            "--top",
+            "2",
+            "--out",
+            out.as_posix(),
+        ],
+    )
+    run_tuning_cli.main()
+
+    printed = json.loads(capsys.readouterr().out)
+    report = json.loads(out.read_text(encoding="utf-8"))
+    assert len(printed["leaderboard"]) == 2 and len(report["leaderboard"]) == 4
+    assert report["targets"] == [
+        {"metric": "fear_max", "stat": "max", "low": None, "high": 80.0, "weight": 2.0, "scale": 1.0}
+    ]
+    assert report["seeds"] == 4 and report["strategy"] == "halving"